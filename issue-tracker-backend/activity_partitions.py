@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Activity Partition Script
+Maintains the monthly partitions of user_activities outside the API process:
+- creates the current month and the next ones
+- rolls up partitions past retention into user_activity_monthly, then
+  drops them (or detaches them with --detach)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.activity_partitions import ActivityPartitionService
+
+
+async def run_maintenance(args):
+    print("🔄 Maintaining user_activities partitions...")
+    async with AsyncSessionLocal() as session:
+        changes = await ActivityPartitionService.maintain(
+            session,
+            ahead=args.ahead,
+            keep_months=args.retention_months,
+            detach=args.detach,
+        )
+
+    if changes is None:
+        print("❌ Another maintenance run is in progress")
+        return 1
+    for name in changes["created"]:
+        print(f"✅ Created {name}")
+    for name in changes["expired"]:
+        print(f"🗑️  {'Detached' if args.detach else 'Dropped'} {name}")
+    if not changes["created"] and not changes["expired"]:
+        print("✅ Nothing to do")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain user_activities partitions")
+    parser.add_argument(
+        "--ahead",
+        type=int,
+        default=settings.ACTIVITY_PARTITIONS_AHEAD,
+        help="Months to create past the current one",
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.ACTIVITY_RETENTION_MONTHS,
+        help="Full months to keep before the current one (0 keeps everything)",
+    )
+    parser.add_argument(
+        "--detach",
+        action="store_true",
+        default=settings.ACTIVITY_RETENTION_DETACH,
+        help="Detach expired partitions into standalone tables instead of dropping",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run_maintenance(args)))
+
+
+if __name__ == "__main__":
+    main()
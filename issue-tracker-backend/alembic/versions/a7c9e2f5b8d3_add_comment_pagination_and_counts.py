@@ -0,0 +1,61 @@
+"""keyset index on comments and issues.comment_count
+
+Revision ID: a7c9e2f5b8d3
+Revises: f6b8d4e1a9c5
+Create Date: 2026-10-19 19:22:47.905163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c9e2f5b8d3'
+down_revision: Union[str, Sequence[str], None] = 'f6b8d4e1a9c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Covers lookups by issue_id as well, so the single-column index goes
+    op.create_index('ix_comments_issue_created_id', 'comments', ['issue_id', 'created_at', 'id'], unique=False)
+    op.drop_index(op.f('ix_comments_issue_id'), table_name='comments')
+
+    op.add_column('issues', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute("""
+        UPDATE issues SET comment_count = counts.total
+        FROM (SELECT issue_id, count(*) AS total FROM comments GROUP BY issue_id) AS counts
+        WHERE issues.id = counts.issue_id
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION count_issue_comments() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE issues SET comment_count = comment_count + 1 WHERE id = NEW.issue_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE issues SET comment_count = comment_count - 1 WHERE id = OLD.issue_id;
+            ELSIF NEW.issue_id IS DISTINCT FROM OLD.issue_id THEN
+                UPDATE issues SET comment_count = comment_count - 1 WHERE id = OLD.issue_id;
+                UPDATE issues SET comment_count = comment_count + 1 WHERE id = NEW.issue_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_count
+        AFTER INSERT OR DELETE OR UPDATE OF issue_id ON comments
+        FOR EACH ROW EXECUTE FUNCTION count_issue_comments()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS comments_count ON comments")
+    op.execute("DROP FUNCTION IF EXISTS count_issue_comments()")
+    op.drop_column('issues', 'comment_count')
+    op.create_index(op.f('ix_comments_issue_id'), 'comments', ['issue_id'], unique=False)
+    op.drop_index('ix_comments_issue_created_id', table_name='comments')
@@ -0,0 +1,137 @@
+"""partition user_activities by month and add user_activity_monthly
+
+Revision ID: b8d1f3a6c4e7
+Revises: a7c9e2f5b8d3
+Create Date: 2026-10-19 20:31:08.442917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d1f3a6c4e7'
+down_revision: Union[str, Sequence[str], None] = 'a7c9e2f5b8d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created past the current one; the maintenance worker keeps this up
+PARTITIONS_AHEAD = 3
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # An existing table can't be turned into a partitioned one in place:
+    # build the new table next to it, copy, then drop the old one. The id
+    # sequence is kept so ids carry on where they were.
+    op.execute("ALTER TABLE user_activities RENAME TO user_activities_legacy")
+    op.execute("ALTER SEQUENCE user_activities_id_seq OWNED BY NONE")
+    op.execute("""
+        CREATE TABLE user_activities (
+            id integer NOT NULL DEFAULT nextval('user_activities_id_seq'),
+            user_id integer NOT NULL REFERENCES users (id),
+            activity_type activity_type NOT NULL,
+            description varchar NOT NULL,
+            details json,
+            ip_address varchar,
+            user_agent varchar,
+            created_at timestamptz NOT NULL DEFAULT now()
+        ) PARTITION BY RANGE (created_at)
+    """)
+    # No DEFAULT partition: it would stop the planner from reading the
+    # partitions newest-first for ORDER BY created_at DESC LIMIT n
+    op.execute("""
+        CREATE FUNCTION create_user_activity_partition(month date) RETURNS text AS $$
+        DECLARE
+            start date := date_trunc('month', month)::date;
+            partition_name text := format('user_activities_p%s', to_char(start, 'YYYY_MM'));
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF user_activities '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                start::timestamp AT TIME ZONE 'UTC',
+                (start + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        SELECT create_user_activity_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', coalesce(
+                (SELECT min(created_at) FROM user_activities_legacy), now()
+            ) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{PARTITIONS_AHEAD} months',
+            interval '1 month'
+        ) AS month
+    """)
+    op.execute("""
+        INSERT INTO user_activities
+            (id, user_id, activity_type, description, details,
+             ip_address, user_agent, created_at)
+        SELECT id, user_id, activity_type, description, details,
+               ip_address, user_agent, coalesce(created_at, now())
+        FROM user_activities_legacy
+    """)
+    op.execute("DROP TABLE user_activities_legacy")
+    op.execute("ALTER SEQUENCE user_activities_id_seq OWNED BY user_activities.id")
+
+    # Created on the parent, so every partition (present and future) gets them
+    op.create_primary_key('user_activities_pkey', 'user_activities', ['id', 'created_at'])
+    op.create_index('ix_user_activities_created_at', 'user_activities', ['created_at'], unique=False)
+    op.create_index('ix_user_activities_user_created', 'user_activities', ['user_id', 'created_at'], unique=False)
+    op.execute("""
+        CREATE TRIGGER user_activities_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON user_activities
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version()
+    """)
+
+    op.create_table('user_activity_monthly',
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('activity_type', postgresql.ENUM(name='activity_type', create_type=False), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('month', 'user_id', 'activity_type')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_activity_monthly')
+
+    op.execute("ALTER TABLE user_activities RENAME TO user_activities_partitioned")
+    op.execute("ALTER SEQUENCE user_activities_id_seq OWNED BY NONE")
+    op.execute("""
+        CREATE TABLE user_activities (
+            id integer NOT NULL DEFAULT nextval('user_activities_id_seq'),
+            user_id integer NOT NULL REFERENCES users (id),
+            activity_type activity_type NOT NULL,
+            description varchar NOT NULL,
+            details json,
+            ip_address varchar,
+            user_agent varchar,
+            created_at timestamptz DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO user_activities
+        SELECT id, user_id, activity_type, description, details,
+               ip_address, user_agent, created_at
+        FROM user_activities_partitioned
+    """)
+    # Drops every attached partition with it; detached archives are left
+    op.execute("DROP TABLE user_activities_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS create_user_activity_partition(date)")
+    op.execute("ALTER SEQUENCE user_activities_id_seq OWNED BY user_activities.id")
+    op.create_primary_key('user_activities_pkey', 'user_activities', ['id'])
+    op.create_index(op.f('ix_user_activities_id'), 'user_activities', ['id'], unique=False)
+    op.execute("""
+        CREATE TRIGGER user_activities_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON user_activities
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version()
+    """)
@@ -0,0 +1,66 @@
+"""add entity_versions table and change triggers
+
+Revision ID: c3e8a1f5b6d2
+Revises: b7d2f4a8c1e3
+Create Date: 2026-10-19 11:24:41.208316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a1f5b6d2'
+down_revision: Union[str, Sequence[str], None] = 'b7d2f4a8c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = [
+    'issues',
+    'issue_tags',
+    'tags',
+    'users',
+    'comments',
+    'user_activities',
+    'permissions',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('entity_versions',
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('entity')
+    )
+    op.execute("""
+        CREATE FUNCTION bump_entity_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO entity_versions (entity, version, changed_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (entity) DO UPDATE
+            SET version = entity_versions.version + 1, changed_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in VERSIONED_TABLES:
+        op.execute(
+            f"INSERT INTO entity_versions (entity, version) VALUES ('{table}', 0)"
+        )
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_entity_version()")
+    op.drop_table('entity_versions')
@@ -0,0 +1,39 @@
+"""keyset indexes for the activity feed
+
+Revision ID: c9e4a2b7d5f1
+Revises: b8d1f3a6c4e7
+Create Date: 2026-10-19 21:14:36.508723
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e4a2b7d5f1'
+down_revision: Union[str, Sequence[str], None] = 'b8d1f3a6c4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (created_at, id) ends every index so activityFeed's ORDER BY and
+    # cursor are both served by the index; they supersede the
+    # created_at-only ones
+    op.create_index('ix_user_activities_created_id', 'user_activities', ['created_at', 'id'], unique=False)
+    op.create_index('ix_user_activities_user_created_id', 'user_activities', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_user_activities_type_created_id', 'user_activities', ['activity_type', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_user_activities_created_at', table_name='user_activities')
+    op.drop_index('ix_user_activities_user_created', table_name='user_activities')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_user_activities_user_created', 'user_activities', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_user_activities_created_at', 'user_activities', ['created_at'], unique=False)
+    op.drop_index('ix_user_activities_type_created_id', table_name='user_activities')
+    op.drop_index('ix_user_activities_user_created_id', table_name='user_activities')
+    op.drop_index('ix_user_activities_created_id', table_name='user_activities')
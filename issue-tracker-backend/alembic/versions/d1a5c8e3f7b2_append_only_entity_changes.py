@@ -0,0 +1,64 @@
+"""record table changes in an append-only entity_changes log
+
+Revision ID: d1a5c8e3f7b2
+Revises: c9e4a2b7d5f1
+Create Date: 2026-10-20 09:12:05.631870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a5c8e3f7b2'
+down_revision: Union[str, Sequence[str], None] = 'c9e4a2b7d5f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One row per (table, writing transaction). Keys never collide across
+    # transactions, so writers no longer queue on a shared row per table;
+    # entity_versions becomes the base that folded rows are added into.
+    op.create_table('entity_changes',
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('txid', sa.BigInteger(), server_default=sa.text('txid_current()'), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('entity', 'txid')
+    )
+    # Same trigger name and signature, so every existing trigger picks it up
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_entity_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO entity_changes (entity) VALUES (TG_TABLE_NAME)
+            ON CONFLICT (entity, txid) DO NOTHING;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_entity_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO entity_versions (entity, version, changed_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (entity) DO UPDATE
+            SET version = entity_versions.version + 1, changed_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        INSERT INTO entity_versions (entity, version, changed_at)
+        SELECT entity, count(*), max(changed_at) FROM entity_changes GROUP BY entity
+        ON CONFLICT (entity) DO UPDATE
+        SET version = entity_versions.version + EXCLUDED.version,
+            changed_at = EXCLUDED.changed_at
+    """)
+    op.drop_table('entity_changes')
@@ -0,0 +1,110 @@
+"""add issue_status_transitions table, triggers and backfill
+
+Revision ID: d4f2b9e7a3c1
+Revises: c3e8a1f5b6d2
+Create Date: 2026-10-19 15:02:17.640533
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f2b9e7a3c1'
+down_revision: Union[str, Sequence[str], None] = 'c3e8a1f5b6d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    issue_status = postgresql.ENUM(name='issue_status', create_type=False)
+    op.create_table('issue_status_transitions',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('issue_id', sa.Integer(), nullable=False),
+    sa.Column('from_status', issue_status, nullable=True),
+    sa.Column('to_status', issue_status, nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['issue_id'], ['issues.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Backfill: only the current status is known, so assume every issue was
+    # opened at created_at and, if it has moved on, reached its current
+    # status at updated_at. Indexes are built afterwards.
+    op.execute("""
+        INSERT INTO issue_status_transitions (issue_id, from_status, to_status, changed_at)
+        SELECT id, NULL, CASE WHEN status <> 'OPEN' AND updated_at > created_at
+                              THEN 'OPEN'::issue_status ELSE status END,
+               created_at
+        FROM issues
+    """)
+    op.execute("""
+        INSERT INTO issue_status_transitions (issue_id, from_status, to_status, changed_at)
+        SELECT id, 'OPEN', status, updated_at
+        FROM issues
+        WHERE status <> 'OPEN' AND updated_at > created_at
+    """)
+
+    op.create_index('ix_issue_status_transitions_issue_changed', 'issue_status_transitions', ['issue_id', 'changed_at'], unique=False)
+    op.create_index('ix_issue_status_transitions_to_status_changed', 'issue_status_transitions', ['to_status', 'changed_at'], unique=False)
+    op.create_index('ix_issue_status_transitions_changed_at', 'issue_status_transitions', ['changed_at'], unique=False)
+
+    # Recorded by the same statement that changes the status, whichever
+    # code path (GraphQL, bulk mutations, imports) issued it. Inserts follow
+    # the backfill rule so imported history looks like backfilled history.
+    op.execute("""
+        CREATE FUNCTION record_issue_status_transition() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                INSERT INTO issue_status_transitions (issue_id, from_status, to_status, changed_at)
+                VALUES (NEW.id, OLD.status, NEW.status, now());
+            ELSIF NEW.status <> 'OPEN' AND NEW.updated_at > NEW.created_at THEN
+                INSERT INTO issue_status_transitions (issue_id, from_status, to_status, changed_at)
+                VALUES (NEW.id, NULL, 'OPEN', NEW.created_at),
+                       (NEW.id, 'OPEN', NEW.status, NEW.updated_at);
+            ELSE
+                INSERT INTO issue_status_transitions (issue_id, from_status, to_status, changed_at)
+                VALUES (NEW.id, NULL, NEW.status, COALESCE(NEW.created_at, now()));
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_status_inserted
+        AFTER INSERT ON issues
+        FOR EACH ROW EXECUTE FUNCTION record_issue_status_transition()
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_status_changed
+        AFTER UPDATE OF status ON issues
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION record_issue_status_transition()
+    """)
+
+    # Versioned like the other tables so reports get ETags / cache tags
+    op.execute(
+        "INSERT INTO entity_versions (entity, version) VALUES ('issue_status_transitions', 0)"
+    )
+    op.execute("""
+        CREATE TRIGGER issue_status_transitions_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON issue_status_transitions
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS issue_status_transitions_bump_version ON issue_status_transitions")
+    op.execute("DELETE FROM entity_versions WHERE entity = 'issue_status_transitions'")
+    op.execute("DROP TRIGGER IF EXISTS issues_status_changed ON issues")
+    op.execute("DROP TRIGGER IF EXISTS issues_status_inserted ON issues")
+    op.execute("DROP FUNCTION IF EXISTS record_issue_status_transition()")
+    op.drop_index('ix_issue_status_transitions_changed_at', table_name='issue_status_transitions')
+    op.drop_index('ix_issue_status_transitions_to_status_changed', table_name='issue_status_transitions')
+    op.drop_index('ix_issue_status_transitions_issue_changed', table_name='issue_status_transitions')
+    op.drop_table('issue_status_transitions')
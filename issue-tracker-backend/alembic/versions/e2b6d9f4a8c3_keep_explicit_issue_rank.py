@@ -0,0 +1,60 @@
+"""keep the rank moveIssue writes when it also changes status
+
+Revision ID: e2b6d9f4a8c3
+Revises: d1a5c8e3f7b2
+Create Date: 2026-10-20 09:48:27.190452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6d9f4a8c3'
+down_revision: Union[str, Sequence[str], None] = 'd1a5c8e3f7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Comparing NEW.rank with OLD.rank can't tell "rank not set" from "set to
+    # the same whole number" (rank_between(2, 4) is 3), so an explicit rank
+    # is flagged per issue with a transaction-local setting instead
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_issue_rank() RETURNS trigger AS $$
+        BEGIN
+            IF (TG_OP = 'INSERT' AND NEW.rank IS NULL)
+               OR (TG_OP = 'UPDATE'
+                   AND NEW.status IS DISTINCT FROM OLD.status
+                   AND coalesce(current_setting('app.explicit_rank_id', true), '')
+                       <> NEW.id::text) THEN
+                NEW.rank := coalesce(
+                    (SELECT floor(max(rank)) FROM issues WHERE status = NEW.status), 0
+                ) + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_issue_rank() RETURNS trigger AS $$
+        BEGIN
+            IF (TG_OP = 'INSERT' AND NEW.rank IS NULL)
+               OR (TG_OP = 'UPDATE'
+                   AND NEW.status IS DISTINCT FROM OLD.status
+                   AND NEW.rank IS NOT DISTINCT FROM OLD.rank) THEN
+                NEW.rank := coalesce(
+                    (SELECT floor(max(rank)) FROM issues WHERE status = NEW.status), 0
+                ) + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
@@ -0,0 +1,55 @@
+"""add issue_daily_rollups and rollup_state tables
+
+Revision ID: e5a7c3d9b2f4
+Revises: d4f2b9e7a3c1
+Create Date: 2026-10-19 16:40:52.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3d9b2f4'
+down_revision: Union[str, Sequence[str], None] = 'd4f2b9e7a3c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Primary key order serves reportSeries: metric + dimension + day range
+    op.create_table('issue_daily_rollups',
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('value', sa.String(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('metric', 'dimension', 'day', 'value')
+    )
+    # No row here means "never built": the rollup worker backfills on start
+    op.create_table('rollup_state',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('last_transition_id', sa.BigInteger(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('rebuilt_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(
+        "INSERT INTO entity_versions (entity, version) VALUES ('issue_daily_rollups', 0)"
+    )
+    op.execute("""
+        CREATE TRIGGER issue_daily_rollups_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON issue_daily_rollups
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_entity_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS issue_daily_rollups_bump_version ON issue_daily_rollups")
+    op.execute("DELETE FROM entity_versions WHERE entity = 'issue_daily_rollups'")
+    op.drop_table('rollup_state')
+    op.drop_table('issue_daily_rollups')
@@ -0,0 +1,38 @@
+"""flag status transitions once they are applied to the rollups
+
+Revision ID: f3c7a9d2e5b1
+Revises: e2b6d9f4a8c3
+Create Date: 2026-10-20 11:26:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7a9d2e5b1'
+down_revision: Union[str, Sequence[str], None] = 'e2b6d9f4a8c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # An id watermark skips rows that a slower transaction commits below it;
+    # a per-row flag picks them up whenever they become visible
+    op.add_column('issue_status_transitions', sa.Column('rolled_up', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+    op.execute("""
+        UPDATE issue_status_transitions SET rolled_up = true
+        WHERE id <= (
+            SELECT last_transition_id FROM rollup_state WHERE name = 'issue_daily'
+        )
+    """)
+    op.create_index('ix_issue_status_transitions_pending', 'issue_status_transitions', ['id'], unique=False, postgresql_where=sa.text('NOT rolled_up'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_status_transitions_pending', table_name='issue_status_transitions', postgresql_where=sa.text('NOT rolled_up'))
+    op.drop_column('issue_status_transitions', 'rolled_up')
@@ -0,0 +1,67 @@
+"""add issues.rank for board ordering
+
+Revision ID: f6b8d4e1a9c5
+Revises: e5a7c3d9b2f4
+Create Date: 2026-10-19 18:05:31.402716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b8d4e1a9c5'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c3d9b2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('issues', sa.Column('rank', sa.Numeric(), nullable=True))
+    # Existing cards: oldest first within each column, whole-number ranks
+    op.execute("""
+        UPDATE issues SET rank = ranked.position
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY status ORDER BY created_at, id
+            ) AS position
+            FROM issues
+        ) AS ranked
+        WHERE issues.id = ranked.id
+    """)
+    op.alter_column('issues', 'rank', nullable=False)
+    op.create_index('ix_issues_status_rank', 'issues', ['status', 'rank', 'id'], unique=False)
+
+    # New issues (including COPY imports) and status changes that don't set
+    # a rank go to the end of their column; max() is one index probe
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_issue_rank() RETURNS trigger AS $$
+        BEGIN
+            IF (TG_OP = 'INSERT' AND NEW.rank IS NULL)
+               OR (TG_OP = 'UPDATE'
+                   AND NEW.status IS DISTINCT FROM OLD.status
+                   AND NEW.rank IS NOT DISTINCT FROM OLD.rank) THEN
+                NEW.rank := coalesce(
+                    (SELECT floor(max(rank)) FROM issues WHERE status = NEW.status), 0
+                ) + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_set_rank
+        BEFORE INSERT OR UPDATE OF status ON issues
+        FOR EACH ROW EXECUTE FUNCTION set_issue_rank()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS issues_set_rank ON issues")
+    op.execute("DROP FUNCTION IF EXISTS set_issue_rank()")
+    op.drop_index('ix_issues_status_rank', table_name='issues')
+    op.drop_column('issues', 'rank')
@@ -1,14 +1,67 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Per engine, per worker: pool_size + max_overflow concurrent queries
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 300
+    # Read replicas for queries and reports; empty keeps everything on primary
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_CHECK_INTERVAL: float = 5.0
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     GOOGLE_API_KEY: str
     CORS_ORIGINS: List[str] = ["http://localhost:5173"]
+    WS_REPLAY_BUFFER_SIZE: int = 500
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL: float = 1.0
+    OUTBOX_RETENTION_HOURS: int = 24
+    APQ_CACHE_SIZE: int = 1000
+    # Apollo persisted query manifest; when set only listed operations run
+    APQ_ALLOWLIST_PATH: Optional[str] = None
+    GRAPHQL_MAX_DEPTH: int = 10
+    GRAPHQL_COST_BUDGETS: Dict[str, int] = {
+        "ANONYMOUS": 100,
+        "VIEWER": 2000,
+        "MEMBER": 5000,
+        "MANAGER": 10000,
+        "ADMIN": 20000,
+    }
+    # @defer / @stream over multipart/mixed. Off by default: it needs the
+    # graphql-core 3.3 pre-release from req-incremental.txt
+    GRAPHQL_INCREMENTAL_DELIVERY: bool = False
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_SIZE: int = 500
+    # Entries are checked against entity_versions on every hit; the TTL
+    # only bounds how long unused ones take up space
+    RESPONSE_CACHE_TTL: int = 60
+    # How often entity_changes rows are folded into entity_versions
+    ENTITY_VERSION_FOLD_INTERVAL: float = 5.0
+    # e.g. redis://localhost:6379/0 to share the cache between workers
+    RESPONSE_CACHE_URL: Optional[str] = None
+    COMPRESSION_PATHS: List[str] = ["/graphql", "/export"]
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # Daily report rollups: incremental refresh, then a nightly full rebuild
+    ROLLUP_REFRESH_INTERVAL: float = 60.0
+    ROLLUP_REBUILD_HOUR_UTC: int = 3
+    # user_activities monthly partitions: created ahead, and past retention
+    # rolled up into user_activity_monthly, then dropped. Retention is
+    # opt-in: 0 keeps the full audit history
+    ACTIVITY_PARTITIONS_AHEAD: int = 3
+    ACTIVITY_RETENTION_MONTHS: int = 0
+    # Detach expired partitions into standalone tables instead of dropping
+    ACTIVITY_RETENTION_DETACH: bool = False
+    ACTIVITY_MAINTENANCE_INTERVAL: float = 3600.0
+    # permessage-deflate on /ws and the GraphQL subscription socket
+    WS_PER_MESSAGE_DEFLATE: bool = True
 
     class Config:
         env_file = ".env"
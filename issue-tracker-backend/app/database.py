@@ -1,20 +1,116 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
+from app.utils.serialization import dumps
 
-DATABASE_URL = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
-
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_reset_on_return="commit",
-)
+logger = logging.getLogger(__name__)
+
+
+def _async_url(url: str) -> str:
+    return url.replace("postgresql://", "postgresql+asyncpg://")
+
+
+DATABASE_URL = _async_url(settings.DATABASE_URL)
+
+
+class PoolStats:
+    """Checkout wait times and timeouts for one engine's pool"""
+
+    def __init__(self, name: str, window: int = 1000):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: deque = deque(maxlen=window)
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self._recent.append(wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self._recent)
+        p95 = recent[int(len(recent) * 0.95) - 1] if recent else 0.0
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": (
+                round(self.total_wait / self.checkouts * 1000, 3)
+                if self.checkouts
+                else 0.0
+            ),
+            "wait_p95_ms": round(p95 * 1000, 3),
+            "wait_max_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that times how long each checkout waits for a connection"""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.record(time.perf_counter() - started)
+
+
+def create_engine(url: str, name: str) -> AsyncEngine:
+    # A subclass per engine keeps its stats across pool.recreate()
+    pool_class = type(
+        f"{name.title()}Pool", (InstrumentedPool,), {"stats": PoolStats(name)}
+    )
+    return create_async_engine(
+        _async_url(url),
+        echo=True,
+        future=True,
+        poolclass=pool_class,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_reset_on_return="commit",
+        json_serializer=dumps,
+    )
+
+
+def pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.pool
+    capacity = pool.size() + pool._max_overflow
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": checked_out,
+        "idle": pool.checkedin(),
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+        **pool.stats.snapshot(),
+    }
+
+
+engine = create_engine(settings.DATABASE_URL, "primary")
+replica_engines = [
+    create_engine(url, f"replica{n}")
+    for n, url in enumerate(settings.DATABASE_REPLICA_URLS, start=1)
+]
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -24,7 +120,198 @@ AsyncSessionLocal = sessionmaker(
     autocommit=False,
 )
 
+# Replay delay on a standby; 0 when it has applied everything it received
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+# Echoed back by clients with the time of their last write (see ClientWrites)
+LAST_WRITE_HEADER = "x-last-write"
+
+
+class ClientWrites:
+    """When the client behind the current request last wrote.
+
+    ``last_write`` is the server time the client sent back in
+    ``X-Last-Write``; ``wrote_at`` is set if this request writes, and is
+    returned to the client in the same header. ``primary_only`` keeps the
+    rest of the request off the replicas; ``read_replica`` records whether
+    any of its reads went to one.
+    """
+
+    def __init__(self, last_write: Optional[float] = None):
+        self.last_write = last_write
+        self.wrote_at: Optional[float] = None
+        self.primary_only = False
+        self.read_replica = False
+
+    @classmethod
+    def from_header(cls, value: Optional[str]) -> "ClientWrites":
+        try:
+            return cls(float(value)) if value else cls()
+        except ValueError:
+            return cls()
+
+    def recent(self, window: float) -> bool:
+        return self.last_write is not None and time.time() - self.last_write < window
+
+
+# Set per HTTP request by ReadYourWritesMiddleware; None in background work
+client_writes: ContextVar[Optional[ClientWrites]] = ContextVar(
+    "client_writes", default=None
+)
+
+
+class ReplicaRouter:
+    """Picks the engine for read-only work.
+
+    Replicas are used round-robin while their measured replay lag is within
+    ``max_lag``; otherwise reads go to the primary. So that clients read
+    their own writes, a client that wrote less than ``max_lag`` seconds ago
+    (see ``ClientWrites``) is also sent to the primary; other clients keep
+    using the replicas.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: List[AsyncEngine],
+        max_lag: float = settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval: float = settings.REPLICA_CHECK_INTERVAL,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag: Dict[str, Optional[float]] = {
+            replica.pool.stats.name: None for replica in replicas
+        }
+        self._cycle = itertools.cycle(replicas)
+        self._task: Optional[asyncio.Task] = None
+
+    def note_write(self) -> None:
+        """Record that the current request wrote to the primary"""
+        writes = client_writes.get()
+        if writes is not None:
+            writes.wrote_at = writes.last_write = time.time()
+
+    def healthy(self, replica: AsyncEngine) -> bool:
+        lag = self.lag[replica.pool.stats.name]
+        return lag is not None and lag <= self.max_lag
+
+    def pick(self) -> AsyncEngine:
+        if not self.replicas:
+            return self.primary
+        writes = client_writes.get()
+        if writes is not None and (writes.primary_only or writes.recent(self.max_lag)):
+            return self.primary
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if self.healthy(replica):
+                if writes is not None:
+                    writes.read_replica = True
+                return replica
+        return self.primary
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    async def check(self) -> None:
+        for replica in self.replicas:
+            name = replica.pool.stats.name
+            try:
+                async with replica.connect() as conn:
+                    lag = (await conn.execute(REPLICA_LAG_SQL)).scalar()
+                self.lag[name] = float(lag) if lag is not None else 0.0
+            except Exception as e:
+                # Unreachable until the next successful check
+                self.lag[name] = None
+                logger.error(f"Replica {name} lag check failed: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "primary": pool_status(self.primary),
+            "replicas": {
+                replica.pool.stats.name: dict(
+                    pool_status(replica),
+                    lag_seconds=self.lag[replica.pool.stats.name],
+                    healthy=self.healthy(replica),
+                )
+                for replica in self.replicas
+            },
+        }
+
+
+replica_router = ReplicaRouter(engine, replica_engines)
+
+
+def ReadSessionLocal() -> AsyncSession:
+    """Session for read-only work, on a replica when one is fresh enough"""
+    return AsyncSessionLocal(bind=replica_router.pick())
+
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+class LazySession:
+    """Stand-in for an AsyncSession that only opens one on first use.
+
+    Attribute access is forwarded to the real session. ``close`` returns its
+    connection to the pool; a later use simply starts a new session.
+    """
+
+    def __init__(self, factory=AsyncSessionLocal):
+        self._default_factory = factory
+        self._factory = factory
+        self._session = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def read_only(self) -> None:
+        """Route to a replica, unless a session is already open"""
+        if self._session is None:
+            self._factory = ReadSessionLocal
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        self._factory = self._default_factory
+        if session is not None:
+            await session.close()
+
+
+async def get_lazy_db():
+    session = LazySession()
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -1,10 +1,10 @@
 import strawberry
-from strawberry.fastapi import GraphQLRouter
+from strawberry.schema.config import StrawberryConfig
 from strawberry.types import Info
-from typing import List, Optional
+from typing import Annotated, Dict, List, Optional
 from app.graphql.types import IssueType, IssueStatus, IssuePriority
-from datetime import datetime
-from app.database import get_db
+from datetime import date, datetime
+from app.database import LazySession, get_lazy_db
 from app.models.issue import Issue as IssueModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, Request, WebSocket
@@ -21,65 +21,85 @@ from app.graphql.types import (
     UserUpdateInput,
 )
 from app.models.team_member import TeamMember as TeamMemberModel
-from sqlalchemy import insert
 from app.services.ai import AIDescriptionEnhancer
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL
 import asyncio
 from sqlalchemy.future import select
 from app.schemas.user import UserRead
 from app.database import AsyncSessionLocal
-from sqlalchemy import func
 from app.graphql.types import IssueUpdateResponse
 from app.services.auth import hash_password
-from app.services.websocket import websocket_manager, EventType
+from app.services.websocket import EventType
 from app.services.user_activity import UserActivityService
+from app.services.user_activity import MAX_FEED_PAGE_SIZE
+from app.services.user_activity import decode_position as decode_activity_position
 from app.services.permissions import PermissionService
+from app.services.analytics import IssueAnalyticsService, report_range
 from app.models.user_activity import ActivityType
 from app.models.user import UserRole, UserStatus
 from app.models.permission import PermissionType
 from app.models.user_activity import UserActivity
 from app.models.permission import Permission
-from app.graphql.types import UserActivityType, UserStatsType
+from app.graphql.types import UserActivityType, UserStatsType, ActivityFeedType
 from app.graphql.types import IssueStatsType
-from app.models.comment import Comment as CommentModel
-from app.graphql.types import CommentType, CommentCreateInput
+from app.graphql.types import (
+    DurationStatsType,
+    FlowReportType,
+    StatusDurationType,
+    ThroughputPointType,
+)
+from app.graphql.types import ReportSeriesType, SeriesPointType, SeriesType
+from app.graphql.types import StatsDeltaType
+from app.graphql.types import BoardColumnType
+from app.services.board import MAX_CARDS_PER_COLUMN, BoardService, decode_position
+from app.utils.cursor import encode_cursor
+from app.services.rollups import (
+    ReportBucket,
+    ReportGroupBy,
+    ReportMetric,
+    RollupService,
+    series_range,
+)
+from app.graphql.types import CommentType, CommentCreateInput, CommentPageType
 from app.graphql.types import TagCreateInput, TagUpdateInput
-from sqlalchemy.orm import selectinload
-
-
-class SimplePubSub:
-    def __init__(self):
-        self.queues = {}
-
-    def get_queue(self, topic):
-        if topic not in self.queues:
-            self.queues[topic] = []
-        return self.queues[topic]
-
-    async def publish(self, topic, message):
-        queues = self.get_queue(topic)
-        for queue in queues:
-            await queue.put(message)
-
-    async def subscribe(self, topic):
-        queue = asyncio.Queue()
-        self.get_queue(topic).append(queue)
-        try:
-            while True:
-                message = await queue.get()
-                yield message
-        finally:
-            self.get_queue(topic).remove(queue)
-
-
-pubsub = SimplePubSub()
+from app.graphql.types import (
+    BulkIssuePatchInput,
+    BulkIssueUpdateResponse,
+    BulkIssueDeleteResponse,
+)
+from app.models.issue import issue_tags
+from app.services.pubsub import pubsub
+from app.services.outbox import OutboxService, outbox_relay, issue_event_payload
+from app.services.outbox import comment_event_payload
+from app.services.comments import MAX_COMMENTS_PER_PAGE, CommentService
+from app.services.comments import decode_position as decode_comment_position
+from app.graphql.persisted_queries import PersistedQueryExtension
+from app.graphql.projection import from_row, project, requested_fields
+from app.graphql.query_cost import QueryCostExtension
+from app.graphql.router import GraphQLCachingRouter
+from app.graphql.sessions import SessionReleaseExtension
+from app.graphql.caching import ResponseCacheExtension
+from strawberry.extensions import QueryDepthLimiter
+from app.config import settings
+from app.services.writes import (
+    USER_AUDITED_COLUMNS,
+    IssueWriteService,
+    ReferencedRow,
+    TagWriteService,
+    UniqueViolation,
+    UserWriteService,
+)
 
 ai_enhancer = AIDescriptionEnhancer()
 
 
 async def get_context_dependency(
-    request: Request = None, ws: WebSocket = None, db: AsyncSession = Depends(get_db)
+    request: Request = None,
+    ws: WebSocket = None,
+    db: LazySession = Depends(get_lazy_db),
 ):
+    # The session only checks out a connection once a resolver uses it, so
+    # health checks, AI-only mutations and idle subscriptions hold none
     user = None
     if request:
         auth_header = request.headers.get("authorization")
@@ -88,10 +108,12 @@ async def get_context_dependency(
             payload = decode_access_token(token)
             user_id = payload.get("sub") if payload else None
             if user_id:
-                result = await db.execute(
-                    select(UserModel).where(UserModel.id == int(user_id))
-                )
-                user = result.scalar_one_or_none()
+                # Short-lived session so the lookup doesn't pin a connection
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(
+                        select(UserModel).where(UserModel.id == int(user_id))
+                    )
+                    user = result.scalar_one_or_none()
     return {"request": request, "db": db, "user": user}
 
 
@@ -102,6 +124,104 @@ def get_current_user(info):
     return user
 
 
+def issue_type_from_row(row, tags: List[TagType]) -> IssueType:
+    return IssueType(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        enhanced_description=row.enhanced_description,
+        status=row.status,
+        priority=row.priority,
+        assignee_id=row.assignee_id,
+        reporter_id=row.reporter_id,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        tags=tags,
+        comment_count=row.comment_count,
+    )
+
+
+def comment_type_from_row(row) -> CommentType:
+    return CommentType(
+        id=row.id,
+        issueId=row.issue_id,
+        userId=row.user_id,
+        content=row.content,
+        createdAt=row.created_at,
+    )
+
+
+def user_type_from_row(row) -> UserType:
+    # Issue counts are left to the batched resolver
+    return UserType(
+        id=row.id,
+        email=row.email,
+        username=row.username,
+        first_name=row.first_name,
+        last_name=row.last_name,
+        role=row.role,
+        status=row.status,
+        last_login=row.last_login,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        recent_activity=None,
+    )
+
+
+async def load_issue_tags(
+    db: AsyncSession, issue_ids: List[int]
+) -> Dict[int, List[TagType]]:
+    """Tags for many issues in a single query"""
+    result = await db.execute(
+        select(issue_tags.c.issue_id, TagModel.id, TagModel.name, TagModel.color)
+        .join(TagModel, TagModel.id == issue_tags.c.tag_id)
+        .where(issue_tags.c.issue_id.in_(issue_ids))
+    )
+    tags_by_issue = {issue_id: [] for issue_id in issue_ids}
+    for row in result:
+        tags_by_issue[row.issue_id].append(
+            TagType(id=row.id, name=row.name, color=row.color)
+        )
+    return tags_by_issue
+
+
+def board_column(
+    status: IssueStatus,
+    rows: List,
+    limit: int,
+    total_count: Optional[int],
+    tags_by_issue: Dict[int, List[TagType]],
+) -> BoardColumnType:
+    # One row past the page was fetched to tell whether more follow
+    page = rows[:limit]
+    return BoardColumnType(
+        status=status,
+        total_count=total_count or 0,
+        cards=[
+            from_row(IssueType, row, tags=tags_by_issue.get(row.id, [])) for row in page
+        ],
+        end_cursor=encode_cursor(page[-1].rank, page[-1].id) if page else None,
+        has_more=len(rows) > limit,
+    )
+
+
+async def refuse_unowned(
+    db: AsyncSession, ids: List[int], written_ids: List[int], action: str
+) -> None:
+    """After a bulk write scoped to the caller's issues: 403 if any requested
+    id was skipped because someone else owns it; missing ids are ignored"""
+    skipped = set(ids) - set(written_ids)
+    if not skipped:
+        return
+    forbidden = await IssueWriteService.existing(db, list(skipped))
+    if forbidden:
+        await db.rollback()
+        raise HTTPException(
+            status_code=403,
+            detail=f"Not allowed to {action} issues: {sorted(forbidden)}",
+        )
+
+
 @strawberry.type
 class Query:
     @strawberry.field
@@ -111,87 +231,102 @@ class Query:
     @strawberry.field
     async def issues(self, info) -> List[IssueType]:
         db: AsyncSession = info.context["db"]
+        # Only the selected columns; large text stays in Postgres unless asked for
+        requested = requested_fields(info)
         result = await db.execute(
-            select(IssueModel).options(selectinload(IssueModel.tags))
+            select(*project(IssueModel.__table__, requested)).order_by(IssueModel.id)
         )
-        issues = result.unique().scalars().all()
+        rows = result.fetchall()
+        tags_by_issue = {}
+        if "tags" in requested and rows:
+            tags_by_issue = await load_issue_tags(db, [row.id for row in rows])
         return [
-            IssueType(
-                id=issue.id,
-                title=issue.title,
-                description=issue.description,
-                enhanced_description=getattr(issue, "enhanced_description", None),
-                status=issue.status,
-                priority=issue.priority,
-                assignee_id=issue.assignee_id,
-                reporter_id=issue.reporter_id,
-                created_at=issue.created_at,
-                updated_at=issue.updated_at,
-                tags=(
-                    [
-                        TagType(id=tag.id, name=tag.name, color=tag.color)
-                        for tag in issue.tags
-                    ]
-                    if issue.tags
-                    else []
-                ),
-            )
-            for issue in issues
+            from_row(IssueType, row, tags=tags_by_issue.get(row.id, [])) for row in rows
         ]
 
     @strawberry.field
     async def issue(self, info, id: int) -> IssueType | None:
         db: AsyncSession = info.context["db"]
+        requested = requested_fields(info)
         result = await db.execute(
-            IssueModel.__table__.select().where(IssueModel.id == id)
+            select(*project(IssueModel.__table__, requested)).where(IssueModel.id == id)
         )
         row = result.first()
         if not row:
             return None
-        row = row[0] if isinstance(row, tuple) else row
-        return IssueType(
-            id=row.id,
-            title=row.title,
-            description=row.description,
-            enhanced_description=row.enhanced_description,
-            status=row.status,
-            priority=row.priority,
-            assignee_id=row.assignee_id,
-            reporter_id=row.reporter_id,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
+        tags = []
+        if "tags" in requested:
+            tags = (await load_issue_tags(db, [row.id]))[row.id]
+        return from_row(IssueType, row, tags=tags)
+
+    @strawberry.field
+    async def board(
+        self,
+        info,
+        columns: Optional[List[IssueStatus]] = None,
+        per_column: int = 20,
+    ) -> List[BoardColumnType]:
+        """First cards of each status column in board order (default: all)"""
+        db: AsyncSession = info.context["db"]
+        statuses = list(dict.fromkeys(columns or IssueStatus))
+        limit = min(max(per_column, 0), MAX_CARDS_PER_COLUMN)
+        requested = requested_fields(info)
+        card_fields = requested_fields(info, ("cards",))
+        selected = project(
+            IssueModel.__table__, card_fields, always=("id", "status", "rank")
+        )
+        cards = await BoardService.columns(db, statuses, selected, limit)
+        counts = {}
+        if "totalCount" in requested:
+            counts = await BoardService.counts(db, statuses)
+        tags_by_issue = {}
+        card_ids = [row.id for rows in cards.values() for row in rows[:limit]]
+        if "tags" in card_fields and card_ids:
+            tags_by_issue = await load_issue_tags(db, card_ids)
+        return [
+            board_column(
+                status, cards[status], limit, counts.get(status), tags_by_issue
+            )
+            for status in statuses
+        ]
+
+    @strawberry.field
+    async def board_column(
+        self,
+        info,
+        status: IssueStatus,
+        first: int = 20,
+        after: Optional[str] = None,
+    ) -> BoardColumnType:
+        """Next cards of one column, after a cursor from ``board``"""
+        db: AsyncSession = info.context["db"]
+        limit = min(max(first, 0), MAX_CARDS_PER_COLUMN)
+        try:
+            position = decode_position(after) if after else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        card_fields = requested_fields(info, ("cards",))
+        selected = project(
+            IssueModel.__table__, card_fields, always=("id", "status", "rank")
         )
+        rows = await BoardService.column(db, status, selected, limit, position)
+        total_count = None
+        if "totalCount" in requested_fields(info):
+            total_count = (await BoardService.counts(db, [status]))[status]
+        tags_by_issue = {}
+        if "tags" in card_fields and rows:
+            tags_by_issue = await load_issue_tags(db, [row.id for row in rows[:limit]])
+        return board_column(status, rows, limit, total_count, tags_by_issue)
 
     @strawberry.field
     async def users(self, info) -> List[UserType]:
         db: AsyncSession = info.context["db"]
-        result = await db.execute(UserModel.__table__.select())
-        users = result.fetchall()
-
-        user_types = []
-        for row in users:
-            # Get user stats
-            user_stats = await UserActivityService.get_user_stats(db, row.id)
-
-            user_types.append(
-                UserType(
-                    id=row.id,
-                    email=row.email,
-                    username=row.username,
-                    first_name=row.first_name,
-                    last_name=row.last_name,
-                    role=row.role,
-                    status=row.status,
-                    last_login=row.last_login,
-                    created_at=row.created_at,
-                    updated_at=row.updated_at,
-                    assigned_issues_count=user_stats["assigned_issues_count"],
-                    reported_issues_count=user_stats["reported_issues_count"],
-                    recent_activity=None,  # Will be populated separately if needed
-                )
-            )
+        # Dropdowns ask for id + username only; never read password hashes here
+        columns = project(UserModel.__table__, requested_fields(info))
+        result = await db.execute(select(*columns).order_by(UserModel.id))
 
-        return user_types
+        # Issue counts are batch-loaded only when selected (and can be deferred)
+        return [from_row(UserType, row) for row in result.fetchall()]
 
     @strawberry.field
     async def user_activities(
@@ -215,6 +350,42 @@ class Query:
             for activity in activities
         ]
 
+    @strawberry.field
+    async def activity_feed(
+        self,
+        info,
+        first: int = 20,
+        after: Optional[str] = None,
+        user_ids: Optional[List[int]] = None,
+        types: Optional[List[ActivityType]] = None,
+        from_: Annotated[Optional[datetime], strawberry.argument(name="from")] = None,
+        to: Optional[datetime] = None,
+    ) -> ActivityFeedType:
+        """Activities in [from, to), newest first, ``first`` at a time"""
+        db: AsyncSession = info.context["db"]
+        limit = min(max(first, 0), MAX_FEED_PAGE_SIZE)
+        columns = project(
+            UserActivity.__table__,
+            requested_fields(info, ("activities",)),
+            always=("id", "created_at"),
+        )
+        try:
+            position = decode_activity_position(after) if after else None
+            rows, has_more = await UserActivityService.feed(
+                db, columns, limit, position, user_ids, types, from_, to
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return ActivityFeedType(
+            activities=[from_row(UserActivityType, row) for row in rows],
+            end_cursor=(
+                encode_cursor(rows[-1].created_at.isoformat(), rows[-1].id)
+                if rows
+                else None
+            ),
+            has_more=has_more,
+        )
+
     @strawberry.field
     async def user_stats(self, info) -> UserStatsType:
         db: AsyncSession = info.context["db"]
@@ -297,6 +468,72 @@ class Query:
             recent_activity=[],
         )
 
+    @strawberry.field
+    async def flow_report(
+        self,
+        info,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> FlowReportType:
+        """Lead / cycle time, time in status and throughput (default: 90 days)"""
+        db: AsyncSession = info.context["db"]
+        start, end = report_range(start, end)
+        requested = requested_fields(info)
+        report = FlowReportType(start=start, end=end)
+        if requested & {"leadTime", "cycleTime"}:
+            times = await IssueAnalyticsService.lead_and_cycle_time(db, start, end)
+            report.lead_time = DurationStatsType(**times["lead_time"])
+            report.cycle_time = DurationStatsType(**times["cycle_time"])
+        if "timeInStatus" in requested:
+            report.time_in_status = [
+                StatusDurationType(
+                    status=stay.pop("status"), stats=DurationStatsType(**stay)
+                )
+                for stay in await IssueAnalyticsService.time_in_status(db, start, end)
+            ]
+        if "weeklyThroughput" in requested:
+            report.weekly_throughput = [
+                ThroughputPointType(**point)
+                for point in await IssueAnalyticsService.weekly_throughput(
+                    db, start, end
+                )
+            ]
+        return report
+
+    @strawberry.field
+    async def report_series(
+        self,
+        info,
+        metric: ReportMetric,
+        group_by: ReportGroupBy = ReportGroupBy.NONE,
+        from_: Annotated[Optional[date], strawberry.argument(name="from")] = None,
+        to: Optional[date] = None,
+        bucket: ReportBucket = ReportBucket.DAY,
+    ) -> ReportSeriesType:
+        """Time series from the daily rollups (inclusive range, default: 90 days)"""
+        db: AsyncSession = info.context["db"]
+        start, end = series_range(from_, to)
+        series = await RollupService.series(db, metric, group_by, start, end, bucket)
+        labels = await RollupService.labels(db, group_by, list(series))
+        return ReportSeriesType(
+            metric=metric,
+            group_by=group_by,
+            bucket=bucket,
+            start=start,
+            end=end,
+            series=[
+                SeriesType(
+                    key=key,
+                    label=labels.get(key, key),
+                    points=[
+                        SeriesPointType(bucket_start=bucket_start, value=value)
+                        for bucket_start, value in points
+                    ],
+                )
+                for key, points in series.items()
+            ],
+        )
+
     @strawberry.field
     async def me(self, info) -> Optional[UserType]:
         db: AsyncSession = info.context["db"]
@@ -330,30 +567,31 @@ class Query:
             last_login=user.last_login,
             created_at=user.created_at,
             updated_at=user.updated_at,
-            assigned_issues_count=user_stats["assigned_issues_count"],
-            reported_issues_count=user_stats["reported_issues_count"],
+            issue_counts=user_stats,
             recent_activity=None,
         )
 
     @strawberry.field
-    async def comments(self, info, issue_id: int) -> List[CommentType]:
+    async def comments(
+        self, info, issue_id: int, last: int = 20, before: Optional[str] = None
+    ) -> CommentPageType:
+        """The newest ``last`` comments, or those older than ``before``"""
         db: AsyncSession = info.context["db"]
-        result = await db.execute(
-            CommentModel.__table__.select()
-            .where(CommentModel.issue_id == issue_id)
-            .order_by(CommentModel.created_at.asc())
+        last = min(max(last, 0), MAX_COMMENTS_PER_PAGE)
+        try:
+            position = decode_comment_position(before) if before else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        rows, has_older = await CommentService.page(db, issue_id, last, position)
+        return CommentPageType(
+            comments=[comment_type_from_row(row) for row in rows],
+            has_older=has_older,
+            older_cursor=(
+                encode_cursor(rows[0].created_at.isoformat(), rows[0].id)
+                if rows
+                else None
+            ),
         )
-        rows = result.fetchall()
-        return [
-            CommentType(
-                id=row.id,
-                issueId=row.issue_id,
-                userId=row.user_id,
-                content=row.content,
-                createdAt=row.created_at,
-            )
-            for row in rows
-        ]
 
 
 @strawberry.type
@@ -368,6 +606,22 @@ class Subscription:
         async for issue in pubsub.subscribe("issue_updated"):
             yield issue
 
+    @strawberry.subscription
+    async def issues_batch_updated(self, info) -> List[IssueType]:
+        async for issues in pubsub.subscribe("issues_batch_updated"):
+            yield issues
+
+    @strawberry.subscription
+    async def comment_added(self, info, issue_id: int) -> CommentType:
+        async for comment in pubsub.subscribe(f"comment_added_{issue_id}"):
+            yield comment
+
+    @strawberry.subscription
+    async def stats_changed(self, info) -> StatsDeltaType:
+        """Issue counter deltas (total, per status / priority) after each write"""
+        async for delta in pubsub.subscribe("stats_changed"):
+            yield delta
+
     @strawberry.subscription
     async def issue_status_changed(self, info, issue_id: int) -> IssueType:
         async for issue in pubsub.subscribe(f"issue_status_changed_{issue_id}"):
@@ -384,42 +638,38 @@ class Mutation:
     @strawberry.mutation
     async def create_tag(self, info, input: TagCreateInput) -> TagType:
         db: AsyncSession = info.context["db"]
-        tag = TagModel(name=input.name, color=input.color)
-        db.add(tag)
+        try:
+            tag = await TagWriteService.create(db, input.name, input.color)
+        except UniqueViolation:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="Tag name already taken")
         await db.commit()
-        await db.refresh(tag)
         return TagType(id=tag.id, name=tag.name, color=tag.color)
 
     @strawberry.mutation
     async def update_tag(self, info, input: TagUpdateInput) -> TagType:
         db: AsyncSession = info.context["db"]
-        result = await db.execute(
-            TagModel.__table__.select().where(TagModel.id == input.id)
-        )
-        tag = result.first()
-        if not tag:
-            raise HTTPException(status_code=404, detail="Tag not found")
-        tag = tag[0] if isinstance(tag, tuple) else tag
+        values = {}
         if input.name is not None:
-            tag.name = input.name
+            values["name"] = input.name
         if input.color is not None:
-            tag.color = input.color
-        db.add(tag)
+            values["color"] = input.color
+        try:
+            tag = await TagWriteService.update(db, input.id, values)
+        except UniqueViolation:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="Tag name already taken")
+        if not tag:
+            raise HTTPException(status_code=404, detail="Tag not found")
         await db.commit()
-        await db.refresh(tag)
         return TagType(id=tag.id, name=tag.name, color=tag.color)
 
     @strawberry.mutation
     async def delete_tag(self, info, id: int) -> bool:
         db: AsyncSession = info.context["db"]
-        result = await db.execute(TagModel.__table__.select().where(TagModel.id == id))
-        tag = result.first()
-        if not tag:
-            return False
-        tag = tag[0] if isinstance(tag, tuple) else tag
-        await db.delete(tag)
+        deleted = await TagWriteService.delete(db, id)
         await db.commit()
-        return True
+        return deleted
 
     @strawberry.mutation
     async def create_issue(self, info, input: IssueCreateInput) -> IssueType:
@@ -450,7 +700,7 @@ class Mutation:
             tag_objs = tags_result.scalars().all()
             new_issue.tags = tag_objs
         db.add(new_issue)
-        await db.commit()
+        await db.flush()
         await db.refresh(new_issue)
         issue_obj = IssueType(
             id=new_issue.id,
@@ -463,22 +713,20 @@ class Mutation:
             reporter_id=new_issue.reporter_id,
             created_at=new_issue.created_at,
             updated_at=new_issue.updated_at,
+            tags=[
+                TagType(id=tag.id, name=tag.name, color=tag.color)
+                for tag in new_issue.tags
+            ],
         )
-        await pubsub.publish("issue_created", issue_obj)
-        await websocket_manager.broadcast_to_all(
-            EventType.ISSUE_CREATED,
-            {
-                "id": issue_obj.id,
-                "title": issue_obj.title,
-                "description": issue_obj.description,
-                "status": issue_obj.status,
-                "priority": issue_obj.priority,
-                "assignee_id": issue_obj.assignee_id,
-                "reporter_id": issue_obj.reporter_id,
-                "created_at": issue_obj.created_at.isoformat(),
-                "updated_at": issue_obj.updated_at.isoformat(),
-            },
+        # Event is committed with the issue and fanned out by the outbox relay
+        OutboxService.add_event(
+            db, EventType.ISSUE_CREATED, issue_event_payload(issue_obj)
+        )
+        OutboxService.add_stats_delta(
+            db, [(None, {"status": new_issue.status, "priority": new_issue.priority})]
         )
+        await db.commit()
+        outbox_relay.notify()
         return issue_obj
 
     @strawberry.mutation
@@ -486,22 +734,7 @@ class Mutation:
         self, input: IssueUpdateInput, info: Info
     ) -> IssueUpdateResponse:
         db = info.context["db"]
-        # Permission check: only reporter can edit
-        result = await db.execute(
-            select(IssueModel)
-            .options(selectinload(IssueModel.tags))
-            .where(IssueModel.id == input.id)
-        )
-        issue = result.unique().scalar_one_or_none()
-        if not issue:
-            return IssueUpdateResponse(
-                success=False, message="Issue not found", issue=None
-            )
         user = get_current_user(info)
-        if issue.reporter_id != user.id:
-            raise HTTPException(
-                status_code=403, detail="Not allowed to edit this issue"
-            )
         try:
             update_data = {}
             if input.title is not None:
@@ -517,71 +750,43 @@ class Mutation:
                 update_data["priority"] = input.priority.value
             if input.assignee_id is not None:
                 update_data["assignee_id"] = input.assignee_id
-            update_data["updated_at"] = func.now()
-            await db.execute(
-                update(IssueModel)
-                .where(IssueModel.id == input.id)
-                .values(**update_data)
-            )
-            # Fetch the updated issue with tags using selectinload
-            result = await db.execute(
-                select(IssueModel)
-                .options(selectinload(IssueModel.tags))
-                .where(IssueModel.id == input.id)
-            )
-            updated_issue = result.unique().scalars().one_or_none()
-            if not updated_issue:
-                return IssueUpdateResponse(
-                    success=False, message="Issue not found", issue=None
+            # Only the reporter can edit: ownership is part of the UPDATE itself
+            updated = await IssueWriteService.update(db, input.id, user.id, update_data)
+            if not updated:
+                reporter_id = await IssueWriteService.reporter_of(db, input.id)
+                if reporter_id is None:
+                    return IssueUpdateResponse(
+                        success=False, message="Issue not found", issue=None
+                    )
+                raise HTTPException(
+                    status_code=403, detail="Not allowed to edit this issue"
                 )
-            # Update tags if provided
+            row, previous = updated
             if input.tag_ids is not None:
-                tags_result = await db.execute(
-                    select(TagModel).where(TagModel.id.in_(input.tag_ids))
+                tag_rows = await IssueWriteService.replace_tags(
+                    db, input.id, input.tag_ids
                 )
-                tag_objs = tags_result.scalars().all()
-                updated_issue.tags = tag_objs
-                db.add(updated_issue)
-            await db.commit()
-            issue_obj = IssueType(
-                id=updated_issue.id,
-                title=updated_issue.title,
-                description=updated_issue.description,
-                enhanced_description=updated_issue.enhanced_description,
-                status=updated_issue.status,
-                priority=updated_issue.priority,
-                assignee_id=updated_issue.assignee_id,
-                reporter_id=updated_issue.reporter_id,
-                created_at=updated_issue.created_at,
-                updated_at=updated_issue.updated_at,
-                tags=(
-                    [
-                        TagType(id=tag.id, name=tag.name, color=tag.color)
-                        for tag in updated_issue.tags
-                    ]
-                    if updated_issue.tags
-                    else []
-                ),
+            else:
+                tag_rows = await IssueWriteService.tags_of(db, input.id)
+            issue_obj = issue_type_from_row(
+                row,
+                [
+                    TagType(id=tag.id, name=tag.name, color=tag.color)
+                    for tag in tag_rows
+                ],
             )
-            # Publish to pubsub for GraphQL subscriptions
-            await pubsub.publish("issue_updated", issue_obj)
-            await websocket_manager.broadcast_to_all(
-                EventType.ISSUE_UPDATED,
-                {
-                    "id": issue_obj.id,
-                    "title": issue_obj.title,
-                    "description": issue_obj.description,
-                    "status": issue_obj.status,
-                    "priority": issue_obj.priority,
-                    "assignee_id": issue_obj.assignee_id,
-                    "reporter_id": issue_obj.reporter_id,
-                    "created_at": issue_obj.created_at.isoformat(),
-                    "updated_at": issue_obj.updated_at.isoformat(),
-                },
+            OutboxService.add_event(
+                db, EventType.ISSUE_UPDATED, issue_event_payload(issue_obj)
             )
+            OutboxService.add_stats_delta(db, [(previous, row._mapping)])
+            await db.commit()
+            outbox_relay.notify()
             return IssueUpdateResponse(
                 success=True, message="Issue updated successfully", issue=issue_obj
             )
+        except HTTPException:
+            await db.rollback()
+            raise
         except Exception as e:
             await db.rollback()
             return IssueUpdateResponse(
@@ -589,53 +794,178 @@ class Mutation:
             )
 
     @strawberry.mutation
-    async def delete_issue(self, info, id: int) -> IssueType | None:
+    async def move_issue(
+        self,
+        info,
+        id: int,
+        status: IssueStatus,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> IssueType:
+        """Place a card in ``status`` between ``afterId`` (above) and
+        ``beforeId`` (below); only the moved issue's row is written"""
         user = get_current_user(info)
         db: AsyncSession = info.context["db"]
-        result = await db.execute(
-            IssueModel.__table__.select().where(IssueModel.id == id)
+        try:
+            rank = await BoardService.rank_for_move(db, id, status, before_id, after_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        await BoardService.keep_rank(db, id)
+        updated = await IssueWriteService.update(
+            db, id, user.id, {"status": status.value, "rank": rank}
         )
-        row = result.first()
+        if not updated:
+            if await IssueWriteService.reporter_of(db, id) is None:
+                raise HTTPException(status_code=404, detail="Issue not found")
+            raise HTTPException(
+                status_code=403, detail="Not allowed to edit this issue"
+            )
+        row, previous = updated
+        tag_rows = await IssueWriteService.tags_of(db, id)
+        issue_obj = issue_type_from_row(
+            row,
+            [TagType(id=tag.id, name=tag.name, color=tag.color) for tag in tag_rows],
+        )
+        OutboxService.add_event(
+            db, EventType.ISSUE_UPDATED, issue_event_payload(issue_obj)
+        )
+        OutboxService.add_stats_delta(db, [(previous, row._mapping)])
+        await db.commit()
+        outbox_relay.notify()
+        return issue_obj
+
+    @strawberry.mutation
+    async def delete_issue(self, info, id: int) -> IssueType | None:
+        user = get_current_user(info)
+        db: AsyncSession = info.context["db"]
+        row = await IssueWriteService.delete(db, id, user.id)
         if not row:
-            return None
-        row = row[0] if isinstance(row, tuple) else row
-        if row.reporter_id != user.id:
+            if await IssueWriteService.reporter_of(db, id) is None:
+                return None
             raise HTTPException(
                 status_code=403, detail="Not allowed to delete this issue"
             )
-        # Build IssueType before deleting
-        tags = getattr(row, "tags", [])
-        tag_objs = (
-            [TagType(id=tag.id, name=tag.name, color=tag.color) for tag in tags]
-            if tags
-            else []
-        )
-        deleted_issue = IssueType(
-            id=row.id,
-            title=row.title,
-            description=row.description,
-            enhanced_description=getattr(row, "enhanced_description", None),
-            status=row.status,
-            priority=row.priority,
-            assignee_id=row.assignee_id,
-            reporter_id=row.reporter_id,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            tags=tag_objs,
-        )
-        await db.execute(delete(IssueModel).where(IssueModel.id == id))
-        await db.commit()
-        # Broadcast real-time update
-        await websocket_manager.broadcast_to_all(
+        deleted_issue = issue_type_from_row(row, [])
+        OutboxService.add_event(
+            db,
             EventType.ISSUE_DELETED,
             {
                 "id": id,
                 "deleted_by": user.id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
             },
         )
+        OutboxService.add_stats_delta(db, [(row._mapping, None)])
+        await db.commit()
+        outbox_relay.notify()
         return deleted_issue
 
+    @strawberry.mutation
+    async def bulk_update_issues(
+        self, info, ids: List[int], patch: BulkIssuePatchInput
+    ) -> BulkIssueUpdateResponse:
+        user = get_current_user(info)
+        db: AsyncSession = info.context["db"]
+        ids = list(set(ids))
+        update_data = {}
+        if patch.status is not None:
+            update_data["status"] = patch.status
+        if patch.priority is not None:
+            update_data["priority"] = patch.priority
+        if patch.assignee_id is not None:
+            update_data["assignee_id"] = patch.assignee_id
+
+        # Ownership is part of the UPDATE itself, not a check before it
+        updated = await IssueWriteService.bulk_update(db, ids, user.id, update_data)
+        rows = [row for row, _ in updated]
+        await refuse_unowned(db, ids, [row.id for row in rows], "edit")
+        if not rows:
+            return BulkIssueUpdateResponse(success=False, message="No issues found")
+        tags_by_issue = await load_issue_tags(db, [row.id for row in rows])
+        issues = [issue_type_from_row(row, tags_by_issue[row.id]) for row in rows]
+
+        # One coalesced event for the whole batch
+        OutboxService.add_event(
+            db,
+            EventType.ISSUES_BATCH_UPDATED,
+            {"issues": [issue_event_payload(issue) for issue in issues]},
+        )
+        OutboxService.add_stats_delta(
+            db, [(previous, row._mapping) for row, previous in updated]
+        )
+        await db.commit()
+        outbox_relay.notify()
+        return BulkIssueUpdateResponse(
+            success=True,
+            message=f"Updated {len(issues)} of {len(ids)} issues",
+            issues=issues,
+        )
+
+    @strawberry.mutation
+    async def bulk_set_tags(
+        self, info, ids: List[int], tag_ids: List[int]
+    ) -> BulkIssueUpdateResponse:
+        user = get_current_user(info)
+        db: AsyncSession = info.context["db"]
+        ids = list(set(ids))
+        # Touch updated_at on the caller's issues first: the UPDATE checks
+        # ownership and locks them, so only those get their tags replaced
+        updated = await IssueWriteService.bulk_update(db, ids, user.id, {})
+        rows = [row for row, _ in updated]
+        await refuse_unowned(db, ids, [row.id for row in rows], "edit")
+        if not rows:
+            return BulkIssueUpdateResponse(success=False, message="No issues found")
+
+        tag_rows = await IssueWriteService.bulk_replace_tags(
+            db, [row.id for row in rows], tag_ids
+        )
+        tags = [TagType(id=tag.id, name=tag.name, color=tag.color) for tag in tag_rows]
+        issues = [issue_type_from_row(row, list(tags)) for row in rows]
+
+        OutboxService.add_event(
+            db,
+            EventType.ISSUES_BATCH_UPDATED,
+            {"issues": [issue_event_payload(issue) for issue in issues]},
+        )
+        OutboxService.add_stats_delta(
+            db, [(previous, row._mapping) for row, previous in updated]
+        )
+        await db.commit()
+        outbox_relay.notify()
+        return BulkIssueUpdateResponse(
+            success=True,
+            message=f"Set tags on {len(issues)} of {len(ids)} issues",
+            issues=issues,
+        )
+
+    @strawberry.mutation
+    async def bulk_delete_issues(self, info, ids: List[int]) -> BulkIssueDeleteResponse:
+        user = get_current_user(info)
+        db: AsyncSession = info.context["db"]
+        ids = list(set(ids))
+        deleted = await IssueWriteService.bulk_delete(db, ids, user.id)
+        deleted_ids = [row.id for row in deleted]
+        await refuse_unowned(db, ids, deleted_ids, "delete")
+        if not deleted:
+            return BulkIssueDeleteResponse(success=False, message="No issues found")
+        OutboxService.add_event(
+            db,
+            EventType.ISSUES_BATCH_DELETED,
+            {
+                "ids": deleted_ids,
+                "deleted_by": user.id,
+                "timestamp": datetime.now(),
+            },
+        )
+        OutboxService.add_stats_delta(db, [(row._mapping, None) for row in deleted])
+        await db.commit()
+        outbox_relay.notify()
+        return BulkIssueDeleteResponse(
+            success=True,
+            message=f"Deleted {len(deleted_ids)} of {len(ids)} issues",
+            deleted_ids=deleted_ids,
+        )
+
     @strawberry.mutation
     async def invite_team_member(self, info, input: InviteTeamMemberInput) -> bool:
         user = get_current_user(info)
@@ -735,8 +1065,7 @@ class Mutation:
             last_login=new_user.last_login,
             created_at=new_user.created_at,
             updated_at=new_user.updated_at,
-            assigned_issues_count=0,
-            reported_issues_count=0,
+            issue_counts={"assigned_issues_count": 0, "reported_issues_count": 0},
             recent_activity=None,
         )
 
@@ -744,98 +1073,43 @@ class Mutation:
     async def update_user(self, info, input: UserUpdateInput) -> UserType:
         db: AsyncSession = info.context["db"]
 
-        # Check if user exists
-        result = await db.execute(
-            UserModel.__table__.select().where(UserModel.id == input.id)
-        )
-        user = result.first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        user = user[0] if isinstance(user, tuple) else user
-
-        # Check if email is being changed and if it's already taken
-        if input.email and input.email != user.email:
-            email_check = await db.execute(
-                UserModel.__table__.select().where(UserModel.email == input.email)
-            )
-            if email_check.first():
-                raise HTTPException(status_code=400, detail="Email already taken")
+        update_data = {}
+        for column in USER_AUDITED_COLUMNS:
+            value = getattr(input, column)
+            if value is not None:
+                update_data[column] = value
 
-        # Check if username is being changed and if it's already taken
-        if input.username and input.username != user.username:
-            username_check = await db.execute(
-                UserModel.__table__.select().where(UserModel.username == input.username)
-            )
-            if username_check.first():
-                raise HTTPException(status_code=400, detail="Username already taken")
+        # Email / username clashes come back from the unique indexes
+        try:
+            updated = await UserWriteService.update(db, input.id, update_data)
+        except UniqueViolation as e:
+            await db.rollback()
+            field = {"email": "Email", "username": "Username"}.get(e.column, "Value")
+            raise HTTPException(status_code=400, detail=f"{field} already taken")
+        if not updated:
+            raise HTTPException(status_code=404, detail="User not found")
+        updated_user, previous = updated
 
         # Track changes for activity logging
         changes = {}
-        old_role = user.role
-        old_status = user.status
-
-        # Update user fields
-        update_data = {}
-        if input.email is not None:
-            update_data["email"] = input.email
-            changes["email"] = {"old": user.email, "new": input.email}
-        if input.username is not None:
-            update_data["username"] = input.username
-            changes["username"] = {"old": user.username, "new": input.username}
-        if input.first_name is not None:
-            update_data["first_name"] = input.first_name
-            changes["first_name"] = {"old": user.first_name, "new": input.first_name}
-        if input.last_name is not None:
-            update_data["last_name"] = input.last_name
-            changes["last_name"] = {"old": user.last_name, "new": input.last_name}
-        if input.role is not None:
-            update_data["role"] = input.role
-            changes["role"] = {"old": old_role.value, "new": input.role.value}
-        if input.status is not None:
-            update_data["status"] = input.status
-            changes["status"] = {"old": old_status.value, "new": input.status.value}
-
-        await db.execute(
-            update(UserModel).where(UserModel.id == input.id).values(**update_data)
-        )
-        await db.commit()
-
-        # Fetch updated user
-        result = await db.execute(
-            UserModel.__table__.select().where(UserModel.id == input.id)
-        )
-        updated_user = result.first()
-        updated_user = (
-            updated_user[0] if isinstance(updated_user, tuple) else updated_user
-        )
-
-        # Log the activity
-        await UserActivityService.log_activity(
+        for column, new in update_data.items():
+            old = previous[column]
+            changes[column] = {
+                "old": getattr(old, "value", old),
+                "new": getattr(new, "value", new),
+            }
+
+        # Logged in the same transaction as the update
+        UserActivityService.add_activity(
             db=db,
             user_id=updated_user.id,
             activity_type=ActivityType.USER_UPDATED,
             description=f"User {updated_user.email} was updated",
             details={"changes": changes},
         )
+        await db.commit()
 
-        # Get user stats
-        user_stats = await UserActivityService.get_user_stats(db, updated_user.id)
-
-        return UserType(
-            id=updated_user.id,
-            email=updated_user.email,
-            username=updated_user.username,
-            first_name=updated_user.first_name,
-            last_name=updated_user.last_name,
-            role=updated_user.role,
-            status=updated_user.status,
-            last_login=updated_user.last_login,
-            created_at=updated_user.created_at,
-            updated_at=datetime.now(),
-            assigned_issues_count=user_stats["assigned_issues_count"],
-            reported_issues_count=user_stats["reported_issues_count"],
-            recent_activity=None,
-        )
+        return user_type_from_row(updated_user)
 
     @strawberry.mutation
     async def update_user_role(self, info, user_id: int, role: UserRole) -> UserType:
@@ -850,35 +1124,22 @@ class Mutation:
                 status_code=403, detail="Insufficient permissions to change user roles"
             )
 
-        updated_user = await PermissionService.update_user_role(db, user_id, role)
+        updated = await UserWriteService.update(db, user_id, {"role": role})
+        if not updated:
+            raise HTTPException(status_code=404, detail="User not found")
+        updated_user, _ = updated
 
         # Log the activity
-        await UserActivityService.log_activity(
+        UserActivityService.add_activity(
             db=db,
             user_id=current_user.id,
             activity_type=ActivityType.ROLE_CHANGED,
             description=f"User {updated_user.email} role changed to {role.value}",
             details={"user_id": user_id, "new_role": role.value},
         )
+        await db.commit()
 
-        # Get user stats
-        user_stats = await UserActivityService.get_user_stats(db, updated_user.id)
-
-        return UserType(
-            id=updated_user.id,
-            email=updated_user.email,
-            username=updated_user.username,
-            first_name=updated_user.first_name,
-            last_name=updated_user.last_name,
-            role=updated_user.role,
-            status=updated_user.status,
-            last_login=updated_user.last_login,
-            created_at=updated_user.created_at,
-            updated_at=updated_user.updated_at,
-            assigned_issues_count=user_stats["assigned_issues_count"],
-            reported_issues_count=user_stats["reported_issues_count"],
-            recent_activity=None,
-        )
+        return user_type_from_row(updated_user)
 
     @strawberry.mutation
     async def initialize_permissions(self, info) -> bool:
@@ -890,51 +1151,32 @@ class Mutation:
     async def delete_user(self, info, id: int) -> bool:
         db: AsyncSession = info.context["db"]
 
-        # Check if user exists
-        result = await db.execute(
-            UserModel.__table__.select().where(UserModel.id == id)
-        )
-        user = result.first()
-        if not user:
-            return False
-        user = user[0] if isinstance(user, tuple) else user
-
-        # Check if user has any issues assigned or created
-        issues_result = await db.execute(
-            IssueModel.__table__.select().where(
-                (IssueModel.assignee_id == id) | (IssueModel.reporter_id == id)
-            )
-        )
-        if issues_result.first():
-            raise HTTPException(
-                status_code=400,
-                detail="Cannot delete user with assigned or created issues",
-            )
-
-        # Delete user
-        await db.execute(delete(UserModel).where(UserModel.id == id))
+        # Foreign keys refuse the delete while anything still references the user
+        try:
+            deleted = await UserWriteService.delete(db, id)
+        except ReferencedRow as e:
+            await db.rollback()
+            if e.constraint.startswith("issues_"):
+                detail = "Cannot delete user with assigned or created issues"
+            else:
+                detail = "Cannot delete user with existing activity or comments"
+            raise HTTPException(status_code=400, detail=detail)
         await db.commit()
 
-        return True
+        return deleted
 
     @strawberry.mutation
     async def add_comment(self, info, input: CommentCreateInput) -> CommentType:
         db: AsyncSession = info.context["db"]
-        new_comment = CommentModel(
-            issue_id=input.issueId,
-            user_id=input.userId,
-            content=input.content,
+        row = await CommentService.add(db, input.issueId, input.userId, input.content)
+        comment = comment_type_from_row(row)
+        # Pushed to commentAdded(issueId) subscribers once committed
+        OutboxService.add_event(
+            db, EventType.COMMENT_ADDED, comment_event_payload(comment)
         )
-        db.add(new_comment)
         await db.commit()
-        await db.refresh(new_comment)
-        return CommentType(
-            id=new_comment.id,
-            issueId=new_comment.issue_id,
-            userId=new_comment.user_id,
-            content=new_comment.content,
-            createdAt=new_comment.created_at,
-        )
+        outbox_relay.notify()
+        return comment
 
     @strawberry.mutation
     async def ask_chatbot(self, info, question: str) -> str:
@@ -964,6 +1206,8 @@ class Mutation:
         tags = tags_result.scalars().all()
         users_result = await db.execute(select(UserModel))
         users = users_result.scalars().all()
+        # Don't hold a pooled connection while waiting on the LLM
+        await db.close()
         # Build context
         issues_str = "\n".join(
             [
@@ -997,9 +1241,39 @@ Instructions:
             return "Sorry, the AI service is currently unavailable. Please try again later."
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription)
+def incremental_delivery_enabled() -> bool:
+    """Whether to serve @defer / @stream; fails fast if asked for without
+    a graphql-core that implements them"""
+    if not settings.GRAPHQL_INCREMENTAL_DELIVERY:
+        return False
+    try:
+        from graphql.execution import experimental_execute_incrementally  # noqa
+    except ImportError:
+        raise RuntimeError(
+            "GRAPHQL_INCREMENTAL_DELIVERY needs graphql-core 3.3 "
+            "(pip install -r req-incremental.txt)"
+        )
+    return True
+
+
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    extensions=[
+        SessionReleaseExtension,
+        PersistedQueryExtension,
+        QueryDepthLimiter(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        QueryCostExtension,
+        ResponseCacheExtension,
+    ],
+    # @defer / @stream, served as multipart/mixed over HTTP
+    config=StrawberryConfig(
+        enable_experimental_incremental_execution=incremental_delivery_enabled()
+    ),
+)
 
-gql_app = GraphQLRouter(
+gql_app = GraphQLCachingRouter(
     schema,
     context_getter=get_context_dependency,
     subscription_protocols=[GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL],
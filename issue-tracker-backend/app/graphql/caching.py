@@ -0,0 +1,118 @@
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Set
+from graphql import ExecutionResult as GraphQLExecutionResult, print_ast
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from app.database import client_writes, replica_router
+from app.services.entity_versions import mutation_entities, operation_entities
+from app.services.response_cache import response_cache
+
+# Root fields whose result depends on who is asking, not just their role
+USER_SCOPED_FIELDS = {"me"}
+
+
+def permission_scope(user, root_fields: Set[str]) -> str:
+    if user is None:
+        return "anonymous"
+    if root_fields & USER_SCOPED_FIELDS:
+        return f"user:{user.id}"
+    return f"role:{user.role.value}"
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """Serves repeated read queries from ``response_cache``.
+
+    Entries are keyed by the normalized document, operation name, variables
+    and permission scope, and tagged with the tables the operation reads.
+    A hit costs one lookup of those tables' versions. Mutations also evict
+    the entries of the tables they write, to free space early.
+
+    A miss reads from the primary so the entry it stores is current; a
+    replica may still be replaying writes the versions already count. If
+    any read went to a replica anyway, the result is shared with waiting
+    requests but not stored.
+    """
+
+    def __init__(self, *, execution_context=None):
+        self.status: Optional[str] = None
+
+    def cache_key(self, root_fields: Set[str]) -> str:
+        context = self.execution_context
+        user = (context.context or {}).get("user")
+        fingerprint = json.dumps(
+            [
+                print_ast(context.graphql_document),
+                context.operation_name,
+                context.variables,
+                permission_scope(user, root_fields),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        context = self.execution_context
+        document = context.graphql_document
+        operation = get_operation_ast(document, context.operation_name)
+        if not response_cache.enabled or operation is None:
+            yield
+            return
+
+        written = mutation_entities(document, context.operation_name)
+        if written:
+            try:
+                yield
+            finally:
+                await response_cache.invalidate(written)
+            return
+
+        tags = operation_entities(document, context.operation_name)
+        if not tags:
+            yield
+            return
+
+        root_fields = {
+            selection.name.value for selection in operation.selection_set.selections
+        }
+        key = self.cache_key(root_fields)
+
+        versions = await response_cache.versions(tags)
+        data = await response_cache.get(key, versions)
+        if data is None:
+            waited, data = await response_cache.wait_inflight(key, versions)
+            if waited and data is not None:
+                self.status = "SHARED"
+        else:
+            self.status = "HIT"
+
+        if data is not None:
+            context.result = GraphQLExecutionResult(data=data)
+            yield
+            return
+
+        self.status = "MISS"
+        writes = client_writes.get()
+        if writes is not None:
+            writes.primary_only = True
+        response_cache.begin(key, versions)
+        try:
+            yield
+        finally:
+            result = context.result
+            # Incremental (@defer / @stream) results arrive in parts; skip them
+            complete = isinstance(result, GraphQLExecutionResult)
+            fresh = result.data if complete and not result.errors else None
+            # Outside an HTTP request there is no record of where reads went
+            from_replica = bool(replica_router.replicas) and (
+                writes is None or writes.read_replica
+            )
+            await response_cache.finish(
+                key, tags, versions, fresh, store=not from_replica
+            )
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.status is None:
+            return {}
+        return {"responseCache": self.status}
@@ -0,0 +1,45 @@
+from typing import Dict, List
+from sqlalchemy import select, func
+from strawberry.dataloader import DataLoader
+from app.database import ReadSessionLocal
+from app.models.issue import Issue
+
+# Deferred fields resolve after the request's own session may already be
+# closed (and concurrently with other fields), so loaders use their own
+# short-lived sessions.
+
+
+async def load_issue_counts(user_ids: List[int]) -> List[Dict[str, int]]:
+    async with ReadSessionLocal() as session:
+        assigned = await session.execute(
+            select(Issue.assignee_id, func.count(Issue.id))
+            .where(Issue.assignee_id.in_(user_ids))
+            .group_by(Issue.assignee_id)
+        )
+        assigned_counts = dict(assigned.all())
+        reported = await session.execute(
+            select(Issue.reporter_id, func.count(Issue.id))
+            .where(Issue.reporter_id.in_(user_ids))
+            .group_by(Issue.reporter_id)
+        )
+        reported_counts = dict(reported.all())
+    return [
+        {
+            "assigned_issues_count": assigned_counts.get(user_id, 0),
+            "reported_issues_count": reported_counts.get(user_id, 0),
+        }
+        for user_id in user_ids
+    ]
+
+
+LOADERS = {
+    "issue_counts": load_issue_counts,
+}
+
+
+def get_loader(info, name: str) -> DataLoader:
+    """Per-request DataLoader, created on first use"""
+    loaders = info.context.setdefault("loaders", {})
+    if name not in loaders:
+        loaders[name] = DataLoader(load_fn=LOADERS[name])
+    return loaders[name]
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Tuple
+from graphql import DocumentNode, GraphQLError
+from strawberry.extensions import SchemaExtension
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+PERSISTED_QUERY_NOT_ALLOWED = "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def load_allowlist(path: str) -> Dict[str, str]:
+    """Read an allow-list manifest into a hash -> query mapping.
+
+    Accepts the Apollo persisted query manifest
+    (``{"operations": [{"id": ..., "body": ...}]}``) or a plain
+    ``{"<sha256>": "<query>"}`` object.
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+
+    if "operations" in manifest:
+        entries = {op["id"]: op["body"] for op in manifest["operations"]}
+    else:
+        entries = manifest
+
+    for sha, query in entries.items():
+        if query_hash(query) != sha:
+            raise ValueError(f"Allow-list entry {sha} does not match its query")
+    return entries
+
+
+class PersistedQueryStore:
+    """LRU of query text and parsed, validated documents keyed by SHA-256.
+
+    In allow-list mode the registered operations are pinned and unknown
+    hashes or ad-hoc query text are rejected.
+    """
+
+    def __init__(self, size: int, allowlist: Optional[Dict[str, str]] = None):
+        self.size = size
+        self.allowlist = allowlist
+        self._entries: "OrderedDict[str, Tuple[str, Optional[DocumentNode]]]" = (
+            OrderedDict()
+        )
+
+    @property
+    def allowlist_only(self) -> bool:
+        return self.allowlist is not None
+
+    def get_query(self, sha: str) -> Optional[str]:
+        entry = self._entries.get(sha)
+        if entry is not None:
+            self._entries.move_to_end(sha)
+            return entry[0]
+        if self.allowlist_only:
+            return self.allowlist.get(sha)
+        return None
+
+    def get_document(self, sha: str) -> Optional[DocumentNode]:
+        entry = self._entries.get(sha)
+        return entry[1] if entry else None
+
+    def put(self, sha: str, query: str, document: Optional[DocumentNode] = None):
+        self._entries[sha] = (query, document)
+        self._entries.move_to_end(sha)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def is_allowed(self, sha: str) -> bool:
+        return not self.allowlist_only or sha in self.allowlist
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _create_store() -> PersistedQueryStore:
+    allowlist = None
+    if settings.APQ_ALLOWLIST_PATH:
+        allowlist = load_allowlist(settings.APQ_ALLOWLIST_PATH)
+        logger.info(f"Loaded {len(allowlist)} allow-listed GraphQL operations")
+    return PersistedQueryStore(settings.APQ_CACHE_SIZE, allowlist)
+
+
+# Global instance
+persisted_query_store = _create_store()
+
+
+class PersistedQueryExtension(SchemaExtension):
+    """Automatic Persisted Queries (Apollo protocol, version 1).
+
+    Clients send ``extensions.persistedQuery.sha256Hash`` and omit the query;
+    on a miss they get ``PERSISTED_QUERY_NOT_FOUND`` and retry with the
+    full text, which registers it. Every operation - persisted or not - is
+    cached by hash once it parses and validates, so repeat requests skip
+    both steps.
+    """
+
+    def __init__(self, *, execution_context=None):
+        self.store = persisted_query_store
+        self.sha: Optional[str] = None
+        self.cached = False
+
+    def _persisted_hash(self) -> Optional[str]:
+        extensions = self.execution_context.operation_extensions or {}
+        persisted = extensions.get("persistedQuery")
+        if not isinstance(persisted, dict):
+            return None
+        if persisted.get("version", 1) != 1:
+            raise GraphQLError("Unsupported persisted query version")
+        return persisted.get("sha256Hash")
+
+    def on_operation(self) -> Iterator[None]:
+        context = self.execution_context
+        sha = self._persisted_hash()
+
+        if sha and not context.query:
+            context.query = self.store.get_query(sha)
+            if context.query is None:
+                code = (
+                    PERSISTED_QUERY_NOT_ALLOWED
+                    if self.store.allowlist_only
+                    else PERSISTED_QUERY_NOT_FOUND
+                )
+                raise GraphQLError("PersistedQueryNotFound", extensions={"code": code})
+        elif context.query:
+            computed = query_hash(context.query)
+            if sha and sha != computed:
+                raise GraphQLError("provided sha does not match query")
+            sha = computed
+
+        if sha and not self.store.is_allowed(sha):
+            raise GraphQLError(
+                "Operation is not in the allow-list",
+                extensions={"code": PERSISTED_QUERY_NOT_ALLOWED},
+            )
+
+        self.sha = sha
+        yield
+
+    def on_parse(self) -> Iterator[None]:
+        document = self.store.get_document(self.sha) if self.sha else None
+        if document is not None:
+            self.execution_context.graphql_document = document
+            self.cached = True
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        context = self.execution_context
+        if self.cached:
+            # Only documents that passed validation are stored
+            context.pre_execution_errors = []
+        yield
+        if self.sha and not self.cached and not context.pre_execution_errors:
+            self.store.put(self.sha, context.query, context.graphql_document)
@@ -0,0 +1,78 @@
+import dataclasses
+from typing import Any, Iterable, List, Sequence, Set
+from graphql import FieldNode, FragmentSpreadNode, InlineFragmentNode, SelectionSetNode
+from sqlalchemy import Column, Table
+from strawberry.types import Info
+from strawberry.utils.str_converters import to_camel_case
+
+
+def _collect(selection_set: SelectionSetNode, fragments, names: Set[str]) -> None:
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            names.add(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            # Includes `... @defer { }`: deferred fields are still loaded here
+            _collect(selection.selection_set, fragments, names)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                _collect(fragment.selection_set, fragments, names)
+
+
+def _children(
+    selection_set: SelectionSetNode, fragments, name: str, found: List[SelectionSetNode]
+) -> None:
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if selection.name.value == name and selection.selection_set is not None:
+                found.append(selection.selection_set)
+        elif isinstance(selection, InlineFragmentNode):
+            _children(selection.selection_set, fragments, name, found)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                _children(fragment.selection_set, fragments, name, found)
+
+
+def requested_fields(info: Info, path: Sequence[str] = ()) -> Set[str]:
+    """GraphQL names selected under the field being resolved, or under the
+    nested field ``path`` below it (e.g. ``("cards",)``)"""
+    # The raw AST is used because strawberry's selected_fields can't
+    # represent inline fragments without a type condition
+    raw = info._raw_info
+    selection_sets = [
+        node.selection_set for node in raw.field_nodes if node.selection_set is not None
+    ]
+    for name in path:
+        found: List[SelectionSetNode] = []
+        for selection_set in selection_sets:
+            _children(selection_set, raw.fragments, name, found)
+        selection_sets = found
+    names: Set[str] = set()
+    for selection_set in selection_sets:
+        _collect(selection_set, raw.fragments, names)
+    return names
+
+
+def project(
+    table: Table, requested: Set[str], always: Iterable[str] = ("id",)
+) -> List[Column]:
+    """Columns of ``table`` backing the requested fields, plus ``always``"""
+    always = set(always)
+    return [
+        column
+        for column in table.c
+        if column.name in always or to_camel_case(column.name) in requested
+    ]
+
+
+def from_row(type_cls, row: Any, **values: Any):
+    """Build a strawberry type from a projected row.
+
+    Fields that weren't selected (and so weren't loaded) are left as None;
+    GraphQL never resolves them.
+    """
+    for field in dataclasses.fields(type_cls):
+        if field.init and field.name not in values:
+            values[field.name] = getattr(row, field.name, None)
+    return type_cls(**values)
@@ -0,0 +1,216 @@
+from typing import Any, Dict, Iterator, Optional
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    value_from_ast,
+)
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from app.config import settings
+from app.models.issue import IssuePriority, IssueStatus
+from app.models.user import UserRole
+
+QUERY_TOO_COMPLEX = "QUERY_TOO_COMPLEX"
+
+# Assumed size of list fields that take no `first` / `limit` argument
+DEFAULT_LIST_SIZE = 50
+
+# Every object in a list is a row to load and serialize, even when only
+# scalars are selected from it
+LIST_ITEM_COST = 1
+
+# Fields that do noticeably more work than a column read: whole-table
+# queries, per-row counts, bcrypt and AI calls. Anything else costs 1 if it
+# returns an object and 0 if it returns a scalar.
+FIELD_COSTS = {
+    "Query.issues": 10,
+    "Query.board": 10,
+    "Query.boardColumn": 5,
+    "Query.users": 20,
+    "Query.userActivities": 5,
+    "Query.activityFeed": 5,
+    "Query.userStats": 10,
+    "UserStatsType.activityByMonth": 10,
+    "Query.issueStats": 10,
+    "Query.tags": 2,
+    "Query.me": 5,
+    "Query.comments": 2,
+    "Query.flowReport": 20,
+    "Query.reportSeries": 5,
+    "Mutation.login": 10,
+    "Mutation.createIssue": 25,
+    "Mutation.updateIssue": 25,
+    "Mutation.moveIssue": 5,
+    "Mutation.enhanceDescription": 25,
+    "Mutation.askChatbot": 50,
+    "Mutation.bulkUpdateIssues": 20,
+    "Mutation.bulkSetTags": 20,
+    "Mutation.bulkDeleteIssues": 20,
+}
+
+LIST_SIZE_ARGUMENTS = ("first", "last", "limit", "perColumn")
+
+# Lists whose length isn't set by their own arguments
+FIXED_LIST_SIZES = {
+    "Query.board": len(IssueStatus),  # one per status column
+    "FlowReportType.timeInStatus": len(IssueStatus),
+    "StatsDeltaType.statuses": len(IssueStatus),
+    "StatsDeltaType.priorities": len(IssuePriority),
+    "UserStatsType.usersByRole": len(UserRole),
+    "IssueType.tags": 10,  # a few labels per issue, not a page of them
+}
+# Lists sized by the size argument of the field above them
+PARENT_SIZED_LISTS = {
+    "BoardColumnType.cards",
+    "CommentPageType.comments",
+    "ActivityFeedType.activities",
+}
+
+
+class QueryCostAnalyzer:
+    """Static cost of an operation, computed from the document alone.
+
+    List fields cost ``LIST_ITEM_COST`` plus their selection per item,
+    multiplied by their ``first`` / ``limit`` argument (or
+    ``DEFAULT_LIST_SIZE``), so aliases, nesting and long lists of scalars
+    are all accounted for before anything is resolved.
+    """
+
+    def __init__(
+        self,
+        schema,
+        fragments: Dict[str, FragmentDefinitionNode],
+        variables: Optional[Dict[str, Any]] = None,
+    ):
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables or {}
+
+    def selection_cost(
+        self,
+        parent_type: GraphQLObjectType,
+        selection_set: SelectionSetNode,
+        parent_size: Optional[int] = None,
+    ) -> int:
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                total += self.field_cost(parent_type, selection, parent_size)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(
+                        selection.type_condition.name.value
+                    )
+                total += self.selection_cost(
+                    fragment_type, selection.selection_set, parent_size
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                total += self.selection_cost(
+                    fragment_type, fragment.selection_set, parent_size
+                )
+        return total
+
+    def field_cost(
+        self,
+        parent_type: GraphQLObjectType,
+        node: FieldNode,
+        parent_size: Optional[int] = None,
+    ) -> int:
+        name = node.name.value
+        if name.startswith("__"):
+            return 0
+
+        field = parent_type.fields[name]
+        return_type = get_nullable_type(field.type)
+        named_type = get_named_type(return_type)
+        is_object = isinstance(named_type, GraphQLObjectType)
+        key = f"{parent_type.name}.{name}"
+        cost = FIELD_COSTS.get(key, 1 if is_object else 0)
+
+        if node.selection_set and is_object:
+            size = self.size_argument(field, node)
+            child_cost = self.selection_cost(named_type, node.selection_set, size)
+            if isinstance(return_type, GraphQLList):
+                if key in FIXED_LIST_SIZES:
+                    size = FIXED_LIST_SIZES[key]
+                elif key in PARENT_SIZED_LISTS and parent_size is not None:
+                    size = parent_size
+                child_cost += LIST_ITEM_COST
+                child_cost *= DEFAULT_LIST_SIZE if size is None else size
+            cost += child_cost
+        return cost
+
+    def size_argument(self, field, node: FieldNode) -> Optional[int]:
+        for argument in node.arguments:
+            if argument.name.value in LIST_SIZE_ARGUMENTS:
+                arg_type = field.args[argument.name.value].type
+                value = value_from_ast(argument.value, arg_type, self.variables)
+                if isinstance(value, int):
+                    return max(value, 0)
+        for name in LIST_SIZE_ARGUMENTS:
+            if name in field.args and field.args[name].default_value is not None:
+                default = field.args[name].default_value
+                if isinstance(default, int):
+                    return default
+        return None
+
+
+def cost_budget(user) -> int:
+    role = user.role.value if user is not None else "ANONYMOUS"
+    budgets = settings.GRAPHQL_COST_BUDGETS
+    return budgets.get(role, budgets["ANONYMOUS"])
+
+
+class QueryCostExtension(SchemaExtension):
+    """Rejects operations whose static cost exceeds the caller's role budget.
+
+    The computed cost and budget are reported under ``extensions.cost``.
+    """
+
+    def __init__(self, *, execution_context=None):
+        self.cost: Optional[int] = None
+        self.budget: Optional[int] = None
+
+    def on_execute(self) -> Iterator[None]:
+        context = self.execution_context
+        document = context.graphql_document
+        operation = get_operation_ast(document, context.operation_name)
+        if operation is not None:
+            schema = context.schema._schema
+            root_type = schema.get_root_type(operation.operation)
+            fragments = {
+                definition.name.value: definition
+                for definition in document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            }
+            analyzer = QueryCostAnalyzer(schema, fragments, context.variables)
+            self.cost = analyzer.selection_cost(root_type, operation.selection_set)
+
+            user = (context.context or {}).get("user")
+            self.budget = cost_budget(user)
+            if self.cost > self.budget:
+                raise GraphQLError(
+                    f"Query cost {self.cost} exceeds the budget of {self.budget}",
+                    extensions={
+                        "code": QUERY_TOO_COMPLEX,
+                        "cost": self.cost,
+                        "budget": self.budget,
+                    },
+                )
+        yield
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.cost is None:
+            return {}
+        return {"cost": {"requested": self.cost, "budget": self.budget}}
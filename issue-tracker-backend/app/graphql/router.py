@@ -0,0 +1,148 @@
+import hashlib
+import json
+from typing import Any, Optional
+from fastapi import Request, Response
+from graphql import DocumentNode, GraphQLError, parse
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+from app.database import ReadSessionLocal
+from app.graphql.persisted_queries import persisted_query_store, query_hash
+from app.services.auth import get_current_user_from_token
+from app.services.entity_versions import EntityVersionService, operation_entities
+from app.utils.serialization import dumps, dumps_bytes, loads
+
+
+def if_none_match(request: Request) -> set:
+    header = request.headers.get("if-none-match", "")
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+
+class GraphQLCachingRouter(GraphQLRouter):
+    """GraphQLRouter that answers GET queries with conditional responses.
+
+    Responses and subscription frames are encoded with orjson. WebSocket
+    clients authenticate with the ``authorization`` connection param.
+
+    The strong ETag hashes the operation, its variables, the caller and the
+    committed version of every table the operation reads (see
+    ``entity_versions``), so an unchanged result costs a single lookup and
+    an empty ``304 Not Modified``.
+    """
+
+    async def on_ws_connect(self, context: Any):
+        # Subscriptions send their token in connection_init, not as a header;
+        # resolve the user here so resolvers and the cost budget see them
+        params = context.get("connection_params") or {}
+        headers = params.get("headers")
+        if not isinstance(headers, dict):
+            headers = {}
+        authorization = params.get("authorization") or headers.get("authorization")
+        if isinstance(authorization, str) and authorization.startswith("Bearer "):
+            token = authorization.split(" ", 1)[1]
+            context["user"] = await get_current_user_from_token(token)
+        return await super().on_ws_connect(context)
+
+    def encode_json(self, data: object) -> str:
+        # Used for subscription frames; HTTP bodies skip the str round trip
+        return dumps(data)
+
+    def decode_json(self, data) -> object:
+        return loads(data)
+
+    def resolve_document(
+        self, request_data: GraphQLRequestData
+    ) -> Optional[DocumentNode]:
+        query = request_data.query
+        persisted = (request_data.extensions or {}).get("persistedQuery") or {}
+        sha = persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        if not query and sha:
+            query = persisted_query_store.get_query(sha)
+        if not query:
+            return None
+        document = persisted_query_store.get_document(sha or query_hash(query))
+        if document is not None:
+            return document
+        try:
+            return parse(query)
+        except GraphQLError:
+            return None
+
+    async def compute_etag(
+        self, context: Any, request_data: GraphQLRequestData
+    ) -> Optional[str]:
+        document = self.resolve_document(request_data)
+        if document is None:
+            return None
+        entities = operation_entities(document, request_data.operation_name)
+        if entities is None:
+            return None
+
+        # Own short-lived session on the read engine: opening the request's
+        # session here would pin the operation itself to the primary
+        async with ReadSessionLocal() as session:
+            versions = await EntityVersionService.get_versions(session, entities)
+        user = context.get("user")
+        fingerprint = json.dumps(
+            [
+                query_hash(request_data.query) if request_data.query else None,
+                request_data.extensions,
+                request_data.operation_name,
+                request_data.variables,
+                user.id if user else None,
+                sorted(
+                    (entity, version, str(changed_at))
+                    for entity, (version, changed_at) in versions.items()
+                ),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return f'"{hashlib.sha256(fingerprint.encode()).hexdigest()}"'
+
+    async def execute_single(
+        self,
+        request,
+        request_adapter,
+        sub_response: Response,
+        context,
+        root_value,
+        request_data: GraphQLRequestData,
+    ) -> ExecutionResult:
+        etag = None
+        if request_adapter.method == "GET":
+            etag = await self.compute_etag(context, request_data)
+            if etag and etag in if_none_match(request):
+                sub_response.status_code = 304
+                sub_response.headers["ETag"] = etag
+                return ExecutionResult(data=None, errors=None)
+
+        result = await super().execute_single(
+            request=request,
+            request_adapter=request_adapter,
+            sub_response=sub_response,
+            context=context,
+            root_value=root_value,
+            request_data=request_data,
+        )
+
+        # Incremental (@defer / @stream) results are streamed, not revalidated
+        if etag and isinstance(result, ExecutionResult) and not result.errors:
+            sub_response.headers["ETag"] = etag
+            # Shared caches must not reuse a per-user answer without asking
+            sub_response.headers["Cache-Control"] = "private, no-cache"
+            sub_response.headers["Vary"] = "Authorization"
+        return result
+
+    def create_response(self, response_data, sub_response: Response) -> Response:
+        if sub_response.status_code == 304:
+            response = Response(status_code=304)
+            response.headers.raw.extend(sub_response.headers.raw)
+            return response
+        response = Response(
+            dumps_bytes(response_data),
+            media_type="application/json",
+            status_code=sub_response.status_code or 200,
+        )
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
@@ -0,0 +1,38 @@
+from typing import AsyncIterator
+from strawberry.types.graphql import OperationType
+from strawberry.extensions import SchemaExtension
+from app.database import LazySession, replica_router
+
+
+class SessionReleaseExtension(SchemaExtension):
+    """Routes and releases the request's lazy database session.
+
+    Queries that haven't opened the session yet read from a replica (see
+    ``ReplicaRouter``); mutations stay on the primary. The connection goes
+    back to the pool as soon as the operation has finished, instead of when
+    the HTTP response or WebSocket connection is torn down.
+    """
+
+    def _db(self):
+        context = self.execution_context.context or {}
+        db = context.get("db")
+        return db if isinstance(db, LazySession) else None
+
+    async def on_operation(self) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            db = self._db()
+            if db is not None and db.is_open:
+                await db.close()
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        db = self._db()
+        operation_type = self.execution_context.operation_type
+        if db is not None and operation_type == OperationType.QUERY:
+            db.read_only()
+        try:
+            yield
+        finally:
+            if operation_type == OperationType.MUTATION:
+                replica_router.note_write()
@@ -1,10 +1,12 @@
 import strawberry
-from typing import Optional, List
-from datetime import datetime
+from typing import Dict, Optional, List
+from strawberry.types import Info
+from datetime import date, datetime
 from enum import Enum
 from app.models.user import UserRole, UserStatus
 from app.models.issue import IssueStatus, IssuePriority
 from app.models.user_activity import ActivityType
+from app.services.rollups import ReportBucket, ReportGroupBy, ReportMetric
 
 
 @strawberry.type
@@ -19,9 +21,25 @@ class UserType:
     last_login: Optional[datetime]
     created_at: datetime
     updated_at: Optional[datetime] = None
-    assigned_issues_count: Optional[int] = None
-    reported_issues_count: Optional[int] = None
     recent_activity: Optional[List["UserActivityType"]] = None
+    # Counts known up front; otherwise loaded in one batch per request, so
+    # lists stay cheap and the counts can be @defer-ed
+    issue_counts: strawberry.Private[Optional[Dict[str, int]]] = None
+
+    async def _issue_counts(self, info: Info) -> Dict[str, int]:
+        if self.issue_counts is None:
+            from app.graphql.loaders import get_loader
+
+            self.issue_counts = await get_loader(info, "issue_counts").load(self.id)
+        return self.issue_counts
+
+    @strawberry.field
+    async def assigned_issues_count(self, info: Info) -> Optional[int]:
+        return (await self._issue_counts(info))["assigned_issues_count"]
+
+    @strawberry.field
+    async def reported_issues_count(self, info: Info) -> Optional[int]:
+        return (await self._issue_counts(info))["reported_issues_count"]
 
 
 @strawberry.type
@@ -33,6 +51,16 @@ class UserActivityType:
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
     created_at: datetime
+    user_id: Optional[int] = None
+
+
+@strawberry.type
+class ActivityFeedType:
+    # Newest first
+    activities: List[UserActivityType]
+    # Pass as ``after`` for the next (older) activities
+    end_cursor: Optional[str]
+    has_more: bool
 
 
 @strawberry.type
@@ -72,6 +100,7 @@ class IssueType:
     created_at: datetime
     updated_at: datetime
     tags: List[TagType] = strawberry.field(default_factory=list)
+    comment_count: int = 0
 
 
 @strawberry.input
@@ -96,6 +125,13 @@ class IssueUpdateInput:
     tag_ids: Optional[List[int]] = None
 
 
+@strawberry.input
+class BulkIssuePatchInput:
+    status: Optional[IssueStatus] = None
+    priority: Optional[IssuePriority] = None
+    assignee_id: Optional[int] = None
+
+
 @strawberry.input
 class InviteTeamMemberInput:
     email: str
@@ -138,12 +174,33 @@ class IssueUpdateResponse:
     issue: Optional[IssueType] = None
 
 
+@strawberry.type
+class BulkIssueUpdateResponse:
+    success: bool
+    message: str
+    issues: List[IssueType] = strawberry.field(default_factory=list)
+
+
+@strawberry.type
+class BulkIssueDeleteResponse:
+    success: bool
+    message: str
+    deleted_ids: List[int] = strawberry.field(default_factory=list)
+
+
 @strawberry.type
 class UserRoleStats:
     role: str
     count: int
 
 
+@strawberry.type
+class ActivityMonthCountType:
+    month: date
+    activity_type: ActivityType
+    count: int
+
+
 @strawberry.type
 class UserStatsType:
     total_users: int
@@ -152,6 +209,23 @@ class UserStatsType:
     users_by_role: List[UserRoleStats]
     recent_activity: List[UserActivityType]
 
+    @strawberry.field
+    async def activity_by_month(
+        self, info: Info, months: int = 12, user_id: Optional[int] = None
+    ) -> List[ActivityMonthCountType]:
+        """Activity per month (UTC) and type over the last ``months`` months,
+        the current one included; months whose partitions have expired are
+        read from the user_activity_monthly rollup"""
+        from app.services.user_activity import UserActivityService
+
+        counts = await UserActivityService.monthly_counts(
+            info.context["db"], max(months, 1), user_id
+        )
+        return [
+            ActivityMonthCountType(month=month, activity_type=activity_type, count=n)
+            for month, activity_type, n in counts
+        ]
+
 
 @strawberry.type
 class IssueStatsType:
@@ -163,6 +237,95 @@ class IssueStatsType:
     recent_activity: List["UserActivityType"]
 
 
+@strawberry.type
+class DurationStatsType:
+    count: int
+    average_hours: Optional[float]
+    p50_hours: Optional[float]
+    p85_hours: Optional[float]
+    p95_hours: Optional[float]
+
+
+@strawberry.type
+class StatusDurationType:
+    status: IssueStatus
+    stats: DurationStatsType
+
+
+@strawberry.type
+class ThroughputPointType:
+    week_start: datetime
+    completed: int
+
+
+@strawberry.type
+class FlowReportType:
+    start: datetime
+    end: datetime
+    # Only the sections that were selected are computed
+    lead_time: Optional[DurationStatsType] = None
+    cycle_time: Optional[DurationStatsType] = None
+    time_in_status: Optional[List[StatusDurationType]] = None
+    weekly_throughput: Optional[List[ThroughputPointType]] = None
+
+
+@strawberry.type
+class BoardColumnType:
+    status: IssueStatus
+    total_count: int
+    cards: List[IssueType]
+    # Pass as ``after`` to boardColumn for the next cards
+    end_cursor: Optional[str]
+    has_more: bool
+
+
+@strawberry.type
+class StatusCountDeltaType:
+    status: IssueStatus
+    delta: int
+
+
+@strawberry.type
+class PriorityCountDeltaType:
+    priority: IssuePriority
+    delta: int
+
+
+@strawberry.type
+class StatsDeltaType:
+    # Outbox event id: delivery is at-least-once, so clients drop repeats
+    event_id: str
+    total: int
+    # Only counters that changed are listed
+    statuses: List[StatusCountDeltaType]
+    priorities: List[PriorityCountDeltaType]
+
+
+@strawberry.type
+class SeriesPointType:
+    bucket_start: date
+    value: int
+
+
+@strawberry.type
+class SeriesType:
+    # Group value: status / priority name, user or tag id, "none", or "" for
+    # the ungrouped series
+    key: str
+    label: str
+    points: List[SeriesPointType]
+
+
+@strawberry.type
+class ReportSeriesType:
+    metric: ReportMetric
+    group_by: ReportGroupBy
+    bucket: ReportBucket
+    start: date
+    end: date
+    series: List[SeriesType]
+
+
 @strawberry.type
 class CommentType:
     id: int
@@ -172,6 +335,15 @@ class CommentType:
     createdAt: datetime
 
 
+@strawberry.type
+class CommentPageType:
+    # Oldest first within the page
+    comments: List[CommentType]
+    has_older: bool
+    # Pass as ``before`` for the page of older comments
+    older_cursor: Optional[str]
+
+
 @strawberry.input
 class CommentCreateInput:
     issueId: int
@@ -1,8 +1,37 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.routers import auth, websocket
+from app.database import replica_router
+from app.routers import auth, websocket, export, imports
 from app.graphql import gql_app
+from app.services.outbox import outbox_relay
+from app.services.rollups import rollup_worker
+from app.services.activity_partitions import activity_partition_worker
+from app.services.entity_versions import entity_version_folder
+from app.utils.compression import CompressionMiddleware
+from app.utils.consistency import ReadYourWritesMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Publish committed outbox events and fan them out to this worker's
+    # subscribers (every worker LISTENs for every event)
+    outbox_relay.start()
+    replica_router.start()
+    # Keeps the append-only table change log behind ETags short
+    entity_version_folder.start()
+    # Report rollups: incremental refresh plus the nightly rebuild
+    rollup_worker.start()
+    # user_activities partitions: create upcoming months, expire old ones
+    activity_partition_worker.start()
+    yield
+    await activity_partition_worker.stop()
+    await rollup_worker.stop()
+    await entity_version_folder.stop()
+    await replica_router.stop()
+    await outbox_relay.stop()
+
 
 app = FastAPI(
     title="Mini Issue Tracker API",
@@ -28,6 +57,8 @@ app = FastAPI(
     - `/auth/*` - Authentication endpoints
     - `/graphql` - GraphQL interface
     - `/ws` - WebSocket for real-time updates
+    - `/export/*` - Streaming NDJSON/CSV data export
+    - `/import/*` - Bulk CSV/NDJSON issue import
     """,
     version="1.0.0",
     contact={
@@ -41,6 +72,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -49,10 +81,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Last-Write"],
+)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    paths=settings.COMPRESSION_PATHS,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
 )
 
 app.include_router(auth.router)
 app.include_router(websocket.router)
+app.include_router(export.router)
+app.include_router(imports.router)
 app.include_router(gql_app, prefix="/graphql")
 
 
@@ -84,6 +127,22 @@ async def health_check():
     }
 
 
+@app.get(
+    "/health/db",
+    summary="Database Pools",
+    description="Connection pool saturation, checkout wait times and replica lag",
+    tags=["Health"],
+)
+async def database_health():
+    """
+    Pool telemetry for the primary and every read replica.
+
+    Returns:
+        dict: Per-engine pool usage, wait times and replica lag
+    """
+    return replica_router.status()
+
+
 @app.get(
     "/info",
     summary="API Information",
@@ -110,6 +169,15 @@ async def api_info():
             },
             "graphql": {"endpoint": "POST /graphql - GraphQL interface"},
             "websocket": {"endpoint": "GET /ws - Real-time updates"},
+            "export": {
+                "issues": "GET /export/issues - Stream issues as NDJSON/CSV",
+                "comments": "GET /export/comments - Stream comments as NDJSON/CSV",
+                "activities": "GET /export/activities - Stream activity log as NDJSON/CSV",
+            },
+            "import": {
+                "issues": "POST /import/issues - Bulk import issues from CSV/NDJSON",
+                "jobs": "GET /import/jobs/{id} - Import progress",
+            },
         },
         "features": {
             "user_roles": ["ADMIN", "MANAGER", "MEMBER", "VIEWER"],
@@ -118,3 +186,15 @@ async def api_info():
             "issue_statuses": ["OPEN", "IN_PROGRESS", "RESOLVED", "CLOSED"],
         },
     }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # WebSocket compression is negotiated by the server, not the app
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        ws_per_message_deflate=settings.WS_PER_MESSAGE_DEFLATE,
+    )
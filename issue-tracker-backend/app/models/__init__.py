@@ -10,4 +10,9 @@ from .issue import Issue
 from .tag import Tag
 from .team_member import TeamMember
 from .comment import Comment
-from .user_activity import UserActivity
+from .user_activity import UserActivity, UserActivityMonthly
+from .outbox import OutboxEvent
+from .import_job import ImportJob
+from .entity_version import EntityVersion, EntityChange
+from .issue_status_transition import IssueStatusTransition
+from .rollup import IssueDailyRollup, RollupState
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.models import Base
 
@@ -7,7 +7,7 @@ class Comment(Base):
     __tablename__ = "comments"
     id = Column(Integer, primary_key=True, index=True)
     issue_id = Column(
-        Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False
     )
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     content = Column(Text, nullable=False)
@@ -16,3 +16,8 @@ class Comment(Base):
     # Relationships
     issue = relationship("Issue", backref="comments", passive_deletes=True)
     user = relationship("User")
+
+    __table_args__ = (
+        # An issue's thread in order; keyset pages walk it from the newest end
+        Index("ix_comments_issue_created_id", "issue_id", "created_at", "id"),
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, BigInteger, DateTime, func
+from app.models import Base
+
+
+class EntityVersion(Base):
+    """Per-table change counter: the base that ``entity_changes`` rows are
+    folded into. Only ``EntityVersionService.fold`` writes it."""
+
+    __tablename__ = "entity_versions"
+    entity = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class EntityChange(Base):
+    """One row per table written by a transaction, added by statement-level
+    triggers. The committed version of a table is its ``entity_versions``
+    base plus its number of rows here."""
+
+    __tablename__ = "entity_changes"
+    entity = Column(String, primary_key=True)
+    txid = Column(BigInteger, primary_key=True, server_default=func.txid_current())
+    changed_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
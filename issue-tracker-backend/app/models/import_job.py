@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey, JSON, Enum
+from app.models import Base
+import enum
+
+
+class ImportJobStatus(enum.Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String, nullable=False)
+    format = Column(String, nullable=False)
+    status = Column(
+        Enum(ImportJobStatus, name="import_job_status"),
+        default=ImportJobStatus.RUNNING,
+        nullable=False,
+    )
+    # Checkpoint: source records consumed by committed batches
+    processed_count = Column(Integer, default=0, nullable=False)
+    imported_count = Column(Integer, default=0, nullable=False)
+    failed_count = Column(Integer, default=0, nullable=False)
+    errors = Column(JSON, nullable=True)  # First validation errors, by record number
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
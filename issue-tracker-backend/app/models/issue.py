@@ -8,6 +8,9 @@ from sqlalchemy import (
     Text,
     func,
     Table,
+    Numeric,
+    FetchedValue,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.models import Base
@@ -59,7 +62,13 @@ class Issue(Base):
         nullable=False,
     )
     assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    # Position within the status column (board order). Fractional, so a move
+    # writes one row; set by trigger to the end of the column on insert and
+    # on status changes that don't pick a rank themselves
+    rank = Column(Numeric, nullable=False, server_default=FetchedValue())
     reporter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # Kept by triggers on comments
+    comment_count = Column(Integer, nullable=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -68,3 +77,8 @@ class Issue(Base):
     assignee = relationship("User", foreign_keys=[assignee_id])
     reporter = relationship("User", foreign_keys=[reporter_id])
     tags = relationship("Tag", secondary=issue_tags, backref="issues", lazy="joined")
+
+    __table_args__ = (
+        # Board columns: cards of one status in rank order
+        Index("ix_issues_status_rank", "status", "rank", "id"),
+    )
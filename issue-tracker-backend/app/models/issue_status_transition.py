@@ -0,0 +1,53 @@
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    false,
+    func,
+)
+from app.models import Base
+from app.models.issue import IssueStatus
+
+
+class IssueStatusTransition(Base):
+    """Status history of an issue, written by triggers on ``issues``"""
+
+    __tablename__ = "issue_status_transitions"
+    id = Column(BigInteger, primary_key=True)
+    issue_id = Column(
+        Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False
+    )
+    # NULL for the transition that created the issue
+    from_status = Column(
+        Enum(IssueStatus, name="issue_status", create_type=False), nullable=True
+    )
+    to_status = Column(
+        Enum(IssueStatus, name="issue_status", create_type=False), nullable=False
+    )
+    changed_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    # Set by the rollup refresh once this row is counted in the rollups
+    rolled_up = Column(Boolean, server_default=false(), nullable=False)
+
+    __table_args__ = (
+        # An issue's history in order (spans, first start / first done)
+        Index("ix_issue_status_transitions_issue_changed", "issue_id", "changed_at"),
+        # Completions in a date range
+        Index(
+            "ix_issue_status_transitions_to_status_changed", "to_status", "changed_at"
+        ),
+        # Any transition in a date range
+        Index("ix_issue_status_transitions_changed_at", "changed_at"),
+        # Rows the rollup refresh hasn't applied yet
+        Index(
+            "ix_issue_status_transitions_pending",
+            "id",
+            postgresql_where=rolled_up.is_(False),
+        ),
+    )
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, func, JSON, Index
+from app.models import Base
+import uuid
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(
+        String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4())
+    )
+    topic = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    published_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Relay scans only the undelivered tail of the table
+        Index(
+            "ix_outbox_events_unpublished",
+            "id",
+            postgresql_where=published_at.is_(None),
+        ),
+    )
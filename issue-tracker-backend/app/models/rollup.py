@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger, Column, Date, DateTime, Integer, String, func
+from app.models import Base
+
+
+class IssueDailyRollup(Base):
+    """Per-day deltas of issue metrics, by one grouping dimension.
+
+    ``created`` and ``resolved`` rows are counts of events that day;
+    ``open`` rows are changes to the open backlog, so the backlog on a day
+    is the running sum up to it. ``value`` is the group key within the
+    dimension ('' for ``all``, 'none' for no assignee / no tags).
+    """
+
+    __tablename__ = "issue_daily_rollups"
+    metric = Column(String, primary_key=True)
+    dimension = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class RollupState(Base):
+    """When the rollups were last refreshed / rebuilt, and the highest
+    transition id applied so far"""
+
+    __tablename__ = "rollup_state"
+    name = Column(String, primary_key=True)
+    last_transition_id = Column(BigInteger, nullable=False, default=0)
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now())
+    rebuilt_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,4 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey, JSON, Enum
+from sqlalchemy import (
+    Column,
+    Date,
+    Integer,
+    String,
+    DateTime,
+    func,
+    ForeignKey,
+    JSON,
+    Enum,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from app.models import Base
 import enum
@@ -21,15 +32,45 @@ class ActivityType(enum.Enum):
 
 
 class UserActivity(Base):
+    """Audit log, range-partitioned by month on ``created_at``.
+
+    Partitions are created ahead of time and dropped (or detached) past the
+    retention window by ``ActivityPartitionService``. The partition key has
+    to be part of the primary key, hence ``(id, created_at)``.
+    """
+
     __tablename__ = "user_activities"
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # Keyset order of the activity feed, overall / per user / per type
+        Index("ix_user_activities_created_id", "created_at", "id"),
+        Index("ix_user_activities_user_created_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_user_activities_type_created_id", "activity_type", "created_at", "id"
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     activity_type = Column(Enum(ActivityType, name="activity_type"), nullable=False)
     description = Column(String, nullable=False)
     details = Column(JSON, nullable=True)  # Store additional activity details
     ip_address = Column(String, nullable=True)
     user_agent = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
 
     # Relationships
     user = relationship("User", back_populates="activities")
+
+
+class UserActivityMonthly(Base):
+    """Activity counts of partitions that aged out of ``user_activities``"""
+
+    __tablename__ = "user_activity_monthly"
+    month = Column(Date, primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+    activity_type = Column(
+        Enum(ActivityType, name="activity_type", create_type=False), primary_key=True
+    )
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,174 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import ReadSessionLocal, get_db
+from app.models.user import User
+from app.models.issue import Issue, issue_tags
+from app.models.tag import Tag
+from app.models.comment import Comment
+from app.models.user_activity import UserActivity
+from app.models.permission import PermissionType
+from app.routers.auth import get_current_user
+from app.services.permissions import PermissionService
+from app.utils.serialization import dumps
+from typing import AsyncIterator, List, Optional
+from datetime import datetime
+from enum import Enum
+import csv
+import io
+import zlib
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+# Rows fetched per server-side cursor round-trip and written per chunk
+EXPORT_CHUNK_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def _stream_rows(
+    statement, columns: List[str], fmt: ExportFormat, compress: bool
+) -> AsyncIterator[bytes]:
+    """Stream a query through a server-side cursor, one encoded chunk at a time"""
+    compressor = zlib.compressobj(wbits=31) if compress else None  # gzip framing
+
+    def emit(text: str) -> bytes:
+        data = text.encode("utf-8")
+        return compressor.compress(data) if compressor else data
+
+    if fmt == ExportFormat.CSV:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(columns)
+        yield emit(buffer.getvalue())
+
+    async with ReadSessionLocal() as session:
+        result = await session.stream(
+            statement.execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        async for rows in result.partitions(EXPORT_CHUNK_SIZE):
+            buffer = io.StringIO()
+            if fmt == ExportFormat.CSV:
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow([_csv_value(value) for value in row])
+            else:
+                for row in rows:
+                    buffer.write(dumps(dict(zip(columns, row))))
+                    buffer.write("\n")
+            chunk = emit(buffer.getvalue())
+            if chunk:
+                yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
+def _export_response(
+    name: str, statement, fmt: ExportFormat, compress: bool
+) -> StreamingResponse:
+    columns = [column.name for column in statement.selected_columns]
+    media_type = "text/csv" if fmt == ExportFormat.CSV else "application/x-ndjson"
+    filename = f"{name}.{fmt.value}"
+    if compress:
+        # Served as a .gz file rather than Content-Encoding so clients keep it packed
+        media_type = "application/gzip"
+        filename += ".gz"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    return StreamingResponse(
+        _stream_rows(statement, columns, fmt, compress),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+async def require_export_permission(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    if not await PermissionService.has_permission(
+        db, current_user.id, PermissionType.EXPORT_DATA
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to export data",
+        )
+    return current_user
+
+
+@router.get(
+    "/issues",
+    summary="Export issues",
+    description="Stream all issues as NDJSON or CSV",
+)
+async def export_issues(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    gzip: bool = Query(False, description="Gzip-compress the stream"),
+    current_user: User = Depends(require_export_permission),
+):
+    """
+    Stream every issue with its tag names, ordered by id.
+
+    - **format**: `ndjson` (default) or `csv`
+    - **gzip**: Compress the response body
+    """
+    tag_names = (
+        select(func.string_agg(Tag.name, ","))
+        .select_from(issue_tags.join(Tag, Tag.id == issue_tags.c.tag_id))
+        .where(issue_tags.c.issue_id == Issue.id)
+        .scalar_subquery()
+        .label("tags")
+    )
+    statement = select(*Issue.__table__.c, tag_names).order_by(Issue.id)
+    return _export_response("issues", statement, format, gzip)
+
+
+@router.get(
+    "/comments",
+    summary="Export comments",
+    description="Stream comments as NDJSON or CSV",
+)
+async def export_comments(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    gzip: bool = Query(False, description="Gzip-compress the stream"),
+    issue_id: Optional[int] = Query(None, description="Only this issue's comments"),
+    current_user: User = Depends(require_export_permission),
+):
+    """
+    Stream comments ordered by id, optionally for a single issue.
+    """
+    statement = select(*Comment.__table__.c).order_by(Comment.id)
+    if issue_id is not None:
+        statement = statement.where(Comment.issue_id == issue_id)
+    return _export_response("comments", statement, format, gzip)
+
+
+@router.get(
+    "/activities",
+    summary="Export user activities",
+    description="Stream the user activity log as NDJSON or CSV",
+)
+async def export_activities(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    gzip: bool = Query(False, description="Gzip-compress the stream"),
+    user_id: Optional[int] = Query(None, description="Only this user's activity"),
+    current_user: User = Depends(require_export_permission),
+):
+    """
+    Stream user activities ordered by id, optionally for a single user.
+    """
+    statement = select(*UserActivity.__table__.c).order_by(UserActivity.id)
+    if user_id is not None:
+        statement = statement.where(UserActivity.user_id == user_id)
+    return _export_response("activities", statement, format, gzip)
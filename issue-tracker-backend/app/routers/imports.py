@@ -0,0 +1,122 @@
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.models.user import User
+from app.models.import_job import ImportJob
+from app.models.permission import PermissionType
+from app.routers.auth import get_current_user
+from app.schemas.import_job import ImportJobRead
+from app.services.permissions import PermissionService
+from app.services.importer import (
+    ImportFormat,
+    IssueImporter,
+    run_import_job,
+    spool_upload,
+)
+from typing import Optional
+import asyncio
+
+router = APIRouter(prefix="/import", tags=["Import"])
+
+
+async def require_import_permission(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    if not await PermissionService.has_permission(
+        db, current_user.id, PermissionType.MANAGE_SETTINGS
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to import data",
+        )
+    return current_user
+
+
+@router.post(
+    "/issues",
+    response_model=ImportJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Bulk import issues",
+    description="Load issues from a CSV or NDJSON file using COPY",
+)
+async def import_issues(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: Optional[ImportFormat] = Query(
+        None, description="Defaults to the file extension"
+    ),
+    enhance: bool = Query(False, description="Run AI enhancement after import"),
+    resume_job_id: Optional[int] = Query(
+        None, description="Resume a failed import from its last checkpoint"
+    ),
+    batch_size: int = Query(5000, ge=100, le=50000),
+    current_user: User = Depends(require_import_permission),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Import issues in batches:
+
+    - **title**, **description**: Required
+    - **status**, **priority**: Optional, defaults OPEN / MEDIUM
+    - **assignee_email**, **reporter_email**: Resolved to existing users;
+      reporter defaults to the importing user
+    - **tags**: Tag names (list or comma-separated); missing tags are created
+    - **created_at**, **updated_at**: Optional original timestamps
+
+    The file is loaded by a background job; the response is the job, still
+    RUNNING. Invalid rows are skipped and reported on the job. Progress can
+    be polled at `GET /import/jobs/{id}`. When it finishes, clients get a
+    `stats_changed` delta and an `issues_imported` event.
+    """
+    if format is None:
+        filename = (file.filename or "").lower()
+        format = ImportFormat.CSV if filename.endswith(".csv") else ImportFormat.NDJSON
+
+    importer = IssueImporter(db, default_reporter_id=current_user.id)
+    try:
+        job = await importer.start_job(
+            format, file.filename or "upload", job_id=resume_job_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # The upload is closed with the request; the job reads its own copy
+    path = await asyncio.to_thread(spool_upload, file.file)
+    background_tasks.add_task(
+        run_import_job,
+        job.id,
+        path,
+        format,
+        current_user.id,
+        batch_size=batch_size,
+        enhance=enhance,
+    )
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ImportJobRead,
+    summary="Get import job progress",
+)
+async def get_import_job(
+    job_id: int,
+    current_user: User = Depends(require_import_permission),
+    db: AsyncSession = Depends(get_db),
+):
+    job = await db.get(ImportJob, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found"
+        )
+    return job
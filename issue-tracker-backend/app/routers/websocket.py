@@ -1,6 +1,7 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from app.services.websocket import websocket_manager, EventType
-import json
+from app.utils.serialization import dumps, loads
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,27 +9,43 @@ router = APIRouter()
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time updates"""
+async def websocket_endpoint(
+    websocket: WebSocket, last_seq: Optional[int] = None, boot: Optional[str] = None
+):
+    """WebSocket endpoint for real-time updates.
+
+    Clients reconnecting with ``?last_seq=N&boot=B`` receive the events they
+    missed after sequence number N, or a ``resync_required`` message when
+    those events have already been evicted from the replay buffer or B is
+    not this process's boot id (another worker, or a restart).
+    """
     connection_id = None
 
     try:
         # Accept the connection
         await websocket.accept()
         connection_id = str(id(websocket))
-        websocket_manager.active_connections[connection_id] = websocket
+        current_seq = websocket_manager.replay_buffer.seq
+        if last_seq is None:
+            websocket_manager.active_connections[connection_id] = websocket
 
         # Send connection established message
         await websocket.send_text(
-            json.dumps(
+            dumps(
                 {
                     "type": "connection_established",
                     "message": "Connected to real-time updates",
                     "connection_id": connection_id,
+                    "seq": current_seq,
+                    "boot": websocket_manager.replay_buffer.boot,
                 }
             )
         )
 
+        # Catch up on missed events before receiving live ones
+        if last_seq is not None:
+            await websocket_manager.resume(connection_id, websocket, last_seq, boot)
+
         logger.info(f"WebSocket connected: {connection_id}")
 
         # Keep connection alive and handle incoming messages
@@ -36,14 +53,12 @@ async def websocket_endpoint(websocket: WebSocket):
             try:
                 # Wait for messages from client
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                message = loads(data)
 
                 # Handle ping/pong for connection health
                 if message.get("type") == "ping":
                     await websocket.send_text(
-                        json.dumps(
-                            {"type": "pong", "timestamp": message.get("timestamp")}
-                        )
+                        dumps({"type": "pong", "timestamp": message.get("timestamp")})
                     )
 
             except WebSocketDisconnect:
@@ -52,7 +67,7 @@ async def websocket_endpoint(websocket: WebSocket):
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
                 await websocket.send_text(
-                    json.dumps({"type": "error", "message": "Internal server error"})
+                    dumps({"type": "error", "message": "Internal server error"})
                 )
 
     except WebSocketDisconnect:
@@ -72,5 +87,7 @@ async def websocket_status():
     return {
         "active_connections": websocket_manager.get_connection_count(),
         "active_users": websocket_manager.get_user_count(),
+        "seq": websocket_manager.replay_buffer.seq,
+        "boot": websocket_manager.replay_buffer.boot,
         "status": "running",
     }
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Any, List, Optional
+from datetime import datetime
+from app.models.import_job import ImportJobStatus
+
+
+class ImportJobRead(BaseModel):
+    id: int
+    source: str
+    format: str
+    status: ImportJobStatus
+    processed_count: int
+    imported_count: int
+    failed_count: int
+    errors: Optional[List[Any]] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
 from datetime import datetime
 from app.models.issue import IssueStatus, IssuePriority
 
@@ -33,3 +33,31 @@ class IssueRead(IssueBase):
 
     class Config:
         orm_mode = True
+
+
+class IssueImportRecord(BaseModel):
+    """One issue row from a CSV or NDJSON import file"""
+
+    title: str = Field(..., min_length=1)
+    description: str
+    status: IssueStatus = IssueStatus.OPEN
+    priority: IssuePriority = IssuePriority.MEDIUM
+    assignee_email: Optional[str] = None
+    reporter_email: Optional[str] = None
+    tags: List[str] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator("status", "priority", mode="before")
+    @classmethod
+    def upper_enum(cls, value):
+        return value.strip().upper() if isinstance(value, str) else value
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = value.split(",")
+        return [tag.strip() for tag in value if tag and tag.strip()]
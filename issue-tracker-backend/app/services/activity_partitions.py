@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.entity_versions import EntityVersionService
+
+logger = logging.getLogger(__name__)
+
+# Named by create_user_activity_partition() (see migration b8d1f3a6c4e7)
+PARTITION_NAME = re.compile(r"^user_activities_p(\d{4})_(\d{2})$")
+
+# One maintenance run at a time across all app instances
+LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('user_activities'))")
+
+# Dropping or detaching locks the parent table; give up rather than queue
+# every activity insert behind a long-running read
+LOCK_TIMEOUT_SQL = text("SET LOCAL lock_timeout = '5s'")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class ActivityPartitionService:
+    """Maintains the monthly partitions of ``user_activities``.
+
+    Upcoming months are created ahead of time, since there is no DEFAULT
+    partition to catch rows outside them. Months past the retention window
+    are counted into ``user_activity_monthly`` and then dropped, or detached
+    into standalone tables for archiving, in the same transaction.
+    """
+
+    @staticmethod
+    async def partitions(db: AsyncSession) -> List[Tuple[date, str]]:
+        """(month, table name) of every attached partition, oldest first"""
+        result = await db.execute(text("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'user_activities'::regclass
+        """))
+        partitions = []
+        for (name,) in result.all():
+            match = PARTITION_NAME.match(name)
+            if match:
+                year, month = match.groups()
+                partitions.append((date(int(year), int(month), 1), name))
+        return sorted(partitions)
+
+    @staticmethod
+    async def ensure_partitions(
+        db: AsyncSession, existing: List[Tuple[date, str]], ahead: int
+    ) -> List[str]:
+        """Create the current month and ``ahead`` more; returns new tables"""
+        have = {name for _, name in existing}
+        current = month_start(datetime.now(timezone.utc).date())
+        created = []
+        for offset in range(ahead + 1):
+            result = await db.execute(
+                text("SELECT create_user_activity_partition(:month)"),
+                {"month": add_months(current, offset)},
+            )
+            name = result.scalar()
+            if name not in have:
+                created.append(name)
+        return created
+
+    @staticmethod
+    async def expire(
+        db: AsyncSession,
+        existing: List[Tuple[date, str]],
+        keep_months: int,
+        detach: bool,
+    ) -> List[str]:
+        """Roll up and remove partitions older than ``keep_months`` full
+        months before the current one; returns the tables removed"""
+        if keep_months <= 0:
+            return []
+        cutoff = add_months(
+            month_start(datetime.now(timezone.utc).date()), -keep_months
+        )
+        expired = [(month, name) for month, name in existing if month < cutoff]
+        for month, name in expired:
+            # Names come from pg_class and matched PARTITION_NAME
+            await db.execute(
+                text(f"""
+                    INSERT INTO user_activity_monthly
+                        (month, user_id, activity_type, count)
+                    SELECT CAST(:month AS date), user_id, activity_type, count(*)
+                    FROM "{name}"
+                    GROUP BY user_id, activity_type
+                    ON CONFLICT (month, user_id, activity_type)
+                    DO UPDATE SET count = user_activity_monthly.count + EXCLUDED.count
+                """),
+                {"month": month},
+            )
+            if detach:
+                await db.execute(
+                    text(f'ALTER TABLE user_activities DETACH PARTITION "{name}"')
+                )
+            else:
+                await db.execute(text(f'DROP TABLE "{name}"'))
+        if expired:
+            # DDL doesn't fire the statement trigger; cached reads must go
+            await EntityVersionService.add_change(db, "user_activities")
+        return [name for _, name in expired]
+
+    @staticmethod
+    async def maintain(
+        db: AsyncSession,
+        ahead: int = settings.ACTIVITY_PARTITIONS_AHEAD,
+        keep_months: int = settings.ACTIVITY_RETENTION_MONTHS,
+        detach: bool = settings.ACTIVITY_RETENTION_DETACH,
+    ) -> Optional[Dict[str, List[str]]]:
+        """Create upcoming partitions and expire old ones in one transaction.
+
+        Returns the tables created and expired, or None if another instance
+        holds the lock.
+        """
+        if not (await db.execute(LOCK_SQL)).scalar():
+            return None
+        await db.execute(LOCK_TIMEOUT_SQL)
+        existing = await ActivityPartitionService.partitions(db)
+        created = await ActivityPartitionService.ensure_partitions(db, existing, ahead)
+        expired = await ActivityPartitionService.expire(
+            db, existing, keep_months, detach
+        )
+        await db.commit()
+        return {"created": created, "expired": expired}
+
+
+class ActivityPartitionWorker:
+    """Runs ``ActivityPartitionService.maintain`` every ``interval`` seconds,
+    starting immediately so a fresh deploy has its partitions"""
+
+    def __init__(self, interval: float = settings.ACTIVITY_MAINTENANCE_INTERVAL):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Activity partition maintenance error: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def tick(self) -> None:
+        async with AsyncSessionLocal() as session:
+            changes = await ActivityPartitionService.maintain(session)
+        if changes is None:
+            return
+        for name in changes["created"]:
+            logger.info(f"Created activity partition {name}")
+        for name in changes["expired"]:
+            logger.info(f"Expired activity partition {name}")
+
+
+# Global instance
+activity_partition_worker = ActivityPartitionWorker()
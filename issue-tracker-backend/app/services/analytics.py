@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import and_, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.issue import Issue, IssueStatus
+from app.models.issue_status_transition import IssueStatusTransition
+
+T = IssueStatusTransition
+
+DONE_STATUSES = (IssueStatus.RESOLVED, IssueStatus.CLOSED)
+PERCENTILES = (0.5, 0.85, 0.95)
+DEFAULT_REPORT_DAYS = 90
+
+
+def report_range(
+    start: Optional[datetime], end: Optional[datetime]
+) -> Tuple[datetime, datetime]:
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=DEFAULT_REPORT_DAYS)
+    return start, end
+
+
+def _hours(seconds) -> Optional[float]:
+    # EXTRACT(epoch ...) and avg() come back as Decimal
+    return round(float(seconds) / 3600, 2) if seconds is not None else None
+
+
+def _duration_columns(seconds, prefix: str) -> List[Any]:
+    """count / avg / percentiles of a duration in seconds, in one SELECT"""
+    return [
+        func.count(seconds).label(f"{prefix}_count"),
+        func.avg(seconds).label(f"{prefix}_avg"),
+        *(
+            func.percentile_cont(p).within_group(seconds).label(f"{prefix}_p{n}")
+            for p, n in zip(PERCENTILES, (50, 85, 95))
+        ),
+    ]
+
+
+def _duration_stats(row, prefix: str) -> Dict[str, Any]:
+    return {
+        "count": getattr(row, f"{prefix}_count") or 0,
+        "average_hours": _hours(getattr(row, f"{prefix}_avg")),
+        "p50_hours": _hours(getattr(row, f"{prefix}_p50")),
+        "p85_hours": _hours(getattr(row, f"{prefix}_p85")),
+        "p95_hours": _hours(getattr(row, f"{prefix}_p95")),
+    }
+
+
+def _seconds(later, earlier):
+    return func.extract("epoch", later - earlier)
+
+
+class IssueAnalyticsService:
+    """Flow metrics over ``issue_status_transitions``.
+
+    Every query starts from an index range on ``changed_at`` (optionally
+    with ``to_status``), so cost grows with the report window rather than
+    with the total history.
+    """
+
+    @staticmethod
+    async def lead_and_cycle_time(
+        db: AsyncSession, start: datetime, end: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """Issues first finished in [start, end).
+
+        Lead time runs from creation to done; cycle time from the first move
+        to IN_PROGRESS to done.
+        """
+        done = (
+            select(T.issue_id, func.min(T.changed_at).label("done_at"))
+            .where(
+                T.to_status.in_(DONE_STATUSES),
+                T.changed_at >= start,
+                T.changed_at < end,
+            )
+            .group_by(T.issue_id)
+            .cte("done")
+        )
+        started = (
+            select(T.issue_id, func.min(T.changed_at).label("started_at"))
+            .join(done, done.c.issue_id == T.issue_id)
+            .where(
+                T.to_status == IssueStatus.IN_PROGRESS,
+                T.changed_at <= done.c.done_at,
+            )
+            .group_by(T.issue_id)
+            .cte("started")
+        )
+        lead = _seconds(done.c.done_at, Issue.created_at)
+        cycle = _seconds(done.c.done_at, started.c.started_at)
+        result = await db.execute(
+            select(*_duration_columns(lead, "lead"), *_duration_columns(cycle, "cycle"))
+            .select_from(done)
+            .join(Issue, Issue.id == done.c.issue_id)
+            .outerjoin(started, started.c.issue_id == done.c.issue_id)
+        )
+        row = result.one()
+        return {
+            "lead_time": _duration_stats(row, "lead"),
+            "cycle_time": _duration_stats(row, "cycle"),
+        }
+
+    @staticmethod
+    async def time_in_status(
+        db: AsyncSession, start: datetime, end: datetime
+    ) -> List[Dict[str, Any]]:
+        """Distribution of completed stays in each status entered in range"""
+        # The next transition of an issue is never earlier than the current
+        # one, so LEAD over the range alone finds where each stay ended
+        spans = (
+            select(
+                T.to_status.label("status"),
+                T.changed_at.label("entered_at"),
+                func.lead(T.changed_at)
+                .over(partition_by=T.issue_id, order_by=(T.changed_at, T.id))
+                .label("left_at"),
+            )
+            .where(T.changed_at >= start)
+            .subquery("spans")
+        )
+        duration = _seconds(spans.c.left_at, spans.c.entered_at)
+        result = await db.execute(
+            select(spans.c.status, *_duration_columns(duration, "stay"))
+            .where(spans.c.entered_at < end, spans.c.left_at.is_not(None))
+            .group_by(spans.c.status)
+            .order_by(spans.c.status)
+        )
+        return [
+            {"status": row.status, **_duration_stats(row, "stay")}
+            for row in result.fetchall()
+        ]
+
+    @staticmethod
+    async def weekly_throughput(
+        db: AsyncSession, start: datetime, end: datetime
+    ) -> List[Dict[str, Any]]:
+        """Issues finished per ISO week (Monday start)"""
+        # Literal unit, so the SELECT and GROUP BY expressions are identical
+        week = func.date_trunc(literal_column("'week'"), T.changed_at).label(
+            "week_start"
+        )
+        result = await db.execute(
+            select(week, func.count(func.distinct(T.issue_id)).label("completed"))
+            .where(
+                and_(
+                    T.to_status.in_(DONE_STATUSES),
+                    T.changed_at >= start,
+                    T.changed_at < end,
+                )
+            )
+            .group_by(week)
+            .order_by(week)
+        )
+        return [
+            {"week_start": row.week_start, "completed": row.completed}
+            for row in result.fetchall()
+        ]
@@ -0,0 +1,205 @@
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, localcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Column, func, select, text, tuple_, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.issue import Issue, IssueStatus
+from app.utils.cursor import decode_cursor
+
+MAX_CARDS_PER_COLUMN = 100
+
+# (rank, id): position of a card within its column
+Position = Tuple[Decimal, int]
+
+
+def rank_between(lower: Optional[Decimal], upper: Optional[Decimal]) -> Decimal:
+    """The shortest decimal strictly between two ranks (None: open end).
+
+    Ends step to the next whole number; in between, the midpoint is rounded
+    to as few decimals as still fit, so keys grow slowly under repeated
+    inserts at the same spot and nothing is ever renumbered.
+    """
+    if lower is None and upper is None:
+        return Decimal(1)
+    if upper is None:
+        return lower.to_integral_value(rounding=ROUND_FLOOR) + 1
+    if lower is None:
+        return upper.to_integral_value(rounding=ROUND_CEILING) - 1
+    if lower >= upper:
+        # Neighbours share a rank (concurrent moves); id breaks the tie
+        return lower
+    with localcontext() as ctx:
+        # Enough digits for the exact midpoint
+        ctx.prec = len(str(lower)) + len(str(upper)) + 2
+        middle = (lower + upper) / 2
+        scale = 0
+        while True:
+            candidate = middle.quantize(Decimal(1).scaleb(-scale))
+            if lower < candidate < upper:
+                return candidate
+            scale += 1
+
+
+# Read by the set_issue_rank() trigger: a status change of this issue keeps
+# the rank written with it instead of going to the end of the column
+EXPLICIT_RANK_SQL = text("SELECT set_config('app.explicit_rank_id', :issue_id, true)")
+
+
+def decode_position(cursor: str) -> Position:
+    rank, issue_id = decode_cursor(cursor, 2)
+    try:
+        return Decimal(rank), int(issue_id)
+    except (ArithmeticError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _column_select(
+    columns: Sequence[Column],
+    status: IssueStatus,
+    limit: int,
+    after: Optional[Position] = None,
+):
+    # Served by ix_issues_status_rank: an index range per column
+    statement = select(*columns).where(Issue.status == status)
+    if after is not None:
+        statement = statement.where(tuple_(Issue.rank, Issue.id) > tuple_(*after))
+    return statement.order_by(Issue.rank, Issue.id).limit(limit)
+
+
+class BoardService:
+    @staticmethod
+    async def columns(
+        db: AsyncSession,
+        statuses: Sequence[IssueStatus],
+        columns: Sequence[Column],
+        limit: int,
+    ) -> Dict[IssueStatus, List[Row]]:
+        """Top ``limit`` + 1 cards of every column, in one round trip.
+
+        The extra row tells the caller whether the column has more.
+        """
+        result = await db.execute(
+            union_all(
+                *(_column_select(columns, status, limit + 1) for status in statuses)
+            )
+        )
+        cards: Dict[IssueStatus, List[Row]] = {status: [] for status in statuses}
+        for row in result.fetchall():
+            cards[IssueStatus(row.status)].append(row)
+        for rows in cards.values():
+            rows.sort(key=lambda row: (row.rank, row.id))
+        return cards
+
+    @staticmethod
+    async def column(
+        db: AsyncSession,
+        status: IssueStatus,
+        columns: Sequence[Column],
+        limit: int,
+        after: Optional[Position],
+    ) -> List[Row]:
+        result = await db.execute(_column_select(columns, status, limit + 1, after))
+        return result.fetchall()
+
+    @staticmethod
+    async def counts(
+        db: AsyncSession, statuses: Sequence[IssueStatus]
+    ) -> Dict[IssueStatus, int]:
+        result = await db.execute(
+            select(Issue.status, func.count())
+            .where(Issue.status.in_(statuses))
+            .group_by(Issue.status)
+        )
+        counts = {status: 0 for status in statuses}
+        counts.update({IssueStatus(status): count for status, count in result.all()})
+        return counts
+
+    @staticmethod
+    async def rank_for_move(
+        db: AsyncSession,
+        issue_id: int,
+        status: IssueStatus,
+        before_id: Optional[int],
+        after_id: Optional[int],
+    ) -> Decimal:
+        """Rank placing the issue after ``after_id`` and before ``before_id``.
+
+        Both neighbours must already be in the ``status`` column. With one
+        neighbour the card goes right next to it; with none, to the end.
+        """
+        neighbour_ids = [i for i in (before_id, after_id) if i is not None]
+        if issue_id in neighbour_ids:
+            raise ValueError("An issue can't be placed next to itself")
+        neighbours: Dict[int, Row] = {}
+        if neighbour_ids:
+            result = await db.execute(
+                select(Issue.id, Issue.status, Issue.rank).where(
+                    Issue.id.in_(neighbour_ids)
+                )
+            )
+            neighbours = {row.id: row for row in result.fetchall()}
+        for neighbour_id in neighbour_ids:
+            row = neighbours.get(neighbour_id)
+            if row is None or row.status != status:
+                raise ValueError(
+                    f"Issue {neighbour_id} is not in the {status.value} column"
+                )
+
+        lower = neighbours[after_id] if after_id is not None else None
+        upper = neighbours[before_id] if before_id is not None else None
+        if lower is not None and upper is None:
+            upper = await BoardService._adjacent(
+                db, issue_id, status, lower, after=True
+            )
+        elif upper is not None and lower is None:
+            lower = await BoardService._adjacent(
+                db, issue_id, status, upper, after=False
+            )
+        elif lower is None and upper is None:
+            lower = await BoardService._last(db, issue_id, status)
+        return rank_between(
+            lower.rank if lower is not None else None,
+            upper.rank if upper is not None else None,
+        )
+
+    @staticmethod
+    async def keep_rank(db: AsyncSession, issue_id: int) -> None:
+        """Flag the rank this transaction writes for ``issue_id`` as explicit"""
+        await db.execute(EXPLICIT_RANK_SQL, {"issue_id": str(issue_id)})
+
+    @staticmethod
+    async def _adjacent(
+        db: AsyncSession, issue_id: int, status: IssueStatus, card: Row, after: bool
+    ) -> Optional[Row]:
+        """The card next to ``card`` in its column, ignoring the one being moved"""
+        position = tuple_(Issue.rank, Issue.id)
+        card_position = tuple_(card.rank, card.id)
+        result = await db.execute(
+            select(Issue.id, Issue.rank)
+            .where(
+                Issue.status == status,
+                Issue.id != issue_id,
+                position > card_position if after else position < card_position,
+            )
+            .order_by(
+                *(
+                    (Issue.rank, Issue.id)
+                    if after
+                    else (Issue.rank.desc(), Issue.id.desc())
+                )
+            )
+            .limit(1)
+        )
+        return result.first()
+
+    @staticmethod
+    async def _last(
+        db: AsyncSession, issue_id: int, status: IssueStatus
+    ) -> Optional[Row]:
+        result = await db.execute(
+            select(Issue.id, Issue.rank)
+            .where(Issue.status == status, Issue.id != issue_id)
+            .order_by(Issue.rank.desc(), Issue.id.desc())
+            .limit(1)
+        )
+        return result.first()
@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.comment import Comment
+from app.utils.cursor import decode_cursor
+
+comments_table = Comment.__table__
+
+MAX_COMMENTS_PER_PAGE = 100
+
+# (created_at, id): position of a comment in its thread
+Position = Tuple[datetime, int]
+
+
+def decode_position(cursor: str) -> Position:
+    created_at, comment_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(comment_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+class CommentService:
+    @staticmethod
+    async def page(
+        db: AsyncSession, issue_id: int, last: int, before: Optional[Position]
+    ) -> Tuple[List[Row], bool]:
+        """Up to ``last`` comments older than ``before`` (default: the newest),
+        oldest first, and whether older ones remain"""
+        # Walks ix_comments_issue_created_id backwards from the cursor
+        statement = select(comments_table).where(Comment.issue_id == issue_id)
+        if before is not None:
+            statement = statement.where(
+                tuple_(Comment.created_at, Comment.id) < tuple_(*before)
+            )
+        result = await db.execute(
+            statement.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(
+                last + 1
+            )
+        )
+        rows = result.fetchall()
+        return list(reversed(rows[:last])), len(rows) > last
+
+    @staticmethod
+    async def add(db: AsyncSession, issue_id: int, user_id: int, content: str) -> Row:
+        """Insert a comment (issues.comment_count follows by trigger); not committed"""
+        result = await db.execute(
+            insert(comments_table)
+            .values(issue_id=issue_id, user_id=user_id, content=content)
+            .returning(*comments_table.c)
+        )
+        return result.one()
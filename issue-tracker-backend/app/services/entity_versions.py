@@ -0,0 +1,227 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set, Tuple
+from graphql import DocumentNode, FieldNode, OperationType
+from graphql.utilities import get_operation_ast
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.entity_version import EntityChange, EntityVersion
+
+logger = logging.getLogger(__name__)
+
+ISSUE_ENTITIES = ("issues", "issue_tags", "tags")
+USER_ENTITIES = ("users", "issues", "user_activities")
+
+# Tables each root query field reads. Operations touching a field that is
+# not listed here are never treated as cacheable.
+ROOT_FIELD_ENTITIES: Dict[str, Tuple[str, ...]] = {
+    "__typename": (),
+    "health": (),
+    "issues": ISSUE_ENTITIES,
+    "issue": ISSUE_ENTITIES,
+    "board": ISSUE_ENTITIES,
+    "boardColumn": ISSUE_ENTITIES,
+    "users": USER_ENTITIES,
+    "me": USER_ENTITIES,
+    "userActivities": ("user_activities",),
+    "activityFeed": ("user_activities",),
+    "userStats": ("users", "user_activities"),
+    "issueStats": ("issues", "user_activities"),
+    "tags": ("tags",),
+    "permissions": ("permissions",),
+    "comments": ("comments",),
+    "flowReport": ("issues", "issue_status_transitions"),
+    # Labels come from users / tags
+    "reportSeries": ("issue_daily_rollups", "users", "tags"),
+}
+
+# Status changes also append to issue_status_transitions (via trigger)
+ISSUE_WRITES = ("issues", "issue_tags", "user_activities", "issue_status_transitions")
+USER_WRITES = ("users", "user_activities")
+
+# Tables each mutation may write, used to invalidate cached responses.
+# Mutations missing from this map invalidate everything.
+MUTATION_ENTITIES: Dict[str, Tuple[str, ...]] = {
+    "createTag": ("tags",),
+    "updateTag": ("tags",),
+    "deleteTag": ("tags", "issue_tags"),
+    "createIssue": ISSUE_WRITES,
+    "updateIssue": ISSUE_WRITES,
+    "moveIssue": ISSUE_WRITES,
+    "deleteIssue": ISSUE_WRITES,
+    "bulkUpdateIssues": ISSUE_WRITES,
+    "bulkSetTags": ISSUE_WRITES,
+    "bulkDeleteIssues": ISSUE_WRITES,
+    "inviteTeamMember": (),
+    "enhanceDescription": (),
+    "askChatbot": (),
+    "login": USER_WRITES,
+    "createUser": USER_WRITES,
+    "updateUser": USER_WRITES,
+    "updateUserRole": USER_WRITES,
+    "deleteUser": USER_WRITES + ("issues",),
+    "initializePermissions": ("permissions",),
+    # comment_count on issues moves with it (trigger)
+    "addComment": ("comments", "issues"),
+}
+
+ALL_ENTITIES = frozenset(
+    entity
+    for entities in (*ROOT_FIELD_ENTITIES.values(), *MUTATION_ENTITIES.values())
+    for entity in entities
+)
+
+
+def operation_entities(
+    document: DocumentNode, operation_name: Optional[str] = None
+) -> Optional[Set[str]]:
+    """Tables read by a query operation, or None if it can't be versioned"""
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation != OperationType.QUERY:
+        return None
+
+    entities: Set[str] = set()
+    for selection in operation.selection_set.selections:
+        # Fragments at the root are rare enough to just skip caching
+        if not isinstance(selection, FieldNode):
+            return None
+        touched = ROOT_FIELD_ENTITIES.get(selection.name.value)
+        if touched is None:
+            return None
+        entities.update(touched)
+    return entities
+
+
+def mutation_entities(
+    document: DocumentNode, operation_name: Optional[str] = None
+) -> Set[str]:
+    """Tables a mutation operation may have written"""
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation != OperationType.MUTATION:
+        return set()
+
+    entities: Set[str] = set()
+    for selection in operation.selection_set.selections:
+        if not isinstance(selection, FieldNode):
+            return set(ALL_ENTITIES)
+        written = MUTATION_ENTITIES.get(selection.name.value)
+        if written is None:
+            return set(ALL_ENTITIES)
+        entities.update(written)
+    return entities
+
+
+# Moves committed entity_changes rows into the entity_versions base in one
+# transaction, so a reader's base + count is the same before and after.
+# Rows of transactions still in flight aren't visible and stay for later.
+FOLD_SQL = text("""
+    WITH folded AS (
+        DELETE FROM entity_changes RETURNING entity, changed_at
+    )
+    INSERT INTO entity_versions (entity, version, changed_at)
+    SELECT entity, count(*), max(changed_at) FROM folded GROUP BY entity
+    ON CONFLICT (entity) DO UPDATE
+    SET version = entity_versions.version + EXCLUDED.version,
+        changed_at = greatest(entity_versions.changed_at, EXCLUDED.changed_at)
+""")
+
+# entity_versions has one writer at a time
+FOLD_LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('entity_versions'))")
+
+
+class EntityVersionService:
+    @staticmethod
+    async def get_versions(
+        db: AsyncSession, entities: Iterable[str]
+    ) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """Committed (change sequence, last change time) per table.
+
+        Every committed writing transaction adds one ``entity_changes`` row,
+        so base + row count grows by one per commit whatever the commit
+        order. Both are read in the same statement (one snapshot).
+        """
+        entities = sorted(entities)
+        if not entities:
+            return {}
+        changes = (
+            select(
+                EntityChange.entity,
+                func.count().label("pending"),
+                func.max(EntityChange.changed_at).label("changed_at"),
+            )
+            .where(EntityChange.entity.in_(entities))
+            .group_by(EntityChange.entity)
+            .subquery()
+        )
+        result = await db.execute(
+            select(
+                EntityVersion.entity,
+                (EntityVersion.version + func.coalesce(changes.c.pending, 0)).label(
+                    "version"
+                ),
+                # greatest() skips NULLs: no pending rows keeps the base time
+                func.greatest(EntityVersion.changed_at, changes.c.changed_at).label(
+                    "changed_at"
+                ),
+            )
+            .outerjoin(changes, changes.c.entity == EntityVersion.entity)
+            .where(EntityVersion.entity.in_(entities))
+        )
+        return {row.entity: (row.version, row.changed_at) for row in result}
+
+    @staticmethod
+    async def fold(db: AsyncSession) -> None:
+        """Fold committed change rows into the base versions and commit"""
+        if (await db.execute(FOLD_LOCK_SQL)).scalar():
+            await db.execute(FOLD_SQL)
+        await db.commit()
+
+    @staticmethod
+    async def add_change(db: AsyncSession, entity: str) -> None:
+        """Record a change the triggers can't see (DDL such as DROP TABLE)
+        in the caller's transaction"""
+        await db.execute(
+            text(
+                "INSERT INTO entity_changes (entity) VALUES (:entity) "
+                "ON CONFLICT (entity, txid) DO NOTHING"
+            ),
+            {"entity": entity},
+        )
+
+
+class EntityVersionFolder:
+    """Folds ``entity_changes`` every ``interval`` seconds, keeping the rows
+    counted by each version lookup to a few seconds' worth of writes"""
+
+    def __init__(self, interval: float = settings.ENTITY_VERSION_FOLD_INTERVAL):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await EntityVersionService.fold(session)
+            except Exception as e:
+                logger.error(f"Entity version fold error: {e}")
+            await asyncio.sleep(self.interval)
+
+
+# Global instance
+entity_version_folder = EntityVersionFolder()
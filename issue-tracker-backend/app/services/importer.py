@@ -0,0 +1,420 @@
+import asyncio
+import csv
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from pydantic import ValidationError
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
+from app.models.issue import Issue
+from app.models.tag import Tag
+from app.models.user import User
+from app.models.import_job import ImportJob, ImportJobStatus
+from app.schemas.issue import IssueImportRecord
+from app.services.response_cache import response_cache
+from app.services.websocket import EventType
+
+logger = logging.getLogger(__name__)
+
+ISSUE_COPY_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "assignee_id",
+    "reporter_id",
+    "created_at",
+    "updated_at",
+]
+
+# Validation errors kept on the job row; the rest are only counted
+MAX_JOB_ERRORS = 100
+
+
+class ImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def parse_records(
+    lines: Iterable[str], fmt: ImportFormat
+) -> Iterator[Dict[str, Any] | Exception]:
+    """Lazily yield one raw record (or the parse error) per source row"""
+    if fmt == ImportFormat.CSV:
+        for row in csv.DictReader(lines):
+            # CSV has no null, only empty cells
+            yield {key: value for key, value in row.items() if value not in ("", None)}
+        return
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Expected a JSON object per line")
+            yield record
+        except ValueError as e:
+            yield e
+
+
+def next_batch(
+    records: Iterator[Tuple[int, Any]], size: int, skip: int
+) -> List[Tuple[int, Any]]:
+    """Up to ``size`` numbered records past ``skip``. Reads and parses the
+    source, so it is run in a thread."""
+    batch = []
+    for number, raw in records:
+        if number <= skip:
+            continue
+        batch.append((number, raw))
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def spool_upload(source: IO[bytes]) -> str:
+    """Copy an upload to a temporary file that outlives the request"""
+    with tempfile.NamedTemporaryFile("wb", suffix=".import", delete=False) as target:
+        shutil.copyfileobj(source, target)
+    return target.name
+
+
+class IssueImporter:
+    """Bulk-loads issues with COPY, one transaction per batch.
+
+    Every batch commits together with the job's processed_count, so an
+    interrupted import resumes from the last committed batch without
+    duplicating rows. The source is read and parsed in a worker thread, a
+    batch at a time.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        default_reporter_id: int,
+        batch_size: int = 5000,
+        collect_ids: bool = False,
+        progress: Optional[Callable[[ImportJob], None]] = None,
+    ):
+        self.db = db
+        self.default_reporter_id = default_reporter_id
+        self.batch_size = batch_size
+        self.collect_ids = collect_ids
+        self.progress = progress
+        self.imported_ids: List[int] = []
+        # (status, priority) of every imported issue, for the stats delta
+        self.imported_mix: Counter = Counter()
+        self.user_ids: Dict[str, int] = {}
+        self.tag_ids: Dict[str, int] = {}
+
+    async def run(
+        self,
+        lines: Iterable[str],
+        fmt: ImportFormat,
+        source: str,
+        job_id: Optional[int] = None,
+    ) -> ImportJob:
+        job = await self.start_job(fmt, source, job_id)
+        return await self.load(job, lines, fmt)
+
+    async def load(
+        self, job: ImportJob, lines: Iterable[str], fmt: ImportFormat
+    ) -> ImportJob:
+        """Import ``lines`` into a started job, resuming at its checkpoint"""
+        await self._load_maps()
+
+        records = enumerate(parse_records(lines, fmt), start=1)
+        skip = job.processed_count
+        try:
+            while batch := await asyncio.to_thread(
+                next_batch, records, self.batch_size, skip
+            ):
+                await self._import_batch(job, batch)
+        except (Exception, asyncio.CancelledError) as e:
+            # Interrupted runs are marked FAILED too, so they can be resumed
+            await self.db.rollback()
+            await self.db.refresh(job)
+            job.status = ImportJobStatus.FAILED
+            job.errors = (job.errors or []) + [{"record": None, "error": str(e)}]
+            await self.db.commit()
+            raise
+
+        job.status = ImportJobStatus.COMPLETED
+        await self.db.commit()
+        return job
+
+    async def announce(self) -> None:
+        """Tell clients about the committed batches: one stats delta and an
+        ``issues_imported`` event, instead of an event per issue"""
+        from app.services.outbox import OutboxService, outbox_relay
+
+        if not self.imported_mix:
+            return
+        OutboxService.add_stats_delta(
+            self.db,
+            (
+                (None, {"status": status, "priority": priority})
+                for (status, priority), count in self.imported_mix.items()
+                for _ in range(count)
+            ),
+        )
+        OutboxService.add_event(
+            self.db,
+            EventType.ISSUES_IMPORTED,
+            {"imported_count": sum(self.imported_mix.values())},
+        )
+        await self.db.commit()
+        outbox_relay.notify()
+        await response_cache.invalidate(
+            ("issues", "issue_tags", "tags", "issue_status_transitions")
+        )
+
+    async def start_job(
+        self, fmt: ImportFormat, source: str, job_id: Optional[int] = None
+    ) -> ImportJob:
+        """Create the job row, or reopen ``job_id`` to resume it.
+
+        Only a FAILED job can be resumed; the status is switched in the same
+        UPDATE that checks it, so a job is never loaded by two runs at once.
+        """
+        if job_id is not None:
+            reopened = await self.db.execute(
+                update(ImportJob)
+                .where(
+                    ImportJob.id == job_id,
+                    ImportJob.status == ImportJobStatus.FAILED,
+                )
+                .values(status=ImportJobStatus.RUNNING)
+                .returning(ImportJob.id)
+            )
+            if reopened.scalar_one_or_none() is None:
+                job = await self.db.get(ImportJob, job_id)
+                if job is None:
+                    raise ValueError(f"Import job {job_id} not found")
+                raise ValueError(
+                    f"Import job {job_id} is {job.status.value.lower()}; "
+                    "only failed jobs can be resumed"
+                )
+            job = await self.db.get(ImportJob, job_id)
+        else:
+            job = ImportJob(
+                source=source,
+                format=fmt.value,
+                status=ImportJobStatus.RUNNING,
+                processed_count=0,
+                imported_count=0,
+                failed_count=0,
+                created_by=self.default_reporter_id,
+            )
+            self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+
+    async def _load_maps(self) -> None:
+        users = await self.db.execute(select(User.email, User.id))
+        self.user_ids = {email.lower(): user_id for email, user_id in users}
+        tags = await self.db.execute(select(Tag.name, Tag.id))
+        self.tag_ids = {name: tag_id for name, tag_id in tags}
+
+    def _resolve_user(self, email: Optional[str]) -> Optional[int]:
+        if email is None:
+            return None
+        user_id = self.user_ids.get(email.strip().lower())
+        if user_id is None:
+            raise ValueError(f"Unknown user email: {email}")
+        return user_id
+
+    async def _ensure_tags(self, names: Iterable[str]) -> None:
+        missing = sorted(set(names) - self.tag_ids.keys())
+        if not missing:
+            return
+        await self.db.execute(
+            pg_insert(Tag)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        result = await self.db.execute(
+            select(Tag.name, Tag.id).where(Tag.name.in_(missing))
+        )
+        self.tag_ids.update({name: tag_id for name, tag_id in result})
+
+    async def _import_batch(self, job: ImportJob, batch: List[Tuple[int, Any]]):
+        now = datetime.now(timezone.utc)
+        valid = []
+        errors = []
+        for number, raw in batch:
+            try:
+                if isinstance(raw, Exception):
+                    raise raw
+                record = IssueImportRecord.model_validate(raw)
+                assignee_id = self._resolve_user(record.assignee_email)
+                reporter_id = (
+                    self._resolve_user(record.reporter_email)
+                    or self.default_reporter_id
+                )
+                valid.append((record, assignee_id, reporter_id))
+            except (ValidationError, ValueError) as e:
+                errors.append({"record": number, "error": str(e)})
+
+        if valid:
+            await self._ensure_tags(
+                name for record, _, _ in valid for name in record.tags
+            )
+            # Reserve ids up front so issue_tags can be copied alongside
+            id_result = await self.db.execute(
+                select(func.nextval("issues_id_seq")).select_from(
+                    func.generate_series(1, len(valid))
+                )
+            )
+            ids = [row[0] for row in id_result]
+
+            issue_rows = []
+            tag_rows = []
+            for issue_id, (record, assignee_id, reporter_id) in zip(ids, valid):
+                created_at = record.created_at or now
+                issue_rows.append(
+                    (
+                        issue_id,
+                        record.title,
+                        record.description,
+                        record.status.value,
+                        record.priority.value,
+                        assignee_id,
+                        reporter_id,
+                        created_at,
+                        record.updated_at or created_at,
+                    )
+                )
+                for tag_id in {self.tag_ids[name] for name in record.tags}:
+                    tag_rows.append((issue_id, tag_id))
+
+            connection = await self.db.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver = raw_connection.driver_connection
+            await driver.copy_records_to_table(
+                "issues", records=issue_rows, columns=ISSUE_COPY_COLUMNS
+            )
+            if tag_rows:
+                await driver.copy_records_to_table(
+                    "issue_tags", records=tag_rows, columns=["issue_id", "tag_id"]
+                )
+            if self.collect_ids:
+                self.imported_ids.extend(ids)
+            self.imported_mix.update(
+                (record.status.value, record.priority.value) for record, _, _ in valid
+            )
+
+        job.processed_count = batch[-1][0]
+        job.imported_count += len(valid)
+        job.failed_count += len(errors)
+        kept = job.errors or []
+        if errors and len(kept) < MAX_JOB_ERRORS:
+            job.errors = kept + errors[: MAX_JOB_ERRORS - len(kept)]
+        await self.db.commit()
+
+        if self.progress:
+            self.progress(job)
+
+
+async def run_import_job(
+    job_id: int,
+    path: str,
+    fmt: ImportFormat,
+    default_reporter_id: int,
+    batch_size: int = 5000,
+    enhance: bool = False,
+) -> None:
+    """Background half of an HTTP import: load the spooled file into a job
+    started by the request, announce the result, then optionally enhance"""
+    try:
+        async with AsyncSessionLocal() as session:
+            importer = IssueImporter(
+                session,
+                default_reporter_id=default_reporter_id,
+                batch_size=batch_size,
+                collect_ids=enhance,
+            )
+            job = await session.get(ImportJob, job_id)
+            lines = await asyncio.to_thread(open, path, encoding="utf-8", newline="")
+            try:
+                await importer.load(job, lines, fmt)
+            except Exception as e:
+                # Recorded on the job; batches committed so far still count
+                logger.error(f"Import job {job_id} failed: {e}")
+            finally:
+                lines.close()
+            await importer.announce()
+    finally:
+        os.unlink(path)
+
+    if enhance and importer.imported_ids:
+        await enhance_imported_issues(importer.imported_ids)
+
+
+async def enhance_imported_issues(issue_ids: List[int], concurrency: int = 4) -> int:
+    """Deferred AI pass over imported issues that have no enhanced description"""
+    from app.services.ai import AIDescriptionEnhancer
+
+    enhancer = AIDescriptionEnhancer()
+    semaphore = asyncio.Semaphore(concurrency)
+    enhanced = 0
+
+    async def enhance(issue_id: int, description: str) -> Optional[Tuple[int, str]]:
+        async with semaphore:
+            try:
+                result = await enhancer.enhance_description(description)
+                return issue_id, result["enhanced_text"]
+            except Exception as e:
+                logger.error(f"AI enhancement failed for issue {issue_id}: {e}")
+                return None
+
+    for start in range(0, len(issue_ids), 100):
+        chunk = issue_ids[start : start + 100]
+        # Read without holding a connection while the LLM calls are in flight
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Issue.id, Issue.description).where(
+                    Issue.id.in_(chunk), Issue.enhanced_description.is_(None)
+                )
+            )
+            pending = result.fetchall()
+
+        results = await asyncio.gather(
+            *(enhance(row.id, row.description) for row in pending)
+        )
+        done = [item for item in results if item]
+        if not done:
+            continue
+
+        async with AsyncSessionLocal() as session:
+            for issue_id, text in done:
+                await session.execute(
+                    update(Issue)
+                    .where(Issue.id == issue_id)
+                    .values(enhanced_description=text)
+                )
+            await session.commit()
+        enhanced += len(done)
+
+    return enhanced
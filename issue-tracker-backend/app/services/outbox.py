@@ -0,0 +1,317 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.models.outbox import OutboxEvent
+from app.models.issue import IssueStatus, IssuePriority
+from app.graphql.types import (
+    CommentType,
+    IssueType,
+    PriorityCountDeltaType,
+    StatsDeltaType,
+    StatusCountDeltaType,
+    TagType,
+)
+from app.services.pubsub import pubsub
+from app.services.websocket import websocket_manager, EventType
+
+logger = logging.getLogger(__name__)
+
+# Carries the ids of each newly published batch to every app instance
+NOTIFY_CHANNEL = "outbox_events"
+
+
+def issue_event_payload(issue: IssueType) -> Dict[str, Any]:
+    """Snapshot of an issue for the outbox (the JSON column encodes datetimes)"""
+    return {
+        "id": issue.id,
+        "title": issue.title,
+        "description": issue.description,
+        "enhanced_description": issue.enhanced_description,
+        "status": getattr(issue.status, "value", issue.status),
+        "priority": getattr(issue.priority, "value", issue.priority),
+        "assignee_id": issue.assignee_id,
+        "reporter_id": issue.reporter_id,
+        "created_at": issue.created_at,
+        "updated_at": issue.updated_at,
+        "comment_count": issue.comment_count,
+        "tags": [
+            {"id": tag.id, "name": tag.name, "color": tag.color} for tag in issue.tags
+        ],
+    }
+
+
+def issue_from_payload(payload: Dict[str, Any]) -> IssueType:
+    return IssueType(
+        id=payload["id"],
+        title=payload["title"],
+        description=payload["description"],
+        enhanced_description=payload["enhanced_description"],
+        status=IssueStatus(payload["status"]),
+        priority=IssuePriority(payload["priority"]),
+        assignee_id=payload["assignee_id"],
+        reporter_id=payload["reporter_id"],
+        created_at=datetime.fromisoformat(payload["created_at"]),
+        updated_at=datetime.fromisoformat(payload["updated_at"]),
+        tags=[TagType(**tag) for tag in payload["tags"]],
+        comment_count=payload.get("comment_count", 0),
+    )
+
+
+def comment_event_payload(comment: CommentType) -> Dict[str, Any]:
+    return {
+        "id": comment.id,
+        "issue_id": comment.issueId,
+        "user_id": comment.userId,
+        "content": comment.content,
+        "created_at": comment.createdAt,
+    }
+
+
+def comment_from_payload(payload: Dict[str, Any]) -> CommentType:
+    return CommentType(
+        id=payload["id"],
+        issueId=payload["issue_id"],
+        userId=payload["user_id"],
+        content=payload["content"],
+        createdAt=datetime.fromisoformat(payload["created_at"]),
+    )
+
+
+# (old, new) counted values of one issue: status / priority, None for the
+# side that doesn't exist (created or deleted issue)
+IssueChange = Tuple[Optional[Mapping[str, Any]], Optional[Mapping[str, Any]]]
+
+
+def stats_delta_payload(changes: Iterable[IssueChange]) -> Optional[Dict[str, Any]]:
+    """Net counter changes for a set of issue writes; None if nothing moved"""
+    total = 0
+    counters = {"status": Counter(), "priority": Counter()}
+    for old, new in changes:
+        total += (new is not None) - (old is not None)
+        for column, counter in counters.items():
+            if old is not None:
+                counter[getattr(old[column], "value", old[column])] -= 1
+            if new is not None:
+                counter[getattr(new[column], "value", new[column])] += 1
+    payload = {
+        column: {key: delta for key, delta in counter.items() if delta}
+        for column, counter in counters.items()
+    }
+    if not total and not any(payload.values()):
+        return None
+    return dict(payload, total=total)
+
+
+def stats_delta_from_payload(payload: Dict[str, Any], event_id: str) -> StatsDeltaType:
+    return StatsDeltaType(
+        event_id=event_id,
+        total=payload["total"],
+        statuses=[
+            StatusCountDeltaType(status=IssueStatus(status), delta=delta)
+            for status, delta in payload["status"].items()
+        ],
+        priorities=[
+            PriorityCountDeltaType(priority=IssuePriority(priority), delta=delta)
+            for priority, delta in payload["priority"].items()
+        ],
+    )
+
+
+class OutboxService:
+    @staticmethod
+    def add_event(
+        db: AsyncSession, event_type: EventType, payload: Dict[str, Any]
+    ) -> OutboxEvent:
+        """Stage an event in the caller's transaction; it is relayed after commit"""
+        event = OutboxEvent(topic=event_type.value, payload=payload)
+        db.add(event)
+        return event
+
+    @staticmethod
+    def add_stats_delta(db: AsyncSession, changes: Iterable[IssueChange]) -> None:
+        """Stage a ``stats_changed`` event for the counters these writes moved.
+
+        Computed once here and fanned out as-is, so report viewers apply a
+        small delta instead of each refetching the full stats.
+        """
+        payload = stats_delta_payload(changes)
+        if payload is not None:
+            OutboxService.add_event(db, EventType.STATS_CHANGED, payload)
+
+
+class OutboxRelay:
+    """Publishes committed outbox events and fans them out in every process.
+
+    One instance at a time claims a batch of pending events, marks it
+    published and sends its ids on ``NOTIFY outbox_events``, all in one
+    transaction. Every instance LISTENs on that channel, so each worker's
+    GraphQL subscriptions and /ws clients receive every event after it is
+    published, and no row lock is held while sending. Notifications sent
+    while a listener is reconnecting are lost; that worker's /ws clients are
+    told to resync.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL,
+        retention: timedelta = timedelta(hours=settings.OUTBOX_RETENTION_HOURS),
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._wakeup = asyncio.Event()
+        self._received: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    def notify(self) -> None:
+        """Wake the relay after a commit instead of waiting for the next poll"""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self.listen()),
+                asyncio.create_task(self.fan_out()),
+                asyncio.create_task(self.run()),
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def run(self) -> None:
+        while True:
+            try:
+                while await self.publish() == self.batch_size:
+                    pass
+            except Exception as e:
+                logger.error(f"Outbox relay error: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                await self.purge_published()
+            self._wakeup.clear()
+
+    async def publish(self) -> int:
+        """Mark one batch of pending events published and announce their ids
+        to every instance on commit; returns how many were claimed"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(OutboxEvent.id)
+                .where(OutboxEvent.published_at.is_(None))
+                .order_by(OutboxEvent.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            ids = result.scalars().all()
+            if not ids:
+                return 0
+
+            await session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(ids))
+                .values(published_at=func.now())
+            )
+            # Delivered to all listeners at commit, or not at all on rollback
+            await session.execute(
+                select(func.pg_notify(NOTIFY_CHANNEL, ",".join(map(str, ids))))
+            )
+            await session.commit()
+            return len(ids)
+
+    async def listen(self) -> None:
+        """Hold a LISTEN connection, reopening it if it drops"""
+        reconnect = False
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    raw_connection = await connection.get_raw_connection()
+                    conn = raw_connection.driver_connection
+                    await conn.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                    try:
+                        if reconnect:
+                            await websocket_manager.request_resync(
+                                "Real-time updates were interrupted"
+                            )
+                        reconnect = True
+                        while not conn.is_closed():
+                            await asyncio.sleep(self.poll_interval)
+                    finally:
+                        if not conn.is_closed():
+                            await conn.remove_listener(NOTIFY_CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox listener error: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        self._received.put_nowait([int(event_id) for event_id in payload.split(",")])
+
+    async def fan_out(self) -> None:
+        """Send each announced batch to this process's subscribers"""
+        while True:
+            ids = await self._received.get()
+            try:
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(
+                        select(OutboxEvent)
+                        .where(OutboxEvent.id.in_(ids))
+                        .order_by(OutboxEvent.id)
+                    )
+                    events = result.scalars().all()
+                for event in events:
+                    await self.dispatch(event)
+            except Exception as e:
+                logger.error(f"Outbox fan-out error: {e}")
+
+    async def dispatch(self, event: OutboxEvent) -> None:
+        event_type = EventType(event.topic)
+        data = dict(event.payload, event_id=event.event_id)
+        if event_type in (EventType.ISSUE_CREATED, EventType.ISSUE_UPDATED):
+            await pubsub.publish(event.topic, issue_from_payload(event.payload))
+        elif event_type == EventType.ISSUES_BATCH_UPDATED:
+            await pubsub.publish(
+                event.topic,
+                [issue_from_payload(issue) for issue in event.payload["issues"]],
+            )
+        elif event_type == EventType.COMMENT_ADDED:
+            await pubsub.publish(
+                f"{event.topic}_{event.payload['issue_id']}",
+                comment_from_payload(event.payload),
+            )
+        elif event_type == EventType.STATS_CHANGED:
+            await pubsub.publish(
+                event.topic, stats_delta_from_payload(event.payload, event.event_id)
+            )
+        await websocket_manager.broadcast_to_all(event_type, data)
+
+    async def purge_published(self) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    delete(OutboxEvent).where(
+                        OutboxEvent.published_at < func.now() - self.retention
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Outbox purge error: {e}")
+
+
+# Global instance
+outbox_relay = OutboxRelay()
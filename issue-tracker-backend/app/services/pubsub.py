@@ -0,0 +1,29 @@
+import asyncio
+
+
+class SimplePubSub:
+    def __init__(self):
+        self.queues = {}
+
+    def get_queue(self, topic):
+        if topic not in self.queues:
+            self.queues[topic] = []
+        return self.queues[topic]
+
+    async def publish(self, topic, message):
+        queues = self.get_queue(topic)
+        for queue in queues:
+            await queue.put(message)
+
+    async def subscribe(self, topic):
+        queue = asyncio.Queue()
+        self.get_queue(topic).append(queue)
+        try:
+            while True:
+                message = await queue.get()
+                yield message
+        finally:
+            self.get_queue(topic).remove(queue)
+
+
+pubsub = SimplePubSub()
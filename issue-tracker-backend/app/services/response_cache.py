@@ -0,0 +1,204 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.entity_versions import EntityVersionService
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryCacheBackend:
+    """Bounded LRU of response data with a tag -> keys index"""
+
+    def __init__(self, size: int, ttl: int):
+        self.size = size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._tag_keys: Dict[str, Set[str]] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, data, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    async def set(self, key: str, data: Any, tags: Iterable[str]) -> None:
+        tags = tuple(tags)
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, data, tags)
+        for tag in tags:
+            self._tag_keys.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.size:
+            self._remove(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._tag_keys.pop(tag, set()):
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+
+class RedisCacheBackend:
+    """Shared backend so every worker reuses the same entries"""
+
+    prefix = "gql-cache"
+
+    def __init__(self, url: str, ttl: int):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_URL is set but the redis package is not installed"
+            ) from e
+        self.redis = redis.from_url(url)
+        self.ttl = ttl
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.redis.get(f"{self.prefix}:entry:{key}")
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, data: Any, tags: Iterable[str]) -> None:
+        entry_key = f"{self.prefix}:entry:{key}"
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(entry_key, json.dumps(data), ex=self.ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), entry_key)
+                pipe.expire(self._tag_key(tag), self.ttl)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            keys = await self.redis.smembers(tag_key)
+            await self.redis.delete(tag_key, *keys)
+
+
+class ResponseCache:
+    """Shared cache of GraphQL response data, checked against table versions.
+
+    Each entry records the ``entity_versions`` of the tables it was built
+    from and is only served while they are unchanged. Triggers advance those
+    versions on every committed write, whichever worker, REST route or
+    script made it, so a write anywhere retires the entries that read the
+    table. ``invalidate`` only evicts them early.
+
+    Concurrent misses for the same key and versions are single-flighted:
+    one request executes, the rest wait for its result. A result is only
+    stored if the versions didn't move while it was being computed.
+    """
+
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self._inflight: Dict[Tuple[str, Any], asyncio.Future] = {}
+
+    async def versions(self, tags: Iterable[str]) -> Optional[Tuple[int, ...]]:
+        """Committed versions of ``tags`` on the primary; None if unavailable"""
+        tags = sorted(tags)
+        try:
+            async with AsyncSessionLocal() as session:
+                versions = await EntityVersionService.get_versions(session, tags)
+        except Exception as e:
+            logger.error(f"Response cache version lookup failed: {e}")
+            return None
+        return tuple(versions.get(tag, (0, None))[0] for tag in tags)
+
+    async def get(self, key: str, versions: Optional[Tuple[int, ...]]) -> Optional[Any]:
+        """The entry for ``key`` if it was built at ``versions``"""
+        if versions is None:
+            return None
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Response cache read failed: {e}")
+            return None
+        if entry is None or tuple(entry["versions"]) != versions:
+            return None
+        return entry["data"]
+
+    async def wait_inflight(
+        self, key: str, versions: Optional[Tuple[int, ...]]
+    ) -> Tuple[bool, Optional[Any]]:
+        """Wait for a leader computing ``key`` at ``versions``; returns (waited, data)
+
+        A leader that started before a write the caller has seen is not
+        joined, since its result may predate that write.
+        """
+        future = self._inflight.get((key, versions))
+        if future is None:
+            return False, None
+        return True, await asyncio.shield(future)
+
+    def begin(self, key: str, versions: Optional[Tuple[int, ...]]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[(key, versions)] = future
+
+    async def finish(
+        self,
+        key: str,
+        tags: Iterable[str],
+        versions: Optional[Tuple[int, ...]],
+        data: Optional[Any],
+        store: bool = True,
+    ) -> None:
+        """Release waiters on ``key``; ``store`` False shares without caching"""
+        future = self._inflight.pop((key, versions), None)
+        try:
+            if store and data is not None and versions is not None:
+                if await self.versions(tags) == versions:
+                    entry = {"versions": list(versions), "data": data}
+                    await self.backend.set(key, entry, tags)
+        except Exception as e:
+            logger.error(f"Response cache write failed: {e}")
+        finally:
+            if future is not None and not future.done():
+                future.set_result(data)
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        tags = set(tags)
+        if not tags:
+            return
+        try:
+            await self.backend.invalidate(tags)
+        except Exception as e:
+            logger.error(f"Response cache invalidation failed: {e}")
+
+
+def _create_cache() -> ResponseCache:
+    if settings.RESPONSE_CACHE_URL:
+        backend = RedisCacheBackend(
+            settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_TTL
+        )
+    else:
+        backend = InMemoryCacheBackend(
+            settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL
+        )
+    return ResponseCache(backend, enabled=settings.RESPONSE_CACHE_ENABLED)
+
+
+# Global instance
+response_cache = _create_cache()
@@ -0,0 +1,352 @@
+import asyncio
+import enum
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Date, cast, func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.rollup import IssueDailyRollup
+from app.models.tag import Tag
+from app.models.user import User
+from app.services.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+R = IssueDailyRollup
+
+STATE_NAME = "issue_daily"
+DEFAULT_SERIES_DAYS = 90
+
+
+class ReportMetric(str, enum.Enum):
+    CREATED = "created"
+    RESOLVED = "resolved"
+    # Backlog level: a running sum of the stored deltas
+    OPEN = "open"
+
+
+class ReportGroupBy(str, enum.Enum):
+    NONE = "all"
+    STATUS = "status"
+    PRIORITY = "priority"
+    ASSIGNEE = "assignee"
+    TAG = "tag"
+
+
+class ReportBucket(str, enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+# Turns the issue_status_transitions matching {where} into rollup deltas
+# and adds them in. Every transition contributes +1 to its to_status and -1 to its
+# from_status while those are open, so per status that's the backlog change
+# and summed over statuses it's the open/done flip of the issue.
+# Priority, assignee and tags are read as they are now; the nightly rebuild
+# re-attributes history after they change.
+APPLY_TRANSITIONS_SQL = """
+    WITH t AS (
+        SELECT issue_id,
+               (changed_at AT TIME ZONE 'UTC')::date AS day,
+               from_status::text AS from_status,
+               to_status::text AS to_status
+        FROM issue_status_transitions
+        WHERE {where}
+    ),
+    events AS (
+        SELECT issue_id, day, 'created' AS metric, to_status AS status, 1 AS delta
+        FROM t WHERE from_status IS NULL
+        UNION ALL
+        SELECT issue_id, day, 'resolved', to_status, 1
+        FROM t
+        WHERE to_status IN ('RESOLVED', 'CLOSED')
+          AND (from_status IS NULL OR from_status NOT IN ('RESOLVED', 'CLOSED'))
+        UNION ALL
+        SELECT issue_id, day, 'open', to_status, 1
+        FROM t WHERE to_status NOT IN ('RESOLVED', 'CLOSED')
+        UNION ALL
+        SELECT issue_id, day, 'open', from_status, -1
+        FROM t WHERE from_status NOT IN ('RESOLVED', 'CLOSED')
+    ),
+    deltas AS (
+        SELECT metric, 'all' AS dimension, day, '' AS value, delta FROM events
+        UNION ALL
+        SELECT metric, 'status', day, status, delta FROM events
+        UNION ALL
+        SELECT e.metric, 'priority', e.day, i.priority::text, e.delta
+        FROM events e JOIN issues i ON i.id = e.issue_id
+        UNION ALL
+        SELECT e.metric, 'assignee', e.day, coalesce(i.assignee_id::text, 'none'), e.delta
+        FROM events e JOIN issues i ON i.id = e.issue_id
+        UNION ALL
+        SELECT e.metric, 'tag', e.day, coalesce(it.tag_id::text, 'none'), e.delta
+        FROM events e LEFT JOIN issue_tags it ON it.issue_id = e.issue_id
+    )
+    INSERT INTO issue_daily_rollups (metric, dimension, day, value, count)
+    SELECT metric, dimension, day, value, sum(delta)
+    FROM deltas
+    GROUP BY metric, dimension, day, value
+    HAVING sum(delta) <> 0
+    ON CONFLICT (metric, dimension, day, value)
+    DO UPDATE SET count = issue_daily_rollups.count + EXCLUDED.count
+"""
+APPLY_CLAIMED_SQL = text(APPLY_TRANSITIONS_SQL.format(where="id = ANY(:ids)"))
+APPLY_ALL_SQL = text(APPLY_TRANSITIONS_SQL.format(where="rolled_up"))
+
+# Takes every transition committed since the last run, however old its id.
+# Rows of transactions still in flight are invisible here and stay pending.
+CLAIM_PENDING_SQL = text("""
+    UPDATE issue_status_transitions SET rolled_up = true
+    WHERE NOT rolled_up
+    RETURNING id
+""")
+
+# One refresh / rebuild at a time across all app instances
+LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('issue_daily_rollups'))")
+
+
+def bucket_start(day: date, bucket: ReportBucket) -> date:
+    if bucket == ReportBucket.WEEK:
+        return day - timedelta(days=day.weekday())
+    if bucket == ReportBucket.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start: date, bucket: ReportBucket) -> date:
+    if bucket == ReportBucket.WEEK:
+        return start + timedelta(days=7)
+    if bucket == ReportBucket.MONTH:
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def series_range(start: Optional[date], end: Optional[date]) -> Tuple[date, date]:
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=DEFAULT_SERIES_DAYS)
+    return start, end
+
+
+class RollupService:
+    """Maintains and reads ``issue_daily_rollups``.
+
+    The change log is ``issue_status_transitions``: ``refresh`` applies the
+    rows not yet flagged ``rolled_up``, ``rebuild`` recomputes the table
+    from all of it (backfill, and the nightly compaction that drops deltas
+    of deleted issues and re-attributes changed assignees/tags).
+    """
+
+    @staticmethod
+    async def _watermark(db: AsyncSession) -> Optional[int]:
+        result = await db.execute(
+            text("SELECT last_transition_id FROM rollup_state WHERE name = :name"),
+            {"name": STATE_NAME},
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def _save_state(db: AsyncSession, upto: int, rebuilt: bool) -> None:
+        await db.execute(
+            text(f"""
+                INSERT INTO rollup_state (name, last_transition_id, refreshed_at, rebuilt_at)
+                VALUES (:name, :upto, now(), {"now()" if rebuilt else "NULL"})
+                ON CONFLICT (name) DO UPDATE
+                SET last_transition_id = EXCLUDED.last_transition_id,
+                    refreshed_at = EXCLUDED.refreshed_at
+                    {", rebuilt_at = EXCLUDED.rebuilt_at" if rebuilt else ""}
+            """),
+            {"name": STATE_NAME, "upto": upto},
+        )
+
+    @staticmethod
+    async def rebuild_due(db: AsyncSession, hour: int) -> bool:
+        """True once ``hour`` (UTC) has passed today without a rebuild"""
+        result = await db.execute(
+            text("SELECT rebuilt_at FROM rollup_state WHERE name = :name"),
+            {"name": STATE_NAME},
+        )
+        rebuilt_at = result.scalar_one_or_none()
+        now = datetime.now(timezone.utc)
+        if now.hour < hour:
+            return False
+        return (
+            rebuilt_at is None
+            or rebuilt_at.astimezone(timezone.utc).date() < now.date()
+        )
+
+    @staticmethod
+    async def refresh(db: AsyncSession) -> Optional[int]:
+        """Apply new transitions; returns the highest id applied, or None if
+        nothing was applied (no new transitions, or another instance holds
+        the lock). A table that was never built is rebuilt instead.
+        """
+        if not (await db.execute(LOCK_SQL)).scalar():
+            return None
+        if await RollupService._watermark(db) is None:
+            return await RollupService._rebuild_locked(db)
+        ids = (await db.execute(CLAIM_PENDING_SQL)).scalars().all()
+        if not ids:
+            return None
+        await db.execute(APPLY_CLAIMED_SQL, {"ids": ids})
+        await RollupService._save_state(db, max(ids), rebuilt=False)
+        await db.commit()
+        return max(ids)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> Optional[int]:
+        """Recompute every rollup from the transition log in one transaction"""
+        if not (await db.execute(LOCK_SQL)).scalar():
+            return None
+        return await RollupService._rebuild_locked(db)
+
+    @staticmethod
+    async def _rebuild_locked(db: AsyncSession) -> int:
+        # Rows committed after the claim stay pending for the next refresh
+        await db.execute(CLAIM_PENDING_SQL)
+        upto = (
+            await db.execute(
+                text(
+                    "SELECT coalesce(max(id), 0) FROM issue_status_transitions "
+                    "WHERE rolled_up"
+                )
+            )
+        ).scalar()
+        # DELETE rather than TRUNCATE: readers keep seeing the old rows until
+        # commit instead of queueing behind an exclusive lock
+        await db.execute(text("DELETE FROM issue_daily_rollups"))
+        await db.execute(APPLY_ALL_SQL)
+        await RollupService._save_state(db, upto, rebuilt=True)
+        await db.commit()
+        return upto
+
+    @staticmethod
+    async def series(
+        db: AsyncSession,
+        metric: ReportMetric,
+        group_by: ReportGroupBy,
+        start: date,
+        end: date,
+        bucket: ReportBucket,
+    ) -> Dict[str, List[Tuple[date, int]]]:
+        """Zero-filled points per group value for [start, end] (inclusive).
+
+        CREATED / RESOLVED sum the days of each bucket; OPEN is the backlog
+        at the end of each bucket.
+        """
+        first = bucket_start(start, bucket)
+        buckets = []
+        current = first
+        while current <= end:
+            buckets.append(current)
+            current = next_bucket(current, bucket)
+
+        period = cast(
+            func.date_trunc(literal_column(f"'{bucket.value}'"), R.day), Date
+        ).label("bucket_start")
+        scope = (R.metric == metric.value, R.dimension == group_by.value)
+        result = await db.execute(
+            select(R.value, period, func.sum(R.count).label("total"))
+            .where(*scope, R.day >= first, R.day <= end)
+            .group_by(R.value, period)
+        )
+        totals: Dict[str, Dict[date, int]] = {}
+        for row in result.fetchall():
+            totals.setdefault(row.value, {})[row.bucket_start] = int(row.total)
+
+        levels: Dict[str, int] = {}
+        if metric == ReportMetric.OPEN:
+            result = await db.execute(
+                select(R.value, func.sum(R.count).label("total"))
+                .where(*scope, R.day < first)
+                .group_by(R.value)
+            )
+            levels = {row.value: int(row.total) for row in result.fetchall()}
+
+        series = {}
+        for value in sorted(set(totals) | set(levels)):
+            level = levels.get(value, 0)
+            points = []
+            for period_start in buckets:
+                count = totals.get(value, {}).get(period_start, 0)
+                if metric == ReportMetric.OPEN:
+                    level += count
+                    count = level
+                points.append((period_start, count))
+            if any(count for _, count in points):
+                series[value] = points
+        return series
+
+    @staticmethod
+    async def labels(
+        db: AsyncSession, group_by: ReportGroupBy, values: List[str]
+    ) -> Dict[str, str]:
+        """Display names for group values (ids of users / tags)"""
+        if group_by == ReportGroupBy.NONE:
+            return {"": "All issues"}
+        labels = {
+            "none": "Unassigned" if group_by == ReportGroupBy.ASSIGNEE else "None"
+        }
+        ids = [int(value) for value in values if value.isdigit()]
+        if ids and group_by == ReportGroupBy.ASSIGNEE:
+            result = await db.execute(
+                select(User.id, User.username).where(User.id.in_(ids))
+            )
+            labels.update({str(row.id): row.username for row in result.fetchall()})
+        elif ids and group_by == ReportGroupBy.TAG:
+            result = await db.execute(select(Tag.id, Tag.name).where(Tag.id.in_(ids)))
+            labels.update({str(row.id): row.name for row in result.fetchall()})
+        return labels
+
+
+class RollupWorker:
+    """Keeps the rollups current: a refresh every ``interval`` seconds and a
+    full rebuild once a day after ``rebuild_hour`` (UTC)."""
+
+    def __init__(
+        self,
+        interval: float = settings.ROLLUP_REFRESH_INTERVAL,
+        rebuild_hour: int = settings.ROLLUP_REBUILD_HOUR_UTC,
+    ):
+        self.interval = interval
+        self.rebuild_hour = rebuild_hour
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Rollup refresh error: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def tick(self) -> None:
+        # The last rebuild is read from rollup_state, so restarts and other
+        # instances don't repeat it
+        async with AsyncSessionLocal() as session:
+            if await RollupService.rebuild_due(session, self.rebuild_hour):
+                upto = await RollupService.rebuild(session)
+            else:
+                upto = await RollupService.refresh(session)
+        if upto is not None:
+            # Cached reportSeries results are tagged with this table
+            await response_cache.invalidate(("issue_daily_rollups",))
+
+
+# Global instance
+rollup_worker = RollupWorker()
@@ -1,18 +1,35 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from app.models.user_activity import UserActivity, ActivityType
+from sqlalchemy import Column, Date, cast, select, func, tuple_, union_all
+from sqlalchemy.engine import Row
+from app.models.user_activity import UserActivity, UserActivityMonthly, ActivityType
 from app.models.user import User
 from app.models.issue import Issue
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+from datetime import date, datetime, timedelta, timezone
 import json
-from app.database import AsyncSessionLocal
+from app.database import ReadSessionLocal
 from app.graphql.types import UserRoleStats
+from app.utils.cursor import decode_cursor
+
+MAX_FEED_PAGE_SIZE = 100
+# Each user id / type is its own index range in the feed query
+MAX_FEED_FILTER_VALUES = 50
+
+# (created_at, id): position of an activity in the feed
+Position = Tuple[datetime, int]
+
+
+def decode_position(cursor: str) -> Position:
+    created_at, activity_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(activity_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
 
 
 class UserActivityService:
     @staticmethod
-    async def log_activity(
+    def add_activity(
         db: AsyncSession,
         user_id: int,
         activity_type: ActivityType,
@@ -21,7 +38,7 @@ class UserActivityService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ) -> UserActivity:
-        """Log a user activity"""
+        """Stage an activity in the caller's transaction without committing"""
         activity = UserActivity(
             user_id=user_id,
             activity_type=activity_type,
@@ -31,6 +48,22 @@ class UserActivityService:
             user_agent=user_agent,
         )
         db.add(activity)
+        return activity
+
+    @staticmethod
+    async def log_activity(
+        db: AsyncSession,
+        user_id: int,
+        activity_type: ActivityType,
+        description: str,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> UserActivity:
+        """Log a user activity"""
+        activity = UserActivityService.add_activity(
+            db, user_id, activity_type, description, details, ip_address, user_agent
+        )
         await db.commit()
         await db.refresh(activity)
         return activity
@@ -58,12 +91,136 @@ class UserActivityService:
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    async def feed(
+        db: AsyncSession,
+        columns: Sequence[Column],
+        limit: int,
+        after: Optional[Position] = None,
+        user_ids: Optional[Sequence[int]] = None,
+        types: Optional[Sequence[ActivityType]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[List[Row], bool]:
+        """Up to ``limit`` activities in [start, end) older than ``after``,
+        newest first, and whether more remain.
+
+        An IN list can't be read from an index in (created_at, id) order, so
+        every user id (or, without users, every type) gets its own ordered
+        and limited branch, and only those few rows are merged and sorted.
+        Each branch is a backward walk of a ``(…, created_at, id)`` index
+        from the cursor, so a page deep in the history costs the same as the
+        first one.
+        """
+        if (
+            len(user_ids or ()) > MAX_FEED_FILTER_VALUES
+            or len(types or ()) > MAX_FEED_FILTER_VALUES
+        ):
+            raise ValueError(
+                f"At most {MAX_FEED_FILTER_VALUES} user ids or types per query"
+            )
+        newest_first = (UserActivity.created_at.desc(), UserActivity.id.desc())
+        statement = select(*columns)
+        if start is not None:
+            statement = statement.where(UserActivity.created_at >= start)
+        if end is not None:
+            statement = statement.where(UserActivity.created_at < end)
+        if after is not None:
+            statement = statement.where(
+                # The plain bound lets the planner prune newer partitions,
+                # which it can't do from the row comparison
+                UserActivity.created_at <= after[0],
+                tuple_(UserActivity.created_at, UserActivity.id) < tuple_(*after),
+            )
+        if user_ids:
+            if types:
+                statement = statement.where(UserActivity.activity_type.in_(types))
+            branches = [
+                statement.where(UserActivity.user_id == user_id)
+                for user_id in dict.fromkeys(user_ids)
+            ]
+        elif types:
+            branches = [
+                statement.where(UserActivity.activity_type == activity_type)
+                for activity_type in dict.fromkeys(types)
+            ]
+        else:
+            branches = [statement]
+
+        branches = [
+            branch.order_by(*newest_first).limit(limit + 1) for branch in branches
+        ]
+        if len(branches) == 1:
+            result = await db.execute(branches[0])
+        else:
+            merged = union_all(*branches).subquery("feed")
+            result = await db.execute(
+                select(merged)
+                .order_by(merged.c.created_at.desc(), merged.c.id.desc())
+                .limit(limit + 1)
+            )
+        rows = result.fetchall()
+        return rows[:limit], len(rows) > limit
+
+    @staticmethod
+    async def monthly_counts(
+        db: AsyncSession, months: int, user_id: Optional[int] = None
+    ) -> List[Tuple[date, ActivityType, int]]:
+        """(month, type, count) for the last ``months`` months, oldest first.
+
+        Live partitions are counted (pruned to the range); expired ones come
+        from ``user_activity_monthly``. Partitions are whole UTC months, so
+        a month is never in both.
+        """
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        index = current.year * 12 + current.month - months
+        start = date(index // 12, index % 12 + 1, 1)
+
+        live_month = cast(
+            func.date_trunc("month", func.timezone("UTC", UserActivity.created_at)),
+            Date,
+        )
+        live = select(
+            live_month.label("month"),
+            UserActivity.activity_type.label("activity_type"),
+            func.count().label("count"),
+        ).where(
+            UserActivity.created_at
+            >= datetime(start.year, start.month, 1, tzinfo=timezone.utc)
+        )
+        rolled = select(
+            UserActivityMonthly.month.label("month"),
+            UserActivityMonthly.activity_type.label("activity_type"),
+            UserActivityMonthly.count.label("count"),
+        ).where(UserActivityMonthly.month >= start)
+        if user_id is not None:
+            live = live.where(UserActivity.user_id == user_id)
+            rolled = rolled.where(UserActivityMonthly.user_id == user_id)
+        live = live.group_by(live_month, UserActivity.activity_type)
+
+        combined = union_all(live, rolled).subquery("counts")
+        result = await db.execute(
+            select(
+                combined.c.month,
+                combined.c.activity_type,
+                func.sum(combined.c.count).label("count"),
+            )
+            .group_by(combined.c.month, combined.c.activity_type)
+            .order_by(combined.c.month, combined.c.activity_type)
+        )
+        return [
+            (row.month, ActivityType(row.activity_type), int(row.count))
+            for row in result.fetchall()
+        ]
+
     @staticmethod
     async def get_recent_activities(
         db: AsyncSession, days: int = 7, limit: int = 20
     ) -> List[UserActivity]:
         """Get recent activities across all users"""
-        cutoff_date = datetime.now() - timedelta(days=days)
+        # Bounded on the partition key, so only the newest monthly
+        # partitions of user_activities are planned and scanned
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
         query = (
             select(UserActivity)
@@ -92,7 +249,8 @@ class UserActivityService:
         reported_result = await db.execute(reported_query)
         reported_count = reported_result.scalar() or 0
 
-        # Get recent activities
+        # Get recent activities: with no DEFAULT partition the partitions are
+        # read newest-first and the scan stops once the LIMIT is filled
         activities_query = (
             select(UserActivity)
             .where(UserActivity.user_id == user_id)
@@ -111,12 +269,12 @@ class UserActivityService:
     @staticmethod
     async def get_team_activity_summary(db: AsyncSession) -> Dict[str, Any]:
         """Get team activity summary (safe: new session per query)"""
-        async with AsyncSessionLocal() as session:
+        async with ReadSessionLocal() as session:
             total_users_query = select(func.count(User.id))
             total_users_result = await session.execute(total_users_query)
             total_users = total_users_result.scalar() or 0
 
-        async with AsyncSessionLocal() as session:
+        async with ReadSessionLocal() as session:
             active_cutoff = datetime.now() - timedelta(days=30)
             active_users_query = select(func.count(User.id)).where(
                 User.last_login >= active_cutoff
@@ -124,7 +282,7 @@ class UserActivityService:
             active_users_result = await session.execute(active_users_query)
             active_users = active_users_result.scalar() or 0
 
-        async with AsyncSessionLocal() as session:
+        async with ReadSessionLocal() as session:
             month_start = datetime.now().replace(
                 day=1, hour=0, minute=0, second=0, microsecond=0
             )
@@ -134,7 +292,7 @@ class UserActivityService:
             new_users_result = await session.execute(new_users_query)
             new_users = new_users_result.scalar() or 0
 
-        async with AsyncSessionLocal() as session:
+        async with ReadSessionLocal() as session:
             role_query = select(User.role, func.count(User.id)).group_by(User.role)
             role_result = await session.execute(role_query)
             users_by_role = [
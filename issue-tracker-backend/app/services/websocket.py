@@ -1,24 +1,81 @@
-import json
 import asyncio
-from typing import Dict, Set, Any
+import uuid
+from collections import deque
+from typing import Dict, Set, Any, Deque, List, Optional
 from fastapi import WebSocket
 from enum import Enum
+from app.config import settings
+from app.utils.serialization import dumps
 
 
 class EventType(Enum):
     ISSUE_CREATED = "issue_created"
     ISSUE_UPDATED = "issue_updated"
     ISSUE_DELETED = "issue_deleted"
+    ISSUES_BATCH_UPDATED = "issues_batch_updated"
+    ISSUES_BATCH_DELETED = "issues_batch_deleted"
+    ISSUES_IMPORTED = "issues_imported"
+    STATS_CHANGED = "stats_changed"
+    COMMENT_ADDED = "comment_added"
     USER_LOGGED_IN = "user_logged_in"
     USER_LOGGED_OUT = "user_logged_out"
 
 
+class ReplayBuffer:
+    """Bounded per-topic history of broadcast events, keyed by sequence number.
+
+    Sequence numbers are only meaningful within this process, so they are
+    paired with ``boot``, a fresh id per buffer. A client resuming with
+    another worker's or an earlier process's boot id has to resync.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.boot = uuid.uuid4().hex
+        self.seq = 0
+        self.topics: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.evicted_seq: Dict[str, int] = {}  # topic -> highest evicted seq
+
+    def append(self, topic: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        self.seq += 1
+        message["seq"] = self.seq
+        if topic not in self.topics:
+            self.topics[topic] = deque()
+        events = self.topics[topic]
+        if len(events) >= self.size:
+            self.evicted_seq[topic] = events.popleft()["seq"]
+        events.append(message)
+        return message
+
+    def since(
+        self, last_seq: int, boot: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Events after last_seq in order, or None if they can't be replayed.
+
+        That is when ``boot`` names another buffer, or part of the gap was
+        evicted.
+        """
+        if boot != self.boot or last_seq > self.seq:
+            return None
+        if any(evicted > last_seq for evicted in self.evicted_seq.values()):
+            return None
+        missed = [
+            message
+            for events in self.topics.values()
+            for message in events
+            if message["seq"] > last_seq
+        ]
+        missed.sort(key=lambda message: message["seq"])
+        return missed
+
+
 class WebSocketManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self.user_connections: Dict[str, Set[str]] = (
             {}
         )  # user_id -> set of connection_ids
+        self.replay_buffer = ReplayBuffer(settings.WS_REPLAY_BUFFER_SIZE)
 
     async def connect(self, websocket: WebSocket, user_id: str = None):
         await websocket.accept()
@@ -32,7 +89,7 @@ class WebSocketManager:
 
         # Send welcome message
         await websocket.send_text(
-            json.dumps(
+            dumps(
                 {
                     "type": "connection_established",
                     "message": "Connected to real-time updates",
@@ -54,16 +111,21 @@ class WebSocketManager:
 
     async def broadcast_to_all(self, event_type: EventType, data: Any):
         """Broadcast to all connected clients"""
-        message = {
-            "type": event_type.value,
-            "data": data,
-            "timestamp": asyncio.get_event_loop().time(),
-        }
+        message = self.replay_buffer.append(
+            event_type.value,
+            {
+                "type": event_type.value,
+                "data": data,
+                "timestamp": asyncio.get_event_loop().time(),
+            },
+        )
 
+        # Encode once, not once per connection
+        text = dumps(message)
         disconnected = []
         for connection_id, websocket in self.active_connections.items():
             try:
-                await websocket.send_text(json.dumps(message))
+                await websocket.send_text(text)
             except Exception as e:
                 print(f"Error sending to connection {connection_id}: {e}")
                 disconnected.append(connection_id)
@@ -83,13 +145,12 @@ class WebSocketManager:
             "timestamp": asyncio.get_event_loop().time(),
         }
 
+        text = dumps(message)
         disconnected = []
         for connection_id in self.user_connections[user_id]:
             if connection_id in self.active_connections:
                 try:
-                    await self.active_connections[connection_id].send_text(
-                        json.dumps(message)
-                    )
+                    await self.active_connections[connection_id].send_text(text)
                 except Exception as e:
                     print(
                         f"Error sending to user {user_id} connection {connection_id}: {e}"
@@ -114,11 +175,66 @@ class WebSocketManager:
         }
 
         try:
-            await self.active_connections[connection_id].send_text(json.dumps(message))
+            await self.active_connections[connection_id].send_text(dumps(message))
         except Exception as e:
             print(f"Error sending personal message to {connection_id}: {e}")
             self.disconnect(connection_id)
 
+    async def resume(
+        self,
+        connection_id: str,
+        websocket: WebSocket,
+        last_seq: int,
+        boot: Optional[str] = None,
+    ):
+        """Replay the events a reconnecting client missed, then register it.
+
+        The connection is only added to active_connections once a replay pass
+        finds nothing new, so live broadcasts can never overtake replayed ones.
+        """
+        while True:
+            missed = self.replay_buffer.since(last_seq, boot)
+            if missed is None:
+                self.active_connections[connection_id] = websocket
+                await websocket.send_text(
+                    dumps(
+                        {
+                            "type": "resync_required",
+                            "message": "Missed events are no longer available",
+                            "seq": self.replay_buffer.seq,
+                            "boot": self.replay_buffer.boot,
+                        }
+                    )
+                )
+                return
+            if not missed:
+                self.active_connections[connection_id] = websocket
+                return
+            for message in missed:
+                await websocket.send_text(dumps(message))
+                last_seq = message["seq"]
+
+    async def request_resync(self, message: str):
+        """Tell every client to refetch, when events may have been missed"""
+        text = dumps(
+            {
+                "type": "resync_required",
+                "message": message,
+                "seq": self.replay_buffer.seq,
+                "boot": self.replay_buffer.boot,
+            }
+        )
+        disconnected = []
+        for connection_id, websocket in self.active_connections.items():
+            try:
+                await websocket.send_text(text)
+            except Exception as e:
+                print(f"Error sending to connection {connection_id}: {e}")
+                disconnected.append(connection_id)
+
+        for connection_id in disconnected:
+            self.disconnect(connection_id)
+
     def get_connection_count(self) -> int:
         return len(self.active_connections)
 
@@ -0,0 +1,314 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.issue import Issue, issue_tags
+from app.models.tag import Tag
+from app.models.user import User
+
+# Mutations here lean on RETURNING and on the database's own constraints
+# instead of SELECT-before-write checks, so each one costs one or two round
+# trips. Nothing is committed; callers add their outbox events / activity
+# rows to the same transaction and commit once.
+
+issues_table = Issue.__table__
+tags_table = Tag.__table__
+users_table = User.__table__
+
+
+class UniqueViolation(ValueError):
+    """A write hit a unique constraint; ``column`` names the offending column"""
+
+    def __init__(self, column: Optional[str]):
+        self.column = column
+        super().__init__(f"{column or 'value'} already taken")
+
+
+class ReferencedRow(ValueError):
+    """A delete was refused by a foreign key that still points at the row"""
+
+    def __init__(self, constraint: str):
+        self.constraint = constraint
+        super().__init__(f"still referenced ({constraint})")
+
+
+def _constraint_name(error: IntegrityError) -> str:
+    # asyncpg attaches the constraint to the driver exception
+    cause = getattr(error.orig, "__cause__", None)
+    return getattr(cause, "constraint_name", None) or str(error.orig)
+
+
+def unique_violation(error: IntegrityError, columns: Sequence[str]) -> UniqueViolation:
+    name = _constraint_name(error)
+    column = next((column for column in columns if column in name), None)
+    return UniqueViolation(column)
+
+
+class TagWriteService:
+    @staticmethod
+    async def create(db: AsyncSession, name: str, color: Optional[str]) -> Row:
+        try:
+            result = await db.execute(
+                insert(tags_table)
+                .values(name=name, color=color)
+                .returning(*tags_table.c)
+            )
+        except IntegrityError as e:
+            raise unique_violation(e, ("name",)) from e
+        return result.one()
+
+    @staticmethod
+    async def update(
+        db: AsyncSession, tag_id: int, values: Dict[str, Any]
+    ) -> Optional[Row]:
+        if not values:
+            result = await db.execute(select(tags_table).where(Tag.id == tag_id))
+            return result.first()
+        try:
+            result = await db.execute(
+                update(tags_table)
+                .where(Tag.id == tag_id)
+                .values(**values)
+                .returning(*tags_table.c)
+            )
+        except IntegrityError as e:
+            raise unique_violation(e, ("name",)) from e
+        return result.first()
+
+    @staticmethod
+    async def delete(db: AsyncSession, tag_id: int) -> bool:
+        # issue_tags rows go with it (ON DELETE CASCADE)
+        result = await db.execute(
+            delete(tags_table).where(Tag.id == tag_id).returning(Tag.id)
+        )
+        return result.first() is not None
+
+
+# Issue columns the live stats counters are broken down by
+ISSUE_COUNTED_COLUMNS = ("status", "priority")
+
+
+class IssueWriteService:
+    @staticmethod
+    async def update(
+        db: AsyncSession, issue_id: int, reporter_id: int, values: Dict[str, Any]
+    ) -> Optional[Tuple[Row, Dict[str, Any]]]:
+        """Update an issue owned by ``reporter_id``, returning the new row and
+        its previous counted values; None if nothing matched"""
+        rows = await IssueWriteService._update_returning_previous(
+            db, (Issue.id == issue_id, Issue.reporter_id == reporter_id), values
+        )
+        return rows[0] if rows else None
+
+    @staticmethod
+    async def bulk_update(
+        db: AsyncSession, issue_ids: List[int], reporter_id: int, values: Dict[str, Any]
+    ) -> List[Tuple[Row, Dict[str, Any]]]:
+        """``update`` for a batch; issues not owned by ``reporter_id`` are
+        left out of the result"""
+        return await IssueWriteService._update_returning_previous(
+            db, (Issue.id.in_(issue_ids), Issue.reporter_id == reporter_id), values
+        )
+
+    @staticmethod
+    async def _update_returning_previous(
+        db: AsyncSession, conditions: Tuple[Any, ...], values: Dict[str, Any]
+    ) -> List[Tuple[Row, Dict[str, Any]]]:
+        # Same UPDATE … FROM a locked read of the old rows as users, so live
+        # stats deltas need no extra SELECT
+        old = select(issues_table).where(*conditions).with_for_update().subquery("old")
+        old_columns = [
+            old.c[column].label(f"old_{column}") for column in ISSUE_COUNTED_COLUMNS
+        ]
+        result = await db.execute(
+            update(issues_table)
+            .where(issues_table.c.id == old.c.id)
+            .values(**values, updated_at=func.now())
+            .returning(*issues_table.c, *old_columns)
+        )
+        return [
+            (
+                row,
+                {
+                    column: getattr(row, f"old_{column}")
+                    for column in ISSUE_COUNTED_COLUMNS
+                },
+            )
+            for row in result.fetchall()
+        ]
+
+    @staticmethod
+    async def delete(
+        db: AsyncSession, issue_id: int, reporter_id: int
+    ) -> Optional[Row]:
+        """Delete an issue owned by ``reporter_id``; None if nothing matched"""
+        result = await db.execute(
+            delete(issues_table)
+            .where(Issue.id == issue_id, Issue.reporter_id == reporter_id)
+            .returning(*issues_table.c)
+        )
+        return result.first()
+
+    @staticmethod
+    async def bulk_delete(
+        db: AsyncSession, issue_ids: List[int], reporter_id: int
+    ) -> List[Row]:
+        """Delete the issues in ``issue_ids`` owned by ``reporter_id``"""
+        result = await db.execute(
+            delete(issues_table)
+            .where(Issue.id.in_(issue_ids), Issue.reporter_id == reporter_id)
+            .returning(*issues_table.c)
+        )
+        return result.fetchall()
+
+    @staticmethod
+    async def existing(db: AsyncSession, issue_ids: List[int]) -> List[int]:
+        """Which of ``issue_ids`` exist; tells 'not found' from 'forbidden'
+        after a bulk write skipped some"""
+        result = await db.execute(select(Issue.id).where(Issue.id.in_(issue_ids)))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def reporter_of(db: AsyncSession, issue_id: int) -> Optional[int]:
+        """Only needed to tell 'not found' from 'forbidden' after a miss"""
+        result = await db.execute(select(Issue.reporter_id).where(Issue.id == issue_id))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def replace_tags(
+        db: AsyncSession, issue_id: int, tag_ids: List[int]
+    ) -> List[Row]:
+        """Make the issue's tags exactly ``tag_ids`` and return them.
+
+        One statement: rows not in the new set are deleted, missing ones
+        inserted (unknown tag ids drop out), and the resulting tags selected.
+        """
+        removed = (
+            delete(issue_tags)
+            .where(
+                issue_tags.c.issue_id == issue_id,
+                issue_tags.c.tag_id.not_in(tag_ids),
+            )
+            .returning(issue_tags.c.tag_id)
+            .cte("removed")
+        )
+        added = (
+            insert(issue_tags)
+            .from_select(
+                ["issue_id", "tag_id"],
+                select(literal(issue_id), Tag.id).where(Tag.id.in_(tag_ids)),
+            )
+            .on_conflict_do_nothing()
+            .returning(issue_tags.c.tag_id)
+            .cte("added")
+        )
+        result = await db.execute(
+            select(Tag.id, Tag.name, Tag.color)
+            .where(Tag.id.in_(tag_ids))
+            .add_cte(removed, added)
+        )
+        return result.fetchall()
+
+    @staticmethod
+    async def bulk_replace_tags(
+        db: AsyncSession, issue_ids: List[int], tag_ids: List[int]
+    ) -> List[Row]:
+        """``replace_tags`` for every issue in ``issue_ids``, in one statement"""
+        removed = (
+            delete(issue_tags)
+            .where(
+                issue_tags.c.issue_id.in_(issue_ids),
+                issue_tags.c.tag_id.not_in(tag_ids),
+            )
+            .returning(issue_tags.c.tag_id)
+            .cte("removed")
+        )
+        # Cross join issues x tags; unknown tag ids simply drop out
+        added = (
+            insert(issue_tags)
+            .from_select(
+                ["issue_id", "tag_id"],
+                select(Issue.id, Tag.id).where(
+                    Issue.id.in_(issue_ids), Tag.id.in_(tag_ids)
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(issue_tags.c.tag_id)
+            .cte("added")
+        )
+        result = await db.execute(
+            select(Tag.id, Tag.name, Tag.color)
+            .where(Tag.id.in_(tag_ids))
+            .add_cte(removed, added)
+        )
+        return result.fetchall()
+
+    @staticmethod
+    async def tags_of(db: AsyncSession, issue_id: int) -> List[Row]:
+        result = await db.execute(
+            select(Tag.id, Tag.name, Tag.color)
+            .join(issue_tags, issue_tags.c.tag_id == Tag.id)
+            .where(issue_tags.c.issue_id == issue_id)
+        )
+        return result.fetchall()
+
+
+USER_UNIQUE_COLUMNS = ("email", "username")
+USER_AUDITED_COLUMNS = (
+    "email",
+    "username",
+    "first_name",
+    "last_name",
+    "role",
+    "status",
+)
+
+
+class UserWriteService:
+    @staticmethod
+    async def update(
+        db: AsyncSession, user_id: int, values: Dict[str, Any]
+    ) -> Optional[Tuple[Row, Dict[str, Any]]]:
+        """Update a user, returning the new row and the previous values.
+
+        The old row is locked and read inside the UPDATE (``UPDATE … FROM``),
+        so the audit trail needs no separate SELECT.
+        """
+        old = (
+            select(users_table)
+            .where(User.id == user_id)
+            .with_for_update()
+            .subquery("old")
+        )
+        old_columns = [
+            old.c[column].label(f"old_{column}") for column in USER_AUDITED_COLUMNS
+        ]
+        try:
+            result = await db.execute(
+                update(users_table)
+                .where(users_table.c.id == old.c.id)
+                .values(**values, updated_at=func.now())
+                .returning(*users_table.c, *old_columns)
+            )
+        except IntegrityError as e:
+            raise unique_violation(e, USER_UNIQUE_COLUMNS) from e
+        row = result.first()
+        if row is None:
+            return None
+        previous = {
+            column: getattr(row, f"old_{column}") for column in USER_AUDITED_COLUMNS
+        }
+        return row, previous
+
+    @staticmethod
+    async def delete(db: AsyncSession, user_id: int) -> bool:
+        """Delete a user; issues still referencing them make the FK refuse"""
+        try:
+            result = await db.execute(
+                delete(users_table).where(User.id == user_id).returning(User.id)
+            )
+        except IntegrityError as e:
+            raise ReferencedRow(_constraint_name(e)) from e
+        return result.first() is not None
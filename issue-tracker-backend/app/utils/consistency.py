@@ -0,0 +1,34 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.database import LAST_WRITE_HEADER, ClientWrites, client_writes
+
+
+class ReadYourWritesMiddleware:
+    """Tracks each client's last write for ``ReplicaRouter``.
+
+    Responses to requests that wrote carry ``X-Last-Write``. While the
+    client sends that value back within the replica lag window, its reads go
+    to the primary. Other clients' reads are unaffected.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        writes = ClientWrites.from_header(Headers(scope=scope).get(LAST_WRITE_HEADER))
+
+        async def send_with_last_write(message: Message) -> None:
+            if message["type"] == "http.response.start" and writes.wrote_at:
+                headers = MutableHeaders(scope=message)
+                headers[LAST_WRITE_HEADER] = repr(writes.wrote_at)
+            await send(message)
+
+        token = client_writes.set(writes)
+        try:
+            await self.app(scope, receive, send_with_last_write)
+        finally:
+            client_writes.reset(token)
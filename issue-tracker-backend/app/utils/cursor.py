@@ -0,0 +1,19 @@
+import base64
+from typing import Any, List
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque keyset cursor made of the sort key of a row"""
+    key = "|".join(str(value) for value in values)
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+    """The ``size`` sort key values of a cursor, as strings"""
+    try:
+        values = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
@@ -0,0 +1,27 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+
+# One encoder for GraphQL responses, subscription payloads and /ws frames.
+# orjson handles datetimes (ISO 8601), enums (by value), UUIDs and
+# dataclasses natively, so callers pass model values straight through.
+OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    return orjson.dumps(value, default=_default, option=OPTIONS)
+
+
+def dumps(value: Any) -> str:
+    return dumps_bytes(value).decode()
+
+
+loads = orjson.loads
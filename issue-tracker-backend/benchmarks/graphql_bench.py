@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+GraphQL Benchmark Harness
+Runs the main GraphQL operations in-process against a seeded database and
+records, per operation:
+- p50 / p95 / p99 / max latency
+- throughput at the configured concurrency
+- SQL statements executed per operation
+
+The AI enhancer is replaced by a fake LLM with a fixed delay so create_issue
+measures our code, not the model. Reports are JSON; pass --compare to diff
+against a previous run.
+
+Usage:
+    python seed_data.py --users 10000 --issues 100000
+    python benchmarks/graphql_bench.py --out bench.json
+    python benchmarks/graphql_bench.py --compare bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from sqlalchemy import event
+from app.database import engine
+from app.main import app
+import app.graphql as graphql_module
+
+GET_ISSUES = """
+query GetIssues {
+  issues {
+    id title description enhancedDescription status priority
+    assigneeId reporterId createdAt updatedAt
+    tags { id name color }
+  }
+}
+"""
+
+GET_USERS = """
+query GetUsers {
+  users {
+    id email username firstName lastName role status lastLogin
+    createdAt updatedAt assignedIssuesCount reportedIssuesCount
+  }
+}
+"""
+
+GET_USER_STATS = """
+query GetUserStats {
+  userStats {
+    totalUsers activeUsers newUsersThisMonth
+    usersByRole { role count }
+    recentActivity { id activityType description createdAt }
+  }
+}
+"""
+
+ISSUE_STATS = """
+query IssueStats {
+  issueStats { totalIssues openIssues inProgressIssues closedIssues }
+}
+"""
+
+LOGIN = """
+mutation Login($email: String!, $password: String!) {
+  login(email: $email, password: $password) { accessToken }
+}
+"""
+
+CREATE_ISSUE = """
+mutation CreateIssue($input: IssueCreateInput!) {
+  createIssue(input: $input) { id title status }
+}
+"""
+
+
+class FakeLLM:
+    """Stands in for AIDescriptionEnhancer with a fixed, configurable delay"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def enhance_description(self, description: str) -> dict:
+        await asyncio.sleep(self.delay)
+        return {
+            "enhanced_text": description,
+            "markdown_html": f"<p>{description}</p>",
+            "original": description,
+        }
+
+
+class QueryCounter:
+    """Counts SQL statements issued by the shared engine"""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+async def run_operation(client, counter, name, payload, headers, args):
+    """Warm up, measure query count once, then time requests at concurrency"""
+
+    async def call():
+        response = await client.post("/graphql", json=payload(), headers=headers)
+        body = response.json()
+        if response.status_code != 200 or body.get("errors"):
+            raise RuntimeError(f"{name} failed: {body}")
+        return body
+
+    for _ in range(args.warmup):
+        await call()
+
+    before = counter.count
+    await call()
+    queries = counter.count - before
+
+    latencies = []
+    remaining = args.requests
+    lock = asyncio.Lock()
+
+    async def worker():
+        nonlocal remaining
+        while True:
+            async with lock:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "requests": len(latencies),
+        "concurrency": args.concurrency,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "queries_per_op": queries,
+    }
+    print(
+        f"  {name:<14} p50 {result['p50_ms']:>8.1f}ms  p95 {result['p95_ms']:>8.1f}ms  "
+        f"p99 {result['p99_ms']:>8.1f}ms  {result['throughput_rps']:>7.1f} rps  "
+        f"{queries} queries"
+    )
+    return result
+
+
+async def benchmark(args):
+    engine.sync_engine.echo = False
+    graphql_module.ai_enhancer = FakeLLM(args.llm_delay)
+    counter = QueryCounter()
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=300
+        ) as client:
+            response = await client.post(
+                "/graphql",
+                json={
+                    "query": LOGIN,
+                    "variables": {"email": args.email, "password": args.password},
+                },
+            )
+            login = response.json()["data"]["login"]
+            if not login:
+                raise SystemExit(f"❌ Could not log in as {args.email}")
+            headers = {"Authorization": f"Bearer {login['accessToken']}"}
+
+            operations = {
+                "GetIssues": lambda: {"query": GET_ISSUES},
+                "GetUsers": lambda: {"query": GET_USERS},
+                "GetUserStats": lambda: {"query": GET_USER_STATS},
+                "issue_stats": lambda: {"query": ISSUE_STATS},
+                "login": lambda: {
+                    "query": LOGIN,
+                    "variables": {"email": args.email, "password": args.password},
+                },
+                "create_issue": lambda: {
+                    "query": CREATE_ISSUE,
+                    "variables": {
+                        "input": {
+                            "title": "Benchmark issue",
+                            "description": "Created by graphql_bench",
+                            "reporterId": 0,
+                        }
+                    },
+                },
+            }
+            selected = args.only or list(operations)
+
+            print(f"🏁 Benchmarking {', '.join(selected)}")
+            results = {}
+            for name in selected:
+                results[name] = await run_operation(
+                    client, counter, name, operations[name], headers, args
+                )
+
+    await engine.dispose()
+    return {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "llm_delay": args.llm_delay,
+        },
+        "operations": results,
+    }
+
+
+def compare(old, new):
+    print(f"\n📊 {old.get('revision')} → {new.get('revision')}")
+    for name, result in new["operations"].items():
+        before = old.get("operations", {}).get(name)
+        if not before:
+            continue
+        changes = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps", "queries_per_op"):
+            if before[key]:
+                delta = (result[key] - before[key]) / before[key] * 100
+                changes.append(f"{key} {before[key]}→{result[key]} ({delta:+.0f}%)")
+        print(f"  {name:<14} " + "  ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GraphQL operations")
+    parser.add_argument("--email", default="seed42-user1@example.com")
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--llm-delay", type=float, default=0.0, help="Fake LLM latency in seconds"
+    )
+    parser.add_argument("--only", nargs="+", help="Operations to run")
+    parser.add_argument("--out", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Previous JSON report to diff against")
+    args = parser.parse_args()
+
+    report = asyncio.run(benchmark(args))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.out}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
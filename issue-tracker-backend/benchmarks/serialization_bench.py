@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark
+Measures the CPU cost of encoding realistic payloads with the stdlib json
+module versus app/utils/serialization.py (orjson):
+- a GetIssues GraphQL response with long descriptions and markdown
+- an issue broadcast fanned out to N /ws connections (the old manager
+  re-encoded the message once per connection, the new one encodes once)
+
+CPU time is process time, so the numbers do not depend on machine load.
+
+Usage:
+    python benchmarks/serialization_bench.py --issues 5000 --connections 1000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.serialization import dumps, dumps_bytes
+
+WORDS = (
+    "login page crash error timeout dashboard report export api slow button "
+    "mobile layout broken search filter sort payment email notification cache"
+).split()
+
+
+def sentence(rng, count):
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def issues_response(count, rng):
+    """GetIssues response data as the GraphQL layer hands it to the encoder"""
+    now = datetime.now(timezone.utc)
+    issues = []
+    for n in range(1, count + 1):
+        created_at = now - timedelta(minutes=rng.randint(0, 500000))
+        description = sentence(rng, rng.randint(40, 200))
+        issues.append(
+            {
+                "id": n,
+                "title": sentence(rng, 6).capitalize(),
+                "description": description,
+                "enhancedDescription": f"## Summary\n\n{description}\n\n- [ ] Verify",
+                "status": rng.choice(["OPEN", "IN_PROGRESS", "RESOLVED", "CLOSED"]),
+                "priority": rng.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"]),
+                "assigneeId": rng.randint(1, 500),
+                "reporterId": rng.randint(1, 500),
+                "createdAt": created_at.isoformat(),
+                "updatedAt": created_at.isoformat(),
+                "tags": [
+                    {"id": t, "name": rng.choice(WORDS), "color": "#3b82f6"}
+                    for t in range(rng.randint(0, 3))
+                ],
+            }
+        )
+    return {"data": {"issues": issues}}
+
+
+def broadcast_message(rng):
+    now = datetime.now(timezone.utc)
+    return {
+        "type": "issue_updated",
+        "data": {
+            "id": 1,
+            "title": sentence(rng, 6),
+            "description": sentence(rng, 120),
+            "status": "IN_PROGRESS",
+            "priority": "HIGH",
+            "created_at": now,
+            "updated_at": now,
+        },
+        "timestamp": time.monotonic(),
+        "seq": 1,
+    }
+
+
+def cpu_ms(fn, repeat):
+    fn()  # warm up
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON encoding")
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="Write the JSON report here")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    response = issues_response(args.issues, rng)
+    message = broadcast_message(rng)
+
+    def stdlib_response():
+        # Strawberry's default: json.dumps to str, then encode for the body
+        return json.dumps(response).encode()
+
+    def stdlib_broadcast():
+        legacy = dict(
+            message,
+            data=dict(
+                message["data"],
+                created_at=message["data"]["created_at"].isoformat(),
+                updated_at=message["data"]["updated_at"].isoformat(),
+            ),
+        )
+        for _ in range(args.connections):
+            json.dumps(legacy)
+
+    def orjson_broadcast():
+        dumps(message)
+
+    size = len(dumps_bytes(response))
+    results = {}
+    for name, old, new in (
+        ("graphql_issues_response", stdlib_response, lambda: dumps_bytes(response)),
+        ("ws_broadcast", stdlib_broadcast, orjson_broadcast),
+    ):
+        old_ms = cpu_ms(old, args.repeat)
+        new_ms = cpu_ms(new, args.repeat)
+        results[name] = {
+            "stdlib_cpu_ms": round(old_ms, 3),
+            "orjson_cpu_ms": round(new_ms, 3),
+            "speedup": round(old_ms / new_ms, 1) if new_ms else None,
+        }
+        print(
+            f"  {name:<24} stdlib {old_ms:>9.3f}ms  orjson {new_ms:>9.3f}ms  "
+            f"({results[name]['speedup']}x)"
+        )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "settings": vars(args),
+        "response_bytes": size,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
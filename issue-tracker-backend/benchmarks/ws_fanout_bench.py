@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+WebSocket Fan-out Load Test
+Connects N clients to the /ws endpoint from app/routers/websocket.py and
+drives issue broadcasts through websocket_manager at a fixed rate. Reports:
+- delivery latency percentiles for normal and slow consumers
+- time spent inside broadcast_to_all per event (head-of-line blocking)
+- resident memory per connection
+- event-loop lag while broadcasting
+
+Modes:
+    local   - real sockets: uvicorn on 127.0.0.1 plus `websockets` clients
+    inproc  - no sockets: stub connections, isolates the manager's own cost
+
+Server and clients share one process and event loop, so numbers are
+comparable between runs on the same box rather than absolute capacity.
+
+Usage:
+    python benchmarks/ws_fanout_bench.py --clients 5000 --rate 20 --events 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import socket
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi import FastAPI
+from app.routers import websocket as websocket_router
+from app.services.websocket import websocket_manager, EventType
+
+
+def percentiles(samples):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def pick(pct):
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return round(ordered[index], 3)
+
+    return {
+        "count": len(ordered),
+        "p50": pick(50),
+        "p95": pick(95),
+        "p99": pick(99),
+        "max": round(ordered[-1], 3),
+        "mean": round(statistics.fmean(ordered), 3),
+    }
+
+
+def rss_kb():
+    """Resident set size from /proc (Linux)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def raise_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def issue_payload(n):
+    return {
+        "id": n,
+        "title": f"Load test issue {n}",
+        "description": "Broadcast payload of realistic size " * 8,
+        "status": "IN_PROGRESS",
+        "priority": "HIGH",
+        "assignee_id": 1,
+        "reporter_id": 1,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "sent_at": time.perf_counter(),
+    }
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic sleep wakes up"""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - started - self.interval
+            self.samples.append(max(lag, 0) * 1000)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+class Consumer:
+    def __init__(self, slow_delay=0.0):
+        self.slow_delay = slow_delay
+        self.latencies = []
+
+    async def handle(self, text):
+        message = json.loads(text)
+        data = message.get("data")
+        if isinstance(data, dict) and "sent_at" in data:
+            self.latencies.append((time.perf_counter() - data["sent_at"]) * 1000)
+            if self.slow_delay:
+                await asyncio.sleep(self.slow_delay)
+
+
+class StubWebSocket:
+    """Minimal stand-in for starlette's WebSocket used by inproc mode"""
+
+    def __init__(self, consumer):
+        self.queue = asyncio.Queue()
+        self.consumer = consumer
+        self.task = asyncio.create_task(self._drain())
+
+    async def send_text(self, text):
+        await self.queue.put(text)
+
+    async def _drain(self):
+        while True:
+            await self.consumer.handle(await self.queue.get())
+
+
+async def connect_inproc(consumers):
+    sockets = []
+    for n, consumer in enumerate(consumers):
+        stub = StubWebSocket(consumer)
+        websocket_manager.active_connections[f"bench-{n}"] = stub
+        sockets.append(stub)
+
+    async def close():
+        for stub in sockets:
+            stub.task.cancel()
+        websocket_manager.active_connections.clear()
+
+    return close
+
+
+async def connect_local(consumers, args):
+    import uvicorn
+    import websockets
+
+    app = FastAPI()
+    app.include_router(websocket_router.router)
+    port = free_port()
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        ws_max_queue=args.server_queue,
+        backlog=max(2048, args.clients),
+        ws_per_message_deflate=not args.no_deflate,
+    )
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    connections = []
+    readers = []
+
+    async def read(connection, consumer):
+        try:
+            async for text in connection:
+                await consumer.handle(text)
+        except websockets.ConnectionClosed:
+            pass
+
+    semaphore = asyncio.Semaphore(200)
+
+    async def open_one(consumer):
+        async with semaphore:
+            connection = await websockets.connect(
+                f"ws://127.0.0.1:{port}/ws",
+                max_queue=args.client_queue,
+                open_timeout=60,
+                compression=None if args.no_deflate else "deflate",
+            )
+        connections.append(connection)
+        readers.append(asyncio.create_task(read(connection, consumer)))
+
+    await asyncio.gather(*(open_one(consumer) for consumer in consumers))
+    while websocket_manager.get_connection_count() < len(consumers):
+        await asyncio.sleep(0.05)
+
+    async def close():
+        await asyncio.gather(
+            *(connection.close() for connection in connections),
+            return_exceptions=True,
+        )
+        for reader in readers:
+            reader.cancel()
+        server.should_exit = True
+        await server_task
+
+    return close
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    limit = raise_fd_limit()
+    if args.mode == "local" and args.clients * 2 + 100 > limit:
+        raise SystemExit(
+            f"❌ {args.clients} clients need ~{args.clients * 2} fds, limit {limit}"
+        )
+
+    slow_count = int(args.clients * args.slow_fraction)
+    slow_ids = set(rng.sample(range(args.clients), slow_count))
+    consumers = [
+        Consumer(args.slow_delay if n in slow_ids else 0.0) for n in range(args.clients)
+    ]
+
+    baseline_rss = rss_kb()
+    print(f"🔌 Connecting {args.clients} clients ({args.mode})...")
+    started = time.perf_counter()
+    if args.mode == "local":
+        close = await connect_local(consumers, args)
+    else:
+        close = await connect_inproc(consumers)
+    connect_seconds = time.perf_counter() - started
+    connected_rss = rss_kb()
+    print(f"   connected in {connect_seconds:.1f}s")
+
+    monitor = LoopLagMonitor()
+    monitor.start()
+    broadcast_ms = []
+    interval = 1 / args.rate
+
+    print(f"📣 Broadcasting {args.events} events at {args.rate}/s...")
+    started = time.perf_counter()
+    for n in range(args.events):
+        tick = time.perf_counter()
+        await websocket_manager.broadcast_to_all(
+            EventType.ISSUE_UPDATED, issue_payload(n)
+        )
+        broadcast_ms.append((time.perf_counter() - tick) * 1000)
+        await asyncio.sleep(max(0, interval - (time.perf_counter() - tick)))
+    send_seconds = time.perf_counter() - started
+
+    # Give consumers time to drain what the server already sent
+    deadline = time.perf_counter() + args.drain_timeout
+    fast = [c for n, c in enumerate(consumers) if n not in slow_ids]
+    while time.perf_counter() < deadline:
+        if all(len(c.latencies) >= args.events for c in fast):
+            break
+        await asyncio.sleep(0.1)
+    await monitor.stop()
+    peak_rss = rss_kb()
+    await close()
+
+    expected = args.events * args.clients
+    delivered = sum(len(c.latencies) for c in consumers)
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "settings": vars(args),
+        "connect_seconds": round(connect_seconds, 2),
+        "achieved_rate": round(args.events / send_seconds, 1),
+        "delivered": delivered,
+        "expected": expected,
+        "delivery_ratio": round(delivered / expected, 4) if expected else None,
+        "memory": {
+            "rss_per_connection_kb": round(
+                (connected_rss - baseline_rss) / max(args.clients, 1), 2
+            ),
+            "peak_rss_mb": round(peak_rss / 1024, 1),
+        },
+        "broadcast_ms": percentiles(broadcast_ms),
+        "latency_ms": percentiles([l for c in fast for l in c.latencies]),
+        "slow_latency_ms": percentiles(
+            [l for n in slow_ids for l in consumers[n].latencies]
+        ),
+        "loop_lag_ms": percentiles(monitor.samples),
+    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket fan-out load test")
+    parser.add_argument("--mode", choices=["local", "inproc"], default="local")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=10.0, help="Events per second")
+    parser.add_argument("--slow-fraction", type=float, default=0.0)
+    parser.add_argument(
+        "--slow-delay", type=float, default=0.05, help="Seconds per message"
+    )
+    parser.add_argument("--server-queue", type=int, default=32)
+    parser.add_argument("--client-queue", type=int, default=16)
+    parser.add_argument("--drain-timeout", type=float, default=10.0)
+    parser.add_argument(
+        "--no-deflate", action="store_true", help="Disable permessage-deflate"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="Write the JSON report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
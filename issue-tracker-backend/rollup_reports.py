@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Report Rollup Script
+Maintains the issue_daily_rollups table outside the API process:
+- refresh: apply status transitions recorded since the last run
+- rebuild: recompute every rollup (backfill / compaction)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+from app.database import AsyncSessionLocal
+from app.services.rollups import RollupService
+
+
+async def run_rollups(args):
+    async with AsyncSessionLocal() as session:
+        if args.command == "rebuild":
+            print("🔄 Rebuilding report rollups...")
+            upto = await RollupService.rebuild(session)
+        else:
+            print("🔄 Refreshing report rollups...")
+            upto = await RollupService.refresh(session)
+
+    if upto is None:
+        if args.command == "rebuild":
+            print("❌ Another rollup job is running")
+            return 1
+        print("✅ Nothing to apply")
+        return 0
+    print(f"✅ Rollups applied up to transition {upto}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain report rollups")
+    parser.add_argument("command", choices=["refresh", "rebuild"])
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run_rollups(args)))
+
+
+if __name__ == "__main__":
+    main()
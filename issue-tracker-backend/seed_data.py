@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Generator
+Seeds the database at benchmark scale with COPY:
+- Users with a realistic role / status mix
+- Issues with skewed assignees, weighted status / priority and spread-out dates
+- Tags, issue tags, comments and user activities
+
+All seeded users share the password given by --password. Runs are
+reproducible for a given --seed.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.dirname(__file__))
+
+from app.database import engine
+from app.services.auth import hash_password
+
+STATUS_WEIGHTS = {"OPEN": 35, "IN_PROGRESS": 25, "RESOLVED": 20, "CLOSED": 20}
+PRIORITY_WEIGHTS = {"LOW": 25, "MEDIUM": 45, "HIGH": 22, "CRITICAL": 8}
+ROLE_WEIGHTS = {"ADMIN": 1, "MANAGER": 6, "MEMBER": 80, "VIEWER": 13}
+USER_STATUS_WEIGHTS = {"ACTIVE": 85, "INACTIVE": 8, "AWAY": 5, "SUSPENDED": 2}
+ACTIVITY_TYPES = [
+    "LOGIN",
+    "CREATE_ISSUE",
+    "UPDATE_ISSUE",
+    "CREATE_COMMENT",
+    "UPDATE_PROFILE",
+]
+WORDS = (
+    "login page crash error timeout dashboard report export api slow button "
+    "mobile layout broken search filter sort payment email notification cache "
+    "database query memory leak upload image validation form redirect session "
+    "token permission role kanban board comment tag sync websocket retry"
+).split()
+TAG_COLORS = ["#ef4444", "#f59e0b", "#10b981", "#3b82f6", "#8b5cf6", "#ec4899"]
+COPY_CHUNK = 10000
+
+
+def weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def sentence(rng, low, high):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def chunks(rows, size=COPY_CHUNK):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def reserve_ids(conn, sequence, count):
+    """Allocate a contiguous-enough block of ids from a serial sequence"""
+    rows = await conn.fetch(
+        f"SELECT nextval('{sequence}') FROM generate_series(1, $1)", count
+    )
+    return [row[0] for row in rows]
+
+
+async def copy(conn, table, columns, rows):
+    total = 0
+    for chunk in chunks(rows):
+        await conn.copy_records_to_table(table, records=chunk, columns=columns)
+        total += len(chunk)
+    return total
+
+
+async def seed(args):
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    start = now - timedelta(days=args.days)
+    password_hash = hash_password(args.password)
+    prefix = f"seed{args.seed}"
+
+    def random_time(after=start):
+        span = max((now - after).total_seconds(), 1)
+        return after + timedelta(seconds=rng.random() * span)
+
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        conn = raw_connection.driver_connection
+
+        if args.truncate:
+            print("🗑️  Truncating existing data...")
+            await conn.execute(
+                "TRUNCATE user_activities, comments, issue_tags, issues, tags, "
+                "team_members, users RESTART IDENTITY CASCADE"
+            )
+
+        async with conn.transaction():
+            started = time.perf_counter()
+
+            print(f"👥 Seeding {args.users} users...")
+            user_ids = await reserve_ids(conn, "users_id_seq", args.users)
+            user_created = {}
+
+            def users():
+                for n, user_id in enumerate(user_ids, start=1):
+                    created_at = random_time()
+                    user_created[user_id] = created_at
+                    yield (
+                        user_id,
+                        f"{prefix}-user{n}@example.com",
+                        f"{prefix}_user{n}",
+                        password_hash,
+                        f"First{n}",
+                        f"Last{n}",
+                        weighted(rng, ROLE_WEIGHTS),
+                        weighted(rng, USER_STATUS_WEIGHTS),
+                        random_time(created_at) if rng.random() < 0.8 else None,
+                        created_at,
+                        created_at,
+                    )
+
+            await copy(
+                conn,
+                "users",
+                [
+                    "id",
+                    "email",
+                    "username",
+                    "password_hash",
+                    "first_name",
+                    "last_name",
+                    "role",
+                    "status",
+                    "last_login",
+                    "created_at",
+                    "updated_at",
+                ],
+                users(),
+            )
+
+            print(f"🏷️  Seeding {args.tags} tags...")
+            tag_ids = await reserve_ids(conn, "tags_id_seq", args.tags)
+            await copy(
+                conn,
+                "tags",
+                ["id", "name", "color"],
+                (
+                    (
+                        tag_id,
+                        f"{prefix}-{rng.choice(WORDS)}-{n}",
+                        rng.choice(TAG_COLORS),
+                    )
+                    for n, tag_id in enumerate(tag_ids, start=1)
+                ),
+            )
+
+            # A few busy users own most of the work (Zipf-like skew)
+            cum_weights = list(
+                itertools.accumulate(
+                    1 / (rank**args.skew) for rank in range(1, len(user_ids) + 1)
+                )
+            )
+
+            def pick_user():
+                return rng.choices(user_ids, cum_weights=cum_weights)[0]
+
+            print(f"📝 Seeding {args.issues} issues...")
+            issue_ids = await reserve_ids(conn, "issues_id_seq", args.issues)
+            issue_created = {}
+
+            def issues():
+                for issue_id in issue_ids:
+                    created_at = random_time()
+                    issue_created[issue_id] = created_at
+                    description = sentence(rng, 20, 120)
+                    yield (
+                        issue_id,
+                        sentence(rng, 3, 9).capitalize(),
+                        description,
+                        description if rng.random() < 0.6 else None,
+                        weighted(rng, STATUS_WEIGHTS),
+                        weighted(rng, PRIORITY_WEIGHTS),
+                        pick_user() if rng.random() < 0.85 else None,
+                        pick_user(),
+                        created_at,
+                        random_time(created_at),
+                    )
+
+            await copy(
+                conn,
+                "issues",
+                [
+                    "id",
+                    "title",
+                    "description",
+                    "enhanced_description",
+                    "status",
+                    "priority",
+                    "assignee_id",
+                    "reporter_id",
+                    "created_at",
+                    "updated_at",
+                ],
+                issues(),
+            )
+
+            def issue_tag_rows():
+                for issue_id in issue_ids:
+                    count = min(rng.choice([0, 1, 1, 2, 2, 3]), len(tag_ids))
+                    for tag_id in rng.sample(tag_ids, count):
+                        yield (issue_id, tag_id)
+
+            issue_tag_count = await copy(
+                conn, "issue_tags", ["issue_id", "tag_id"], issue_tag_rows()
+            )
+            print(f"   ↳ {issue_tag_count} issue tags")
+
+            def comments():
+                for issue_id in issue_ids:
+                    for _ in range(int(rng.expovariate(1 / args.comments_per_issue))):
+                        yield (
+                            issue_id,
+                            pick_user(),
+                            sentence(rng, 5, 40),
+                            random_time(issue_created[issue_id]),
+                        )
+
+            comment_count = await copy(
+                conn,
+                "comments",
+                ["issue_id", "user_id", "content", "created_at"],
+                comments(),
+            )
+            print(f"💬 Seeded {comment_count} comments")
+
+            def activities():
+                for user_id in user_ids:
+                    for _ in range(int(rng.expovariate(1 / args.activities_per_user))):
+                        activity_type = rng.choice(ACTIVITY_TYPES)
+                        yield (
+                            user_id,
+                            activity_type,
+                            f"{activity_type.replace('_', ' ').title()} (seeded)",
+                            json.dumps({"seeded": True}),
+                            f"10.0.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+                            "seed-data/1.0",
+                            random_time(user_created[user_id]),
+                        )
+
+            # user_activities only accepts months that have a partition
+            await conn.execute(
+                """
+                SELECT create_user_activity_partition(month::date)
+                FROM generate_series(
+                    date_trunc('month', $1::timestamptz AT TIME ZONE 'UTC'),
+                    date_trunc('month', $2::timestamptz AT TIME ZONE 'UTC'),
+                    interval '1 month'
+                ) AS month
+                """,
+                start,
+                now,
+            )
+            activity_count = await copy(
+                conn,
+                "user_activities",
+                [
+                    "user_id",
+                    "activity_type",
+                    "description",
+                    "details",
+                    "ip_address",
+                    "user_agent",
+                    "created_at",
+                ],
+                activities(),
+            )
+            print(f"📊 Seeded {activity_count} activities")
+
+        await conn.execute("ANALYZE")
+        print(f"✅ Seeding finished in {time.perf_counter() - started:.1f}s")
+        print(f"🔑 Log in as {prefix}-user1@example.com / {args.password}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed synthetic data at scale")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--issues", type=int, default=100000)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--comments-per-issue", type=float, default=3.0)
+    parser.add_argument("--activities-per-user", type=float, default=20.0)
+    parser.add_argument("--days", type=int, default=365, help="History span")
+    parser.add_argument(
+        "--skew", type=float, default=1.1, help="Assignee/reporter Zipf exponent"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default="password123")
+    parser.add_argument(
+        "--truncate", action="store_true", help="Delete existing data first"
+    )
+    asyncio.run(seed(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
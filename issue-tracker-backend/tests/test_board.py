@@ -0,0 +1,97 @@
+import asyncio
+import os
+from decimal import Decimal
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.models.issue import Issue, IssueStatus
+from app.models.user import User
+from app.services.board import BoardService, rank_between
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+def test_rank_between_whole_neighbours_can_equal_old_rank():
+    # The case the trigger used to get wrong: a card at rank 3 dropped
+    # between 2 and 4 keeps the number it already had
+    assert rank_between(Decimal(2), Decimal(4)) == Decimal(3)
+    assert rank_between(Decimal(2), None) == Decimal(3)
+
+
+def test_rank_between_is_strictly_between():
+    assert Decimal(1) < rank_between(Decimal(1), Decimal(2)) < Decimal(2)
+    assert rank_between(Decimal("1.5"), Decimal("1.6")) == Decimal("1.55")
+
+
+async def _move_keeps_rank():
+    engine = create_async_engine(
+        TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    )
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            reporter_id = (
+                await conn.execute(
+                    insert(User)
+                    .values(
+                        email="rank-test@example.com",
+                        username="rank-test",
+                        password_hash="x",
+                    )
+                    .returning(User.id)
+                )
+            ).scalar()
+
+            async def add(status, rank):
+                return (
+                    await conn.execute(
+                        insert(Issue)
+                        .values(
+                            title="t",
+                            description="d",
+                            status=status,
+                            rank=rank,
+                            reporter_id=reporter_id,
+                        )
+                        .returning(Issue.id)
+                    )
+                ).scalar()
+
+            async def rank_of(issue_id):
+                return (
+                    await conn.execute(select(Issue.rank).where(Issue.id == issue_id))
+                ).scalar()
+
+            await add(IssueStatus.IN_PROGRESS, Decimal(2))
+            await add(IssueStatus.IN_PROGRESS, Decimal(4))
+            moved = await add(IssueStatus.OPEN, Decimal(3))
+            plain = await add(IssueStatus.OPEN, Decimal(9))
+
+            # moveIssue: explicit rank equal to the old one is kept
+            await BoardService.keep_rank(conn, moved)
+            await conn.execute(
+                update(Issue)
+                .where(Issue.id == moved)
+                .values(
+                    status=IssueStatus.IN_PROGRESS,
+                    rank=rank_between(Decimal(2), Decimal(4)),
+                )
+            )
+            assert await rank_of(moved) == Decimal(3)
+
+            # A plain status change of another issue still goes to the end:
+            # after 2, 3 and 4
+            await conn.execute(
+                update(Issue)
+                .where(Issue.id == plain)
+                .values(status=IssueStatus.IN_PROGRESS)
+            )
+            assert await rank_of(plain) == Decimal(5)
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+def test_move_issue_keeps_explicit_rank_on_status_change():
+    asyncio.run(_move_keeps_rank())
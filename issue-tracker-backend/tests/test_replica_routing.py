@@ -0,0 +1,90 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from app.database import ClientWrites, ReplicaRouter, client_writes
+from app.utils.consistency import ReadYourWritesMiddleware
+
+
+def fake_engine(name):
+    return SimpleNamespace(pool=SimpleNamespace(stats=SimpleNamespace(name=name)))
+
+
+def fresh_router():
+    primary, replica = fake_engine("primary"), fake_engine("replica1")
+    router = ReplicaRouter(primary, [replica], max_lag=5.0)
+    router.lag["replica1"] = 0.0
+    return router, primary, replica
+
+
+def test_only_the_writing_client_reads_from_the_primary():
+    router, primary, replica = fresh_router()
+
+    writer = client_writes.set(ClientWrites())
+    router.note_write()
+    assert router.pick() is primary
+    client_writes.reset(writer)
+
+    other = client_writes.set(ClientWrites())
+    assert router.pick() is replica
+    client_writes.reset(other)
+
+    # Background work outside a request is unaffected too
+    assert router.pick() is replica
+
+
+def test_echoed_last_write_expires_after_the_lag_window():
+    router, primary, replica = fresh_router()
+
+    token = client_writes.set(ClientWrites.from_header(repr(time.time() - 1)))
+    assert router.pick() is primary
+    client_writes.reset(token)
+
+    token = client_writes.set(ClientWrites.from_header(repr(time.time() - 60)))
+    assert router.pick() is replica
+    client_writes.reset(token)
+
+    token = client_writes.set(ClientWrites.from_header("garbage"))
+    assert router.pick() is replica
+    client_writes.reset(token)
+
+
+def test_reads_that_fill_the_cache_stay_on_the_primary():
+    router, primary, replica = fresh_router()
+
+    writes = ClientWrites()
+    token = client_writes.set(writes)
+    assert router.pick() is replica
+    assert writes.read_replica
+
+    pinned = ClientWrites()
+    pinned.primary_only = True
+    client_writes.set(pinned)
+    assert router.pick() is primary
+    assert not pinned.read_replica
+    client_writes.reset(token)
+
+
+def test_middleware_returns_last_write_only_after_a_write():
+    router, _, _ = fresh_router()
+
+    def app_that(writes):
+        async def app(scope, receive, send):
+            if writes:
+                router.note_write()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        return app
+
+    async def call(app):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "headers": []}
+        await ReadYourWritesMiddleware(app)(scope, None, send)
+        return dict(sent[0]["headers"])
+
+    assert b"x-last-write" in asyncio.run(call(app_that(writes=True)))
+    assert b"x-last-write" not in asyncio.run(call(app_that(writes=False)))
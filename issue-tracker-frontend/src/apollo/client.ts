@@ -1,6 +1,7 @@
-import { ApolloClient, InMemoryCache, createHttpLink, from, split } from '@apollo/client';
+import { ApolloClient, ApolloLink, InMemoryCache, createHttpLink, from, split } from '@apollo/client';
 import { setContext } from '@apollo/client/link/context';
 import { onError } from '@apollo/client/link/error';
+import { createPersistedQueryLink } from '@apollo/client/link/persisted-queries';
 import { GraphQLWsLink } from '@apollo/client/link/subscriptions';
 import { createClient } from 'graphql-ws';
 import { getMainDefinition } from '@apollo/client/utilities';
@@ -10,6 +11,17 @@ const httpLink = createHttpLink({
     uri: 'http://localhost:8000/graphql',
 });
 
+// Send query hashes instead of full text (Automatic Persisted Queries).
+// Hashed queries go out as GET so the browser can revalidate them by ETag.
+const sha256 = async (query: string) => {
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(query));
+    return Array.from(new Uint8Array(digest))
+        .map((byte) => byte.toString(16).padStart(2, '0'))
+        .join('');
+};
+
+const persistedQueryLink = createPersistedQueryLink({ sha256, useGETForHashedQueries: true });
+
 // Create the auth link
 const authLink = setContext((_, { headers }) => {
     // Get the authentication token from local storage if it exists
@@ -24,6 +36,27 @@ const authLink = setContext((_, { headers }) => {
     }
 });
 
+// Read-your-writes: the API answers writes with X-Last-Write. Sending it
+// back keeps this client's reads on the primary database until replicas
+// have caught up, while other clients keep reading from replicas.
+const LAST_WRITE_KEY = 'lastWrite';
+
+const lastWriteLink = new ApolloLink((operation, forward) => {
+    const lastWrite = localStorage.getItem(LAST_WRITE_KEY);
+    if (lastWrite) {
+        operation.setContext(({ headers = {} }) => ({
+            headers: { ...headers, 'x-last-write': lastWrite },
+        }));
+    }
+    return forward(operation).map((result) => {
+        const written = operation.getContext().response?.headers?.get('x-last-write');
+        if (written) {
+            localStorage.setItem(LAST_WRITE_KEY, written);
+        }
+        return result;
+    });
+});
+
 // Create the error link
 const errorLink = onError(({ graphQLErrors, networkError }) => {
     if (graphQLErrors)
@@ -58,7 +91,7 @@ const splitLink = split(
         );
     },
     wsLink,
-    from([errorLink, authLink, httpLink])
+    from([errorLink, authLink, lastWriteLink, persistedQueryLink, httpLink])
 );
 
 // Create the Apollo Client
@@ -1,5 +1,5 @@
-import React, { useState } from 'react';
-import { useMutation, useQuery, gql } from '@apollo/client';
+import React, { useEffect, useState } from 'react';
+import { useMutation, useQuery, useSubscription, gql } from '@apollo/client';
 import { UPDATE_ISSUE, DELETE_ISSUE } from '../graphql/mutations';
 import { GET_ISSUES, GET_TAGS } from '../graphql/queries';
 import { useAuth } from '../context/AuthContext';
@@ -33,6 +33,14 @@ interface Tag {
     color?: string;
 }
 
+interface Comment {
+    id: number;
+    issueId: number;
+    userId: number;
+    content: string;
+    createdAt: string;
+}
+
 interface IssueDetailModalProps {
     issue: Issue | null;
     isOpen: boolean;
@@ -41,9 +49,28 @@ interface IssueDetailModalProps {
     users: User[];
 }
 
+const COMMENTS_PAGE_SIZE = 20;
+
+// Newest page first; older pages follow the cursor
 const GET_COMMENTS = gql`
-  query GetComments($issueId: Int!) {
-    comments(issueId: $issueId) {
+  query GetComments($issueId: Int!, $last: Int!, $before: String) {
+    comments(issueId: $issueId, last: $last, before: $before) {
+      hasOlder
+      olderCursor
+      comments {
+        id
+        issueId
+        userId
+        content
+        createdAt
+      }
+    }
+  }
+`;
+
+const COMMENT_ADDED_SUBSCRIPTION = gql`
+  subscription OnCommentAdded($issueId: Int!) {
+    commentAdded(issueId: $issueId) {
       id
       issueId
       userId
@@ -69,11 +96,46 @@ const IssueDetailModal: React.FC<IssueDetailModalProps> = ({ issue, isOpen, onCl
     const [isEditing, setIsEditing] = useState(false);
     const [editData, setEditData] = useState<Partial<Issue>>({});
     const { user } = useAuth();
-    const { data: commentsData, refetch: refetchComments } = useQuery(GET_COMMENTS, {
-        variables: { issueId: issue ? parseInt(issue.id) : 0 },
+    const issueId = issue ? parseInt(issue.id) : 0;
+    const [comments, setComments] = useState<Comment[]>([]);
+    const [olderCursor, setOlderCursor] = useState<string | null>(null);
+    const [hasOlder, setHasOlder] = useState(false);
+    const { data: commentsData, fetchMore: fetchOlderComments } = useQuery(GET_COMMENTS, {
+        variables: { issueId, last: COMMENTS_PAGE_SIZE },
         skip: !issue,
         fetchPolicy: 'network-only',
     });
+
+    useEffect(() => {
+        const page = commentsData?.comments;
+        if (!page) return;
+        setComments(page.comments);
+        setOlderCursor(page.olderCursor);
+        setHasOlder(page.hasOlder);
+    }, [commentsData]);
+
+    // The mutation result and the subscription can both deliver a comment
+    const appendComment = (comment: Comment) => {
+        setComments(current => current.some(c => c.id === comment.id) ? current : [...current, comment]);
+    };
+
+    // New comments arrive live instead of refetching the thread
+    useSubscription(COMMENT_ADDED_SUBSCRIPTION, {
+        variables: { issueId },
+        skip: !issue,
+        onData: ({ data: { data: event } }) => {
+            if (event?.commentAdded) appendComment(event.commentAdded);
+        },
+    });
+
+    const handleLoadOlderComments = async () => {
+        const { data } = await fetchOlderComments({ variables: { before: olderCursor } });
+        const page = data?.comments;
+        if (!page) return;
+        setComments(current => [...page.comments, ...current]);
+        setOlderCursor(page.olderCursor);
+        setHasOlder(page.hasOlder);
+    };
     const { data: tagsData } = useQuery(GET_TAGS);
     const tags: Tag[] = tagsData?.tags || [];
     const [selectedTagIds, setSelectedTagIds] = useState<string[]>(issue?.tags?.map((t: Tag) => t.id) || []);
@@ -173,7 +235,7 @@ const IssueDetailModal: React.FC<IssueDetailModalProps> = ({ issue, isOpen, onCl
         }
         setCommentLoading(true);
         try {
-            await addComment({
+            const result = await addComment({
                 variables: {
                     input: {
                         issueId: parseInt(issue.id),
@@ -183,7 +245,7 @@ const IssueDetailModal: React.FC<IssueDetailModalProps> = ({ issue, isOpen, onCl
                 },
             });
             setCommentText('');
-            refetchComments();
+            if (result.data?.addComment) appendComment(result.data.addComment);
         } catch (e) {
             setCommentError('Failed to add comment.');
         } finally {
@@ -440,10 +502,18 @@ const IssueDetailModal: React.FC<IssueDetailModalProps> = ({ issue, isOpen, onCl
                 <div className="mt-8 w-full">
                     <h3 className="text-lg font-semibold mb-2 pl-6">Comments</h3>
                     <div className="bg-gray-50 rounded-xl p-4 max-h-64 overflow-y-auto space-y-4 border border-gray-200">
-                        {commentsData?.comments?.length === 0 && (
+                        {hasOlder && (
+                            <button
+                                className="w-full text-sm font-medium text-indigo-700 hover:underline"
+                                onClick={handleLoadOlderComments}
+                            >
+                                Load older comments
+                            </button>
+                        )}
+                        {commentsData && comments.length === 0 && (
                             <div className="text-gray-400">No comments yet.</div>
                         )}
-                        {commentsData?.comments?.map((comment: any) => (
+                        {comments.map((comment) => (
                             <div key={comment.id} className="flex items-start gap-3">
                                 <div className="flex-shrink-0 w-10 h-10 rounded-full bg-purple-200 flex items-center justify-center font-bold text-purple-700 text-lg shadow-sm">
                                     {getUserName(comment.userId)[0]?.toUpperCase()}
@@ -1,7 +1,8 @@
-import React, { useState, useEffect } from 'react';
-import { useQuery, useMutation } from '@apollo/client';
-import { GET_ISSUES, GET_USERS } from '../graphql/queries';
-import { UPDATE_ISSUE } from '../graphql/mutations';
+import React, { useState, useEffect, useMemo } from 'react';
+import { useQuery, useLazyQuery, useMutation } from '@apollo/client';
+import { GET_BOARD, GET_BOARD_COLUMN, GET_USERS } from '../graphql/queries';
+import { MOVE_ISSUE } from '../graphql/mutations';
+import { useWebSocket } from '../services/websocket';
 import IssueDetailModal from './IssueDetailModal';
 import {
     DndContext,
@@ -12,7 +13,7 @@ import {
     useSensors,
     DragOverlay,
 } from '@dnd-kit/core';
-import type { DragEndEvent, DragStartEvent, DragOverEvent } from '@dnd-kit/core';
+import type { DragEndEvent, DragStartEvent } from '@dnd-kit/core';
 import {
     arrayMove,
     SortableContext,
@@ -36,6 +37,7 @@ interface Issue {
     createdAt: string;
     updatedAt: string;
     enhancedDescription?: string;
+    commentCount?: number;
     tags?: { id: string; name: string; color?: string }[];
 }
 
@@ -52,8 +54,19 @@ interface Column {
     id: string;
     title: string;
     items: Issue[];
+    totalCount: number;
+    endCursor?: string | null;
+    hasMore: boolean;
 }
 
+const COLUMN_TITLES: Record<string, string> = {
+    OPEN: '📋 Open',
+    IN_PROGRESS: '🔄 In Progress',
+    CLOSED: '✅ Closed',
+};
+const BOARD_COLUMNS = Object.keys(COLUMN_TITLES);
+const CARDS_PER_COLUMN = 20;
+
 interface KanbanBoardProps {
     filteredIssues?: Issue[];
     onRefetch?: () => void;
@@ -149,7 +162,10 @@ const SortableIssue: React.FC<{ issue: Issue; onIssueClick: (issue: Issue) => vo
                     👤 {getUserName(issue.assigneeId)}
                 </div>
             )}
-            <div className="flex justify-end mt-3">
+            <div className="flex justify-between items-center mt-3">
+                <span className="text-xs text-gray-500">
+                    {issue.commentCount ? `💬 ${issue.commentCount}` : ''}
+                </span>
                 <button
                     className="px-3 py-1 text-xs font-medium rounded bg-indigo-50 text-indigo-700 hover:bg-indigo-100 border border-indigo-200 transition-colors"
                     onPointerDown={e => e.stopPropagation()}
@@ -167,7 +183,13 @@ const SortableIssue: React.FC<{ issue: Issue; onIssueClick: (issue: Issue) => vo
 
 const KanbanBoard: React.FC<KanbanBoardProps> = ({ filteredIssues, onRefetch }) => {
     const { data: usersData, loading: usersLoading, error: usersError } = useQuery(GET_USERS);
-    const [updateIssue] = useMutation(UPDATE_ISSUE);
+    // Cards come from the server in board order, a page per column
+    const { data: boardData, refetch: refetchBoard } = useQuery(GET_BOARD, {
+        variables: { columns: BOARD_COLUMNS, perColumn: CARDS_PER_COLUMN },
+    });
+    const [loadColumn] = useLazyQuery(GET_BOARD_COLUMN, { fetchPolicy: 'network-only' });
+    const [moveIssue] = useMutation(MOVE_ISSUE);
+    const { subscribe } = useWebSocket();
     const [columns, setColumns] = useState<Column[]>([]);
     const [selectedIssue, setSelectedIssue] = useState<Issue | null>(null);
     const [isDetailModalOpen, setIsDetailModalOpen] = useState(false);
@@ -182,36 +204,45 @@ const KanbanBoard: React.FC<KanbanBoardProps> = ({ filteredIssues, onRefetch })
         })
     );
 
-    // Organize issues into columns based on status
     useEffect(() => {
-        if (filteredIssues && filteredIssues.length > 0) {
-            const newColumns: Column[] = [
-                {
-                    id: 'OPEN',
-                    title: '📋 Open',
-                    items: filteredIssues.filter((issue: Issue) => issue.status === 'OPEN')
-                },
-                {
-                    id: 'IN_PROGRESS',
-                    title: '🔄 In Progress',
-                    items: filteredIssues.filter((issue: Issue) => issue.status === 'IN_PROGRESS')
-                },
-                {
-                    id: 'CLOSED',
-                    title: '✅ Closed',
-                    items: filteredIssues.filter((issue: Issue) => issue.status === 'CLOSED')
-                }
-            ];
-            setColumns(newColumns);
-        } else {
-            // Show empty columns if no filtered issues
-            setColumns([
-                { id: 'OPEN', title: '📋 Open', items: [] },
-                { id: 'IN_PROGRESS', title: '🔄 In Progress', items: [] },
-                { id: 'CLOSED', title: '✅ Closed', items: [] }
-            ]);
-        }
-    }, [filteredIssues]);
+        if (!boardData?.board) return;
+        setColumns(boardData.board.map((column: any) => ({
+            id: column.status,
+            title: COLUMN_TITLES[column.status],
+            items: column.cards,
+            totalCount: column.totalCount,
+            endCursor: column.endCursor,
+            hasMore: column.hasMore,
+        })));
+    }, [boardData]);
+
+    // Other users' changes and bulk imports reorder the board; reload the
+    // first pages. The same goes for resync_required, sent when missed
+    // events can't be replayed
+    useEffect(() => {
+        const unsubscribers = ['issue_created', 'issue_updated', 'issue_deleted', 'issues_imported', 'resync_required']
+            .map((event) => subscribe(event, () => refetchBoard()));
+        return () => unsubscribers.forEach((unsubscribe) => unsubscribe());
+    }, [subscribe, refetchBoard]);
+
+    // The page's filters only hide cards; board order stays the server's
+    const visibleIds = useMemo(
+        () => (filteredIssues ? new Set(filteredIssues.map((issue) => String(issue.id))) : null),
+        [filteredIssues]
+    );
+    const visibleItems = (column: Column) =>
+        visibleIds ? column.items.filter((item) => visibleIds.has(String(item.id))) : column.items;
+
+    const handleLoadMore = async (column: Column) => {
+        const { data } = await loadColumn({
+            variables: { status: column.id, first: CARDS_PER_COLUMN, after: column.endCursor },
+        });
+        const page = data?.boardColumn;
+        if (!page) return;
+        setColumns((current) => current.map((col) => col.id === column.id
+            ? { ...col, items: [...col.items, ...page.cards], endCursor: page.endCursor, hasMore: page.hasMore }
+            : col));
+    };
 
     const handleIssueClick = (issue: Issue) => {
         setSelectedIssue(issue);
@@ -224,117 +255,56 @@ const KanbanBoard: React.FC<KanbanBoardProps> = ({ filteredIssues, onRefetch })
     };
 
     const handleDragStart = (event: DragStartEvent) => {
-        console.log('=== DRAG START ===');
-        console.log('Dragging item:', event.active.id);
         setActiveId(event.active.id.toString());
     };
 
-    const handleDragOver = (event: DragOverEvent) => {
-        console.log('=== DRAG OVER ===');
-        console.log('Over:', event.over?.id);
-    };
-
     const handleDragEnd = async (event: DragEndEvent) => {
-        console.log('=== DRAG END DEBUG ===');
-        console.log('Full event:', event);
-        console.log('Active:', event.active);
-        console.log('Over:', event.over);
-        console.log('Current columns:', columns);
-
         const { active, over } = event;
-
-        // Reset active ID
         setActiveId(null);
-
-        if (!over) {
-            console.log('❌ Dropped outside valid area');
-            return;
-        }
-
-        // Check if dropped on the same item
-        if (active.id === over.id) {
-            console.log('❌ Dropped in same position');
-            return;
+        if (!over || active.id === over.id) return;
+
+        const source = columns.find((col) => col.items.some((item) => item.id === active.id));
+        // Dropped on a card: take its place; dropped on a column: go to the end
+        const dest = columns.find((col) => col.id === over.id)
+            || columns.find((col) => col.items.some((item) => item.id === over.id));
+        if (!source || !dest) return;
+        const sourceItem = source.items.find((item) => item.id === active.id)!;
+        const movedItem = { ...sourceItem, status: dest.id as Issue['status'] };
+
+        let destItems: Issue[];
+        if (source.id === dest.id) {
+            const oldIndex = dest.items.findIndex((item) => item.id === active.id);
+            const overIndex = dest.items.findIndex((item) => item.id === over.id);
+            destItems = arrayMove(dest.items, oldIndex, overIndex === -1 ? dest.items.length - 1 : overIndex);
+        } else {
+            destItems = [...dest.items];
+            const overIndex = destItems.findIndex((item) => item.id === over.id);
+            destItems.splice(overIndex === -1 ? destItems.length : overIndex, 0, movedItem);
         }
-
-        // Find the source and destination columns
-        let sourceColumn: Column | undefined;
-        let destColumn: Column | undefined;
-        let sourceColIndex = -1;
-        let destColIndex = -1;
-
-        for (let i = 0; i < columns.length; i++) {
-            const col = columns[i];
-            if (col.items.find(item => item.id === active.id)) {
-                sourceColumn = col;
-                sourceColIndex = i;
-                console.log(`✅ Found source column: ${col.id} at index ${i}`);
+        const index = destItems.findIndex((item) => item.id === active.id);
+        destItems[index] = movedItem;
+        const afterId = index > 0 ? Number(destItems[index - 1].id) : null;
+        const beforeId = index < destItems.length - 1 ? Number(destItems[index + 1].id) : null;
+
+        // Optimistic: only the moved card changes position
+        setColumns((current) => current.map((col) => {
+            if (col.id === dest.id) {
+                return { ...col, items: destItems, totalCount: col.totalCount + (source.id === dest.id ? 0 : 1) };
             }
-            // Check if dropped on a column container (column.id === over.id)
-            if (col.id === over.id) {
-                destColumn = col;
-                destColIndex = i;
-                console.log(`✅ Found dest column: ${col.id} at index ${i}`);
+            if (col.id === source.id) {
+                return { ...col, items: col.items.filter((item) => item.id !== active.id), totalCount: col.totalCount - 1 };
             }
-        }
-
-        if (!sourceColumn || !destColumn) {
-            console.log('❌ Column not found. Source:', sourceColumn?.id, 'Dest:', destColumn?.id);
-            return;
-        }
-
-        // Don't allow dropping in the same column
-        if (sourceColumn.id === destColumn.id) {
-            console.log('❌ Cannot drop in same column');
-            return;
-        }
-
-        const sourceItem = sourceColumn.items.find(item => item.id === active.id);
-        if (!sourceItem) {
-            console.log('❌ Item not found');
-            return;
-        }
-
-        console.log(`🚀 Moving item ${sourceItem.id} from ${sourceColumn.id} to ${destColumn.id}`);
+            return col;
+        }));
 
-        // Optimistically update the local state
-        const updatedColumns = [...columns];
-        const sourceCol = updatedColumns[sourceColIndex];
-        const destCol = updatedColumns[destColIndex];
-
-        // Remove from source column
-        sourceCol.items = sourceCol.items.filter(item => item.id !== active.id);
-
-        // Add to destination column with updated status
-        const updatedItem = { ...sourceItem, status: destColumn.id as 'OPEN' | 'IN_PROGRESS' | 'CLOSED' };
-        destCol.items = [...destCol.items, updatedItem];
-
-        console.log('📝 Updating local state...');
-        setColumns(updatedColumns);
-
-        // Update the issue status in the backend
         try {
-            console.log('🔄 Calling updateIssue mutation...');
-            const result = await updateIssue({
-                variables: {
-                    input: {
-                        id: parseInt(sourceItem.id),
-                        status: destColumn.id as 'OPEN' | 'IN_PROGRESS' | 'CLOSED'
-                    }
-                }
+            await moveIssue({
+                variables: { id: Number(sourceItem.id), status: dest.id, beforeId, afterId },
             });
-
-            console.log('✅ Issue status updated successfully:', result);
-
-            // If the mutation failed, revert the optimistic update
-            if (!result.data?.updateIssue?.success) {
-                console.error('❌ Failed to update issue status:', result.data?.updateIssue?.message);
-                // Revert the optimistic update by refetching
-                onRefetch?.();
-            }
         } catch (error) {
-            console.error('❌ Failed to update issue status:', error);
+            console.error('❌ Failed to move issue:', error);
             // Revert the optimistic update by refetching
+            refetchBoard();
             onRefetch?.();
         }
     };
@@ -367,7 +337,6 @@ const KanbanBoard: React.FC<KanbanBoardProps> = ({ filteredIssues, onRefetch })
                 sensors={sensors}
                 collisionDetection={closestCenter}
                 onDragStart={handleDragStart}
-                onDragOver={handleDragOver}
                 onDragEnd={handleDragEnd}
             >
                 <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
@@ -387,11 +356,11 @@ const KanbanBoard: React.FC<KanbanBoardProps> = ({ filteredIssues, onRefetch })
                                 className="bg-gray-50 rounded-2xl p-5 min-h-[500px] transition-all duration-200 hover:bg-gray-100"
                             >
                                 <div className="p-4 bg-white rounded-xl mb-5 font-bold text-center shadow-sm relative border-l-4 border-green-500">
-                                    {column.title} ({column.items.length})
+                                    {column.title} ({column.totalCount})
                                 </div>
 
-                                <SortableContext items={column.items.map(item => item.id)} strategy={verticalListSortingStrategy}>
-                                    {column.items.map((item) => (
+                                <SortableContext items={visibleItems(column).map(item => item.id)} strategy={verticalListSortingStrategy}>
+                                    {visibleItems(column).map((item) => (
                                         <SortableIssue
                                             key={item.id}
                                             issue={item}
@@ -399,6 +368,14 @@ const KanbanBoard: React.FC<KanbanBoardProps> = ({ filteredIssues, onRefetch })
                                             users={users}
                                         />
                                     ))}
+                                    {column.hasMore && (
+                                        <button
+                                            className="w-full py-2 text-sm font-medium text-indigo-700 hover:bg-indigo-50 rounded-lg"
+                                            onClick={() => handleLoadMore(column)}
+                                        >
+                                            Load more
+                                        </button>
+                                    )}
                                     {column.items.length === 0 && (
                                         <div className="text-center py-8 text-gray-400 border-2 border-dashed border-gray-300 rounded-lg m-2">
                                             <p className="font-medium">Drop issues here</p>
@@ -115,6 +115,17 @@ export const UPDATE_ISSUE = gql`
   }
 `;
 
+// Places a card between two neighbours; the server writes only this issue
+export const MOVE_ISSUE = gql`
+  mutation MoveIssue($id: Int!, $status: IssueStatus!, $beforeId: Int, $afterId: Int) {
+    moveIssue(id: $id, status: $status, beforeId: $beforeId, afterId: $afterId) {
+      id
+      status
+      updatedAt
+    }
+  }
+`;
+
 export const DELETE_ISSUE = gql`
   mutation DeleteIssue($id: Int!) {
     deleteIssue(id: $id) {
@@ -124,6 +135,50 @@ export const DELETE_ISSUE = gql`
   }
 `;
 
+export const BULK_UPDATE_ISSUES = gql`
+  mutation BulkUpdateIssues($ids: [Int!]!, $patch: BulkIssuePatchInput!) {
+    bulkUpdateIssues(ids: $ids, patch: $patch) {
+      success
+      message
+      issues {
+        id
+        status
+        priority
+        assigneeId
+        updatedAt
+      }
+    }
+  }
+`;
+
+export const BULK_SET_TAGS = gql`
+  mutation BulkSetTags($ids: [Int!]!, $tagIds: [Int!]!) {
+    bulkSetTags(ids: $ids, tagIds: $tagIds) {
+      success
+      message
+      issues {
+        id
+        updatedAt
+        tags {
+          id
+          name
+          color
+        }
+      }
+    }
+  }
+`;
+
+export const BULK_DELETE_ISSUES = gql`
+  mutation BulkDeleteIssues($ids: [Int!]!) {
+    bulkDeleteIssues(ids: $ids) {
+      success
+      message
+      deletedIds
+    }
+  }
+`;
+
 export const ENHANCE_DESCRIPTION = gql`
   mutation EnhanceDescription($description: String!) {
     enhanceDescription(description: $description) {
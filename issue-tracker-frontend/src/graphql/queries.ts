@@ -1,5 +1,24 @@
 import { gql } from '@apollo/client';
 
+// Per-user issue counts are the slow part of the users list. Only when the
+// API serves @defer (GRAPHQL_INCREMENTAL_DELIVERY) are they sent after the
+// rest of the list, since a deferred response skips the ETag and the cache.
+const USER_ISSUE_COUNTS = import.meta.env.VITE_GRAPHQL_DEFER === 'true'
+  ? gql`
+      fragment UserIssueCounts on UserType {
+        ... @defer {
+          assignedIssuesCount
+          reportedIssuesCount
+        }
+      }
+    `
+  : gql`
+      fragment UserIssueCounts on UserType {
+        assignedIssuesCount
+        reportedIssuesCount
+      }
+    `;
+
 export const GET_USERS = gql`
   query GetUsers {
     users {
@@ -13,10 +32,10 @@ export const GET_USERS = gql`
       lastLogin
       createdAt
       updatedAt
-      assignedIssuesCount
-      reportedIssuesCount
+      ...UserIssueCounts
     }
   }
+  ${USER_ISSUE_COUNTS}
 `;
 
 export const GET_USER_ACTIVITIES = gql`
@@ -84,6 +103,57 @@ export const GET_ISSUES = gql`
   }
 `;
 
+const BOARD_CARD_FIELDS = gql`
+  fragment BoardCardFields on IssueType {
+    id
+    title
+    description
+    enhancedDescription
+    status
+    priority
+    assigneeId
+    reporterId
+    createdAt
+    updatedAt
+    commentCount
+    tags {
+      id
+      name
+      color
+    }
+  }
+`;
+
+// Each column's first cards in board order, with totals and a cursor
+export const GET_BOARD = gql`
+  query GetBoard($columns: [IssueStatus!], $perColumn: Int!) {
+    board(columns: $columns, perColumn: $perColumn) {
+      status
+      totalCount
+      endCursor
+      hasMore
+      cards {
+        ...BoardCardFields
+      }
+    }
+  }
+  ${BOARD_CARD_FIELDS}
+`;
+
+export const GET_BOARD_COLUMN = gql`
+  query GetBoardColumn($status: IssueStatus!, $first: Int!, $after: String) {
+    boardColumn(status: $status, first: $first, after: $after) {
+      status
+      endCursor
+      hasMore
+      cards {
+        ...BoardCardFields
+      }
+    }
+  }
+  ${BOARD_CARD_FIELDS}
+`;
+
 export const GET_TAGS = gql`
   query GetTags {
     tags {
@@ -77,13 +77,26 @@ const IssuesPage: React.FC = () => {
             refetchIssues();
         });
 
+        // A bulk import finished: one event for the whole batch
+        const unsubscribeImported = subscribe('issues_imported', () => {
+            refetchIssues();
+        });
+
+        // Missed events couldn't be replayed; reload everything shown
+        const unsubscribeResync = subscribe('resync_required', () => {
+            refetchIssues();
+            refetchUsers();
+        });
+
         // Cleanup subscriptions on unmount
         return () => {
             unsubscribeCreated();
             unsubscribeUpdated();
             unsubscribeDeleted();
+            unsubscribeImported();
+            unsubscribeResync();
         };
-    }, [subscribe, refetchIssues]);
+    }, [subscribe, refetchIssues, refetchUsers]);
 
     const handleCreateTestData = async () => {
         await createTestIssues(client);
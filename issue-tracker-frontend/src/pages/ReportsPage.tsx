@@ -2,7 +2,8 @@ import React from 'react';
 import { useQuery } from '@apollo/client';
 import { gql } from '@apollo/client';
 import { useSubscription } from '@apollo/client';
-import { useMemo } from 'react';
+import { useEffect, useMemo, useRef } from 'react';
+import { useWebSocket } from '../services/websocket';
 // If recharts is available, import it. Otherwise, fallback to a simple chart.
 // import { BarChart, Bar, XAxis, YAxis, Tooltip, ResponsiveContainer } from 'recharts';
 
@@ -36,47 +37,92 @@ const GET_REPORTS = gql`
         createdAt
       }
     }
-  }
-`;
-
-const ISSUE_CREATED_SUBSCRIPTION = gql`
-  subscription OnIssueCreated {
-    issueCreated {
-      id
-      title
-      status
-      updatedAt
+    flowReport {
+      leadTime {
+        count
+        p50Hours
+        p85Hours
+      }
+      cycleTime {
+        count
+        p50Hours
+        p85Hours
+      }
+      timeInStatus {
+        status
+        stats {
+          p50Hours
+        }
+      }
+      weeklyThroughput {
+        weekStart
+        completed
+      }
     }
   }
 `;
 
-const ISSUE_UPDATED_SUBSCRIPTION = gql`
-  subscription OnIssueUpdated {
-    issueUpdated {
-      id
-      title
-      status
-      updatedAt
+const formatHours = (hours?: number | null) => {
+    if (hours === null || hours === undefined) return '—';
+    return hours >= 48 ? `${(hours / 24).toFixed(1)}d` : `${hours.toFixed(1)}h`;
+};
+
+const STATS_CHANGED_SUBSCRIPTION = gql`
+  subscription OnStatsChanged {
+    statsChanged {
+      eventId
+      total
+      statuses {
+        status
+        delta
+      }
     }
   }
 `;
 
+// issueStats counter for each status the page shows
+const STATUS_COUNTERS: Record<string, string> = {
+    OPEN: 'openIssues',
+    IN_PROGRESS: 'inProgressIssues',
+    CLOSED: 'closedIssues',
+};
+
 const ReportsPage: React.FC = () => {
     const { data, loading, error, refetch } = useQuery(GET_REPORTS, {
         fetchPolicy: 'network-only',
     });
+    const { subscribe } = useWebSocket();
 
-    // Real-time: refetch on issue created/updated
-    useSubscription(ISSUE_CREATED_SUBSCRIPTION, {
-        onData: () => refetch(),
-    });
-    useSubscription(ISSUE_UPDATED_SUBSCRIPTION, {
-        onData: () => refetch(),
+    // Real-time: the server pushes counter deltas; apply them to the cached
+    // stats instead of refetching the whole report. Repeats are dropped by id.
+    const seenEvents = useRef<Set<string>>(new Set());
+    useSubscription(STATS_CHANGED_SUBSCRIPTION, {
+        onData: ({ client, data: { data: event } }) => {
+            const delta = event?.statsChanged;
+            if (!delta || seenEvents.current.has(delta.eventId)) return;
+            seenEvents.current.add(delta.eventId);
+            client.cache.updateQuery({ query: GET_REPORTS }, (cached) => {
+                if (!cached?.issueStats) return cached;
+                const issueStats = { ...cached.issueStats };
+                issueStats.totalIssues += delta.total;
+                for (const { status, delta: change } of delta.statuses) {
+                    const counter = STATUS_COUNTERS[status];
+                    if (counter) issueStats[counter] += change;
+                }
+                return { ...cached, issueStats };
+            });
+        },
     });
 
+    // Deltas may have been missed; start again from a fresh report
+    useEffect(() => subscribe('resync_required', () => refetch()), [subscribe, refetch]);
+
     // All hooks must be called before any return
     const issueStats = data?.issueStats || {};
     const userStats = data?.userStats || {};
+    const flowReport = data?.flowReport || {};
+    const throughput: { weekStart: string; completed: number }[] = flowReport.weeklyThroughput || [];
+    const maxThroughput = Math.max(1, ...throughput.map((week) => week.completed));
 
     const issueStatusData = useMemo(() => [
         { name: 'Open', value: issueStats.openIssues || 0 },
@@ -261,6 +307,52 @@ const ReportsPage: React.FC = () => {
                 </div>
             </div>
 
+            {/* Flow Metrics (last 90 days) */}
+            <div className="bg-white rounded-xl p-6 shadow-sm border border-gray-200">
+                <h3 className="text-lg font-semibold mb-4">Flow Metrics (last 90 days)</h3>
+                <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+                    {[
+                        { label: 'Lead Time', stats: flowReport.leadTime },
+                        { label: 'Cycle Time', stats: flowReport.cycleTime },
+                    ].map(({ label, stats }) => (
+                        <div key={label}>
+                            <p className="text-sm font-medium text-gray-600">{label}</p>
+                            <p className="text-2xl font-bold text-gray-900">{formatHours(stats?.p50Hours)}</p>
+                            <p className="text-xs text-gray-500">
+                                median · 85th pct {formatHours(stats?.p85Hours)} · {stats?.count || 0} issues
+                            </p>
+                        </div>
+                    ))}
+                    <div>
+                        <p className="text-sm font-medium text-gray-600">Median Time in Status</p>
+                        <ul className="mt-1 space-y-1">
+                            {(flowReport.timeInStatus || []).map((stay: { status: string; stats: { p50Hours: number | null } }) => (
+                                <li key={stay.status} className="flex justify-between text-sm text-gray-700">
+                                    <span>{stay.status.replace('_', ' ')}</span>
+                                    <span className="font-medium">{formatHours(stay.stats.p50Hours)}</span>
+                                </li>
+                            ))}
+                        </ul>
+                    </div>
+                </div>
+                <p className="text-sm font-medium text-gray-600 mt-6 mb-2">Weekly Throughput</p>
+                {throughput.length === 0 ? (
+                    <p className="text-gray-400 text-sm">No issues completed in this period.</p>
+                ) : (
+                    <div className="flex items-end space-x-2 h-24">
+                        {throughput.map((week) => (
+                            <div key={week.weekStart} className="flex flex-col items-center" title={`Week of ${new Date(week.weekStart).toLocaleDateString()}: ${week.completed}`}>
+                                <div
+                                    className="bg-indigo-600 w-6 rounded-t"
+                                    style={{ height: `${(week.completed / maxThroughput) * 80}px`, minHeight: '2px' }}
+                                ></div>
+                                <span className="text-xs text-gray-500 mt-1">{week.completed}</span>
+                            </div>
+                        ))}
+                    </div>
+                )}
+            </div>
+
             {/* Recent Activity Log */}
             <div className="bg-white rounded-xl p-6 shadow-sm border border-gray-200">
                 <h3 className="text-lg font-semibold mb-4">Recent Activity</h3>
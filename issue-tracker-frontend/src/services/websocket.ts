@@ -3,6 +3,8 @@ export interface WebSocketMessage {
     data?: any;
     message?: string;
     timestamp?: number;
+    seq?: number;
+    boot?: string;
 }
 
 export interface IssueUpdate {
@@ -30,6 +32,9 @@ class WebSocketService {
     private reconnectDelay = 1000;
     private listeners: Map<string, Set<(data: any) => void>> = new Map();
     private isConnecting = false;
+    private lastSeq: number | null = null;
+    // Sequence numbers are per server process; boot identifies which one
+    private boot: string | null = null;
 
     constructor() {
         this.connect();
@@ -38,7 +43,10 @@ class WebSocketService {
     private getWebSocketUrl(): string {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
         const host = import.meta.env.VITE_API_URL || 'localhost:8000';
-        return `${protocol}//${host}/ws`;
+        const resume = this.lastSeq !== null && this.boot !== null
+            ? `?last_seq=${this.lastSeq}&boot=${encodeURIComponent(this.boot)}`
+            : '';
+        return `${protocol}//${host}/ws${resume}`;
     }
 
     private connect(): void {
@@ -102,11 +110,29 @@ class WebSocketService {
     private handleMessage(message: WebSocketMessage): void {
         console.log('WebSocket message received:', message);
 
+        if (message.seq !== undefined) {
+            // Replayed events may overlap ones already seen before the drop
+            if (message.type !== 'connection_established' && message.type !== 'resync_required'
+                && this.lastSeq !== null && message.seq <= this.lastSeq) {
+                return;
+            }
+            if (this.lastSeq === null || message.type !== 'connection_established') {
+                this.lastSeq = message.seq;
+                if (message.boot !== undefined) {
+                    this.boot = message.boot;
+                }
+            }
+        }
+
         switch (message.type) {
             case 'connection_established':
                 console.log('WebSocket connection established');
                 break;
 
+            case 'resync_required':
+                this.notifyListeners('resync_required', message);
+                break;
+
             case 'issue_created':
                 this.notifyListeners('issue_created', message.data);
                 break;
@@ -119,6 +145,18 @@ class WebSocketService {
                 this.notifyListeners('issue_deleted', message.data);
                 break;
 
+            case 'issues_batch_updated':
+                this.notifyListeners('issues_batch_updated', message.data);
+                break;
+
+            case 'issues_batch_deleted':
+                this.notifyListeners('issues_batch_deleted', message.data);
+                break;
+
+            case 'issues_imported':
+                this.notifyListeners('issues_imported', message.data);
+                break;
+
             case 'pong':
                 // Handle ping/pong for connection health
                 break;